@@ -0,0 +1,15 @@
+__all__ = [
+    "BcgsIndex",
+    "names_20k",
+    "names_2500k",
+    "tile_names",
+    "tile_bounds",
+    "check_index",
+    "BcgsScale",
+    "BcgsConfig",
+    "BcgsNaming",
+]
+
+from .bcgs_index import BcgsIndex
+from .bcgs_names import names_20k, names_2500k, tile_names, tile_bounds, check_index
+from .const import BcgsScale, BcgsConfig, BcgsNaming
@@ -0,0 +1,281 @@
+# system imports
+import os
+from typing import Iterable, Optional, Sequence, Union
+
+import numpy as np
+import shapely
+from shapely import STRtree
+from shapely.geometry import shape
+from shapely.geometry.base import BaseGeometry
+
+# user imports
+try:
+    from client.eclipse_config import APP_DATA_DIR
+    from client.eclipse_request import EclipseRequest
+    from client.entity.entity import Entity
+except ImportError:
+    from eclipse_config import APP_DATA_DIR
+    from eclipse_request import EclipseRequest
+    from entity.entity import Entity
+from .const import BcgsScale, BcgsConfig
+
+
+class BcgsIndex:
+
+    """
+    In-memory spatial index of the tiles of a BCGS grid, for tile lookups without the server.
+
+    The tile geometries are loaded once into an STRtree (and prepared), and
+    queries are vectorized over batches of points, bounding boxes or geometries.
+    The grid is cached as WKB in the app data directory after the first fetch,
+    so lookups keep working offline.
+
+    >>> index = BcgsIndex.load(BcgsScale.S20K)
+    >>> index.query_points([1200000.0], [450000.0])                  # -> array(['092G094'])
+    >>> index.query_bounds([(h.x_min, h.y_min, h.x_max, h.y_max) for h in headers], epsg=26910)
+    """
+
+    def __init__(
+            self, names: Sequence[str], geometries: Sequence[BaseGeometry], scale: str = BcgsScale.S20K,
+            epsg: int = BcgsConfig.EPSG
+    ):
+
+        """
+        Initialize a BcgsIndex object.
+
+        :param names: Names of the tiles.
+        :param geometries: Geometries of the tiles (in 'epsg' coordinates).
+        :param scale: Scale of the grid (see BcgsScale).
+        :param epsg: EPSG code of the tile geometries.
+        :raises ValueError: If the scale is invalid, or names and geometries are not the same length.
+        """
+
+        if scale not in BcgsScale.LIST:
+            raise ValueError(f"Invalid BCGS scale: '{scale}' (valid: {', '.join(BcgsScale.LIST)})")
+
+        self._names = np.asarray(names, dtype=str)
+        self._geometries = np.asarray(geometries, dtype=object)
+        if len(self._names) != len(self._geometries):
+            raise ValueError("names and geometries must be the same length")
+
+        self._scale = scale
+        self._epsg = epsg
+        self._tree = STRtree(self._geometries)
+        shapely.prepare(self._geometries)
+
+    @classmethod
+    def load(cls, scale: str = BcgsScale.S20K, cache_dir: str = APP_DATA_DIR, refresh: bool = False) -> "BcgsIndex":
+
+        """
+        Load the index of a grid from the cache, or from the server (and cache it).
+
+        :param scale: Scale of the grid (see BcgsScale).
+        :param cache_dir: Directory of the cache file.
+        :param refresh: Fetch the grid from the server even if cached.
+        :raises ConnectionError: If the grid is not cached and can't be fetched.
+        """
+
+        path = os.path.join(cache_dir, BcgsConfig.CACHE_FILE.format(scale=scale))
+        if os.path.isfile(path) and not refresh:
+            return cls.read(path)
+
+        index = cls.from_server(scale)
+        index.save(path)
+
+        return index
+
+    @classmethod
+    def from_server(cls, scale: str = BcgsScale.S20K) -> "BcgsIndex":
+
+        """
+        Fetch the tiles of a grid from the server.
+
+        :param scale: Scale of the grid (see BcgsScale).
+        :raises ConnectionError: If the request failed.
+        """
+
+        entity = Entity()
+        entity.name = f"bcgs{scale}"
+        tile_col = f"tile_{scale}"
+
+        params = {"fields": f"{tile_col},geometry", "page_size": BcgsConfig.PAGE_SIZE}
+        res = EclipseRequest("GET", entity, params).send()
+        if not isinstance(res, list):
+            raise ConnectionError(f"Failed to fetch the BCGS {scale} grid: {res}")
+
+        tiles = [tile for tile in res if tile.get("geometry")]
+        return cls([tile[tile_col] for tile in tiles], [_geometry(tile["geometry"]) for tile in tiles], scale)
+
+    @classmethod
+    def from_shapefile(
+            cls, path: str, scale: str = BcgsScale.S20K, tile_col: str = BcgsConfig.TILE_COL,
+            epsg: int = BcgsConfig.EPSG
+    ) -> "BcgsIndex":
+
+        """
+        Read the tiles of a grid from a BCGS grid shapefile (requires fiona).
+
+        :param path: Path of the grid shapefile.
+        :param scale: Scale of the grid (see BcgsScale).
+        :param tile_col: Tile name attribute.
+        :param epsg: EPSG code of the shapefile coordinates.
+        """
+
+        import fiona
+
+        names, geometries = [], []
+        with fiona.open(path) as src:
+            for feature in src:
+                names.append(str(feature["properties"][tile_col]).strip())
+                geometries.append(shape(feature["geometry"]))
+
+        return cls(names, geometries, scale, epsg)
+
+    @classmethod
+    def read(cls, path: str) -> "BcgsIndex":
+
+        """
+        Read an index saved with save().
+
+        :param path: Path of the cache file.
+        """
+
+        with np.load(path, allow_pickle=False) as data:
+            names, wkb, offsets = data["names"], data["wkb"].tobytes(), data["offsets"]
+            scale, epsg = str(data["scale"]), int(data["epsg"])
+
+        blobs = [wkb[start:end] for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+        return cls(names, shapely.from_wkb(blobs), scale, epsg)
+
+    def save(self, path: str):
+
+        """
+        Save the index (tile names and WKB geometries) to a compressed .npz file.
+
+        :param path: Path of the cache file.
+        """
+
+        blobs = shapely.to_wkb(self._geometries)
+        offsets = np.zeros(len(blobs) + 1, dtype=np.int64)
+        np.cumsum([len(blob) for blob in blobs], out=offsets[1:])
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as fp:
+            np.savez_compressed(
+                fp, names=self._names, wkb=np.frombuffer(b"".join(blobs), dtype=np.uint8), offsets=offsets,
+                scale=self._scale, epsg=self._epsg
+            )
+        os.replace(tmp_path, path)
+
+    @property
+    def scale(self) -> str:
+        return self._scale
+
+    @property
+    def epsg(self) -> int:
+        return self._epsg
+
+    @property
+    def names(self) -> np.ndarray:
+        return self._names
+
+    @property
+    def geometries(self) -> np.ndarray:
+        return self._geometries
+
+    def geometry(self, name: str) -> Optional[BaseGeometry]:
+
+        """Get the geometry of a tile, or None if there is no such tile."""
+
+        match = np.flatnonzero(self._names == name)
+        return self._geometries[match[0]] if len(match) else None
+
+    def query_points(self, x: Iterable[float], y: Iterable[float], epsg: Optional[int] = None) -> np.ndarray:
+
+        """
+        Get the tile holding each point (points on a shared edge get one of the tiles).
+
+        :param x: X coordinates of the points.
+        :param y: Y coordinates of the points.
+        :param epsg: EPSG code of the coordinates (defaults to the index's).
+        :return: The tile name of each point ('' for points outside the grid).
+        """
+
+        x, y = self._transform(np.asarray(x, dtype=float), np.asarray(y, dtype=float), epsg)
+        points, tiles = self._tree.query(shapely.points(x, y), predicate="intersects")
+
+        names = np.full(len(x), "", dtype=self._names.dtype)
+        first = np.unique(points, return_index=True)[1]
+        names[points[first]] = self._names[tiles[first]]
+
+        return names
+
+    def query_bounds(self, bounds: Iterable[Sequence[float]], epsg: Optional[int] = None) -> list[list[str]]:
+
+        """
+        Get the tiles intersecting each bounding box.
+
+        :param bounds: Bounding boxes as (x_min, y_min, x_max, y_max).
+        :param epsg: EPSG code of the coordinates (defaults to the index's).
+        :return: The tile names intersecting each box.
+        """
+
+        bounds = np.asarray(bounds, dtype=float).reshape(-1, 4)
+        return self.query_geometries(shapely.box(*bounds.T), epsg)
+
+    def query_geometries(
+            self, geometries: Union[BaseGeometry, Iterable[BaseGeometry]], epsg: Optional[int] = None
+    ) -> list[list[str]]:
+
+        """
+        Get the tiles intersecting each geometry (e.g. a LidarStrip convex hull).
+
+        :param geometries: Geometries (shapely geometries or GeoJSON-like dicts).
+        :param epsg: EPSG code of the coordinates (defaults to the index's).
+        :return: The tile names intersecting each geometry.
+        """
+
+        if isinstance(geometries, (BaseGeometry, dict)):
+            geometries = [geometries]
+
+        geometries = np.asarray([_geometry(geometry) for geometry in geometries], dtype=object)
+        if epsg is not None and epsg != self._epsg:
+            geometries = shapely.transform(geometries, lambda xy: np.column_stack(self._transform(*xy.T, epsg)))
+
+        if not len(geometries):
+            return []
+
+        inputs, tiles = self._tree.query(geometries, predicate="intersects")
+        order = np.argsort(inputs, kind="stable")
+        inputs, tiles = inputs[order], tiles[order]
+        splits = np.searchsorted(inputs, np.arange(1, len(geometries)))
+
+        return [names.tolist() for names in np.split(self._names[tiles], splits)]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _transform(self, x: np.ndarray, y: np.ndarray, epsg: Optional[int]) -> tuple:
+
+        """Transform coordinates to the CRS of the index."""
+
+        if epsg is None or epsg == self._epsg or not len(x):
+            return x, y
+
+        from pyproj import Transformer
+
+        transformer = Transformer.from_crs(epsg, self._epsg, always_xy=True)
+        return transformer.transform(x, y)
+
+
+def _geometry(geometry: Union[BaseGeometry, dict, str]) -> BaseGeometry:
+
+    """Get a shapely geometry from a geometry, GeoJSON-like dict or (E)WKT string."""
+
+    if isinstance(geometry, BaseGeometry):
+        return geometry
+    if isinstance(geometry, dict):
+        return shape(geometry)
+
+    return shapely.from_wkt(geometry.split(";", 1)[-1])
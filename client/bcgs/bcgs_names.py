@@ -0,0 +1,262 @@
+"""
+Arithmetic BCGS tile naming: coordinates to tile names and tile names to bounds,
+vectorized over arrays and without any spatial query.
+
+The BCGS grid is a graticule nested in the NTS:
+
+- NTS block (1:1M): 8 deg of longitude by 4 deg of latitude, numbered
+  floor((lon_west - 48) / 8) * 10 + floor((lat - 40) / 4), e.g. 092.
+- NTS 1:250k map: the block split in 4 x 4 maps of 2 deg by 1 deg, lettered A to P
+  boustrophedon from the south-east corner (A-D westward, E-H eastward, ...).
+- BCGS 1:20k sheet: the 1:250k map split in 10 x 10 sheets of 12' by 6', numbered
+  001 to 100 row by row from the north-west corner, e.g. 092G025.
+- BCGS 1:10k, 1:5k and 1:2,500 sheets: each sheet split in four quadrants,
+  numbered 1 (NW), 2 (NE), 3 (SW) and 4 (SE), e.g. 092G025.1.1.1.
+
+Coordinates are binned on integer units of the 1:2,500 sheet (1.5' by 0.75'), so a
+point on a sheet edge falls in the sheet to its west (meridian) or north (parallel)
+consistently at every level. Use check_index() to compare the arithmetic names
+with a loaded grid.
+
+>>> names_20k([1200000.0, 1210000.0], [450000.0, 452000.0], epsg=3005)   # -> array(['092G...', ...])
+>>> tile_bounds(["092G025", "092G025.1.1.1"])                           # -> (n, 4) lon/lat bounds
+"""
+
+# system imports
+from typing import Iterable, Optional
+
+import numpy as np
+
+# user imports
+from .const import BcgsConfig, BcgsNaming, BcgsScale
+
+# Grid units per degree: 1:2,500 sheets are 1.5' of longitude by 0.75' of latitude
+_LON_UNITS = 40
+_LAT_UNITS = 80
+
+# Size of the levels in grid units (longitude, latitude)
+_BLOCK = (8 * _LON_UNITS, 4 * _LAT_UNITS)
+_MAP_250K = (2 * _LON_UNITS, 1 * _LAT_UNITS)
+_SHEET_20K = (_MAP_250K[0] // 10, _MAP_250K[1] // 10)
+
+# Length of a 20k name (block, letter, sheet number)
+_NAME_20K_LEN = 7
+
+# Extent of the NTS blocks numbered by the block formula (west longitude, latitude)
+_NTS_LON_WEST = (48.0, 144.0)
+_NTS_LAT = (40.0, 68.0)
+
+
+def names_20k(x: Iterable[float], y: Iterable[float], epsg: Optional[int] = BcgsConfig.EPSG) -> np.ndarray:
+
+    """
+    Get the BCGS 1:20k tile name of each point.
+
+    :param x: X coordinates (or longitudes) of the points.
+    :param y: Y coordinates (or latitudes) of the points.
+    :param epsg: EPSG code of the coordinates (None for NAD83 longitudes and latitudes).
+    :return: The tile names ('' for points outside the NTS blocks).
+    """
+
+    return tile_names(x, y, epsg, levels=0)
+
+
+def names_2500k(x: Iterable[float], y: Iterable[float], epsg: Optional[int] = BcgsConfig.EPSG) -> np.ndarray:
+
+    """
+    Get the BCGS 1:2,500 tile name of each point.
+
+    :param x: X coordinates (or longitudes) of the points.
+    :param y: Y coordinates (or latitudes) of the points.
+    :param epsg: EPSG code of the coordinates (None for NAD83 longitudes and latitudes).
+    :return: The tile names ('' for points outside the NTS blocks).
+    """
+
+    return tile_names(x, y, epsg, levels=BcgsNaming.QUADRANT_LEVELS)
+
+
+def tile_names(
+        x: Iterable[float], y: Iterable[float], epsg: Optional[int] = BcgsConfig.EPSG,
+        levels: int = BcgsNaming.QUADRANT_LEVELS
+) -> np.ndarray:
+
+    """
+    Get the BCGS tile name of each point, down to a quadrant level.
+
+    :param x: X coordinates (or longitudes) of the points.
+    :param y: Y coordinates (or latitudes) of the points.
+    :param epsg: EPSG code of the coordinates (None for NAD83 longitudes and latitudes).
+    :param levels: Number of quadrant levels (0: 1:20k, 1: 1:10k, 2: 1:5k, 3: 1:2,500).
+    :return: The tile names ('' for points outside the NTS blocks).
+    :raises ValueError: If 'levels' is out of range.
+    """
+
+    if not 0 <= levels <= BcgsNaming.QUADRANT_LEVELS:
+        raise ValueError(f"levels must be in [0, {BcgsNaming.QUADRANT_LEVELS}]")
+
+    lon, lat = _to_geographic(np.asarray(x, dtype=float), np.asarray(y, dtype=float), epsg)
+    if not len(lon):
+        return np.array([], dtype=str)
+
+    lon_west = -lon
+
+    valid = (
+        (lon_west >= _NTS_LON_WEST[0]) & (lon_west < _NTS_LON_WEST[1]) & (lat >= _NTS_LAT[0]) & (lat < _NTS_LAT[1])
+    )
+    lon_west, lat = np.where(valid, lon_west, _NTS_LON_WEST[0]), np.where(valid, lat, _NTS_LAT[0])
+
+    # grid units, counted westward from 48W and northward from 40N
+    u = np.floor((lon_west - _NTS_LON_WEST[0]) * _LON_UNITS).astype(np.int64)
+    v = np.floor((lat - _NTS_LAT[0]) * _LAT_UNITS).astype(np.int64)
+
+    block = (u // _BLOCK[0]) * 10 + v // _BLOCK[1]
+
+    u, v = u % _BLOCK[0], v % _BLOCK[1]
+    row, col = v // _MAP_250K[1], u // _MAP_250K[0]
+    letter = row * 4 + np.where(row % 2 == 0, col, 3 - col)
+
+    # sheets are numbered from the north-west corner: units counted from the south-east one
+    u, v = u % _MAP_250K[0], v % _MAP_250K[1]
+    number = (9 - v // _SHEET_20K[1]) * 10 + (9 - u // _SHEET_20K[0]) + 1
+
+    # tiles are keyed by integers, and only the distinct keys are formatted
+    key = (block * 16 + letter) * 100 + number - 1
+    u, v = u % _SHEET_20K[0], v % _SHEET_20K[1]
+    half = _SHEET_20K[0] // 2
+    for _ in range(levels):
+        west, north = u >= half, v >= half
+        key = key * 4 + np.where(north, 0, 2) + np.where(west, 0, 1)
+        u, v, half = u % half, v % half, half // 2
+
+    keys, inverse = np.unique(np.where(valid, key, -1), return_inverse=True)
+    names = np.where(keys >= 0, _format(np.maximum(keys, 0), levels), "")
+
+    return names[inverse.reshape(-1)]
+
+
+def tile_bounds(names: Iterable[str]) -> np.ndarray:
+
+    """
+    Get the graticule bounds of BCGS tiles (1:20k to 1:2,500, levels can be mixed).
+
+    :param names: Tile names (e.g. '092G025', '092G025.1.1.1').
+    :return: (n, 4) array of (lon_min, lat_min, lon_max, lat_max) NAD83 bounds.
+    :raises ValueError: If a name is malformed.
+    """
+
+    names = np.asarray(list(names), dtype=str)
+    if not len(names):
+        return np.empty((0, 4))
+
+    width = _NAME_20K_LEN + 2 * BcgsNaming.QUADRANT_LEVELS
+    chars = np.char.upper(names).astype(f"S{width}").view(np.uint8).reshape(len(names), width).astype(np.int64)
+    _check_names(names, chars)
+
+    digits = chars - ord("0")
+    block = digits[:, 0] * 100 + digits[:, 1] * 10 + digits[:, 2]
+    letter = chars[:, 3] - ord("A")
+    number = digits[:, 4] * 100 + digits[:, 5] * 10 + digits[:, 6] - 1
+
+    # south-east corner in grid units (westward from 48W, northward from 40N)
+    u = (block // 10) * _BLOCK[0]
+    v = (block % 10) * _BLOCK[1]
+
+    row, col = letter // 4, letter % 4
+    u = u + np.where(row % 2 == 0, col, 3 - col) * _MAP_250K[0]
+    v = v + row * _MAP_250K[1]
+
+    u = u + (9 - number % 10) * _SHEET_20K[0]
+    v = v + (9 - number // 10) * _SHEET_20K[1]
+
+    size = np.full(len(names), _SHEET_20K[0])
+    for level in range(BcgsNaming.QUADRANT_LEVELS):
+        digit = chars[:, _NAME_20K_LEN + 2 * level + 1]
+        quadrant = np.where(digit > 0, digit - ord("1"), -1)
+        split = quadrant >= 0
+        size = np.where(split, size // 2, size)
+        u = u + np.where(split & (quadrant % 2 == 0), size, 0)  # west quadrants (1, 3)
+        v = v + np.where(split & (quadrant < 2), size, 0)  # north quadrants (1, 2)
+
+    lon_max = -(_NTS_LON_WEST[0] + u / _LON_UNITS)
+    lat_min = _NTS_LAT[0] + v / _LAT_UNITS
+
+    return np.column_stack((lon_max - size / _LON_UNITS, lat_min, lon_max, lat_min + size / _LAT_UNITS))
+
+
+def check_index(index, sample: Optional[int] = None) -> list[tuple[str, str]]:
+
+    """
+    Check the arithmetic names against a loaded grid: the name computed at an interior
+    point of each tile must be the tile's name.
+
+    :param index: A BcgsIndex of the 20k or 2500k grid.
+    :param sample: Number of tiles checked (all if None).
+    :return: The (grid name, computed name) pairs that differ.
+    """
+
+    import shapely
+
+    names, geometries = index.names, index.geometries
+    if sample is not None and sample < len(names):
+        picks = np.random.default_rng(0).choice(len(names), sample, replace=False)
+        names, geometries = names[picks], geometries[picks]
+
+    points = shapely.point_on_surface(geometries)
+    levels = 0 if index.scale == BcgsScale.S20K else BcgsNaming.QUADRANT_LEVELS
+    computed = tile_names(shapely.get_x(points), shapely.get_y(points), index.epsg, levels)
+
+    wrong = np.flatnonzero(np.char.upper(names) != computed)
+    return [(str(names[i]), str(computed[i])) for i in wrong]
+
+
+def _format(keys: np.ndarray, levels: int) -> np.ndarray:
+
+    """Format integer tile keys (see tile_names()) as tile names."""
+
+    quadrants = []
+    for _ in range(levels):
+        keys, quadrant = np.divmod(keys, 4)
+        quadrants.insert(0, quadrant + 1)
+
+    keys, number = np.divmod(keys, 100)
+    block, letter = np.divmod(keys, 16)
+
+    letters = np.array(list(BcgsNaming.LETTERS))
+    names = np.char.add(np.char.zfill(block.astype(str), 3), letters[letter])
+    names = np.char.add(names, np.char.zfill((number + 1).astype(str), 3))
+    for quadrant in quadrants:
+        names = np.char.add(np.char.add(names, BcgsNaming.QUADRANT_SEP), quadrant.astype(str))
+
+    return names
+
+
+def _check_names(names: np.ndarray, chars: np.ndarray):
+
+    """Raise a ValueError listing the malformed names."""
+
+    digit = (chars >= ord("0")) & (chars <= ord("9"))
+    valid = np.all(digit[:, :3], axis=1) & np.all(digit[:, 4:_NAME_20K_LEN], axis=1)
+    valid &= (chars[:, 3] >= ord("A")) & (chars[:, 3] <= ord("P"))
+
+    lengths = np.char.str_len(names)
+    valid &= (lengths >= _NAME_20K_LEN) & (lengths <= chars.shape[1]) & ((lengths - _NAME_20K_LEN) % 2 == 0)
+    for level in range(BcgsNaming.QUADRANT_LEVELS):
+        sep, digit = chars[:, _NAME_20K_LEN + 2 * level], chars[:, _NAME_20K_LEN + 2 * level + 1]
+        present = lengths > _NAME_20K_LEN + 2 * level
+        valid &= ~present | ((sep == ord(BcgsNaming.QUADRANT_SEP)) & (digit >= ord("1")) & (digit <= ord("4")))
+
+    if not valid.all():
+        raise ValueError(f"Invalid BCGS tile names: {names[~valid][:10].tolist()}")
+
+
+def _to_geographic(x: np.ndarray, y: np.ndarray, epsg: Optional[int]) -> tuple:
+
+    """Transform coordinates to NAD83 longitudes and latitudes."""
+
+    if epsg is None or epsg == BcgsNaming.EPSG or not len(x):
+        return x, y
+
+    from pyproj import Transformer
+
+    transformer = Transformer.from_crs(epsg, BcgsNaming.EPSG, always_xy=True)
+    return transformer.transform(x, y)
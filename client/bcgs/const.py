@@ -0,0 +1,38 @@
+class BcgsScale:
+
+    """Enum class containing the BCGS grid scales (the suffix of their table, e.g. 'bcgs20k')."""
+
+    S20K = "20k"
+    S2500K = "2500k"
+    LIST = [S20K, S2500K]
+
+
+class BcgsConfig:
+
+    """
+    Enum class containing default parameters for BcgsIndex.
+
+    The tile geometries of a grid are cached as WKB in 'CACHE_FILE' (under the
+    app data directory), so the index can be loaded without the server.
+    """
+
+    EPSG = 3005                       # EPSG code of the BCGS grid geometries
+    CACHE_FILE = "bcgs_{scale}.npz"   # Tile names and WKB geometries of a grid
+    PAGE_SIZE = 10000                 # Tiles fetched per page from the server
+    TILE_COL = "MAP_TILE"             # Tile name attribute of the BCGS grid shapefiles
+
+
+class BcgsNaming:
+
+    """
+    Enum class containing the BCGS tile naming scheme (see bcgs_names).
+
+    A 20k name is the NTS 1:250k map (block number and letter) followed by the
+    sheet number, e.g. '092G025'. The 10k, 5k and 2500 sheets each split their
+    parent in four quadrants, appended as digits, e.g. '092G025.1.1.1'.
+    """
+
+    EPSG = 4269                  # Geographic CRS of the grid graticule (NAD83)
+    LETTERS = "ABCDEFGHIJKLMNOP"  # 1:250k letters, boustrophedon from the south-east corner of the block
+    QUADRANT_SEP = "."           # Separator of the quadrant digits
+    QUADRANT_LEVELS = 3          # Quadrant digits of a 2500k name (10k, 5k, 2500)
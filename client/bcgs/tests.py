@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+try:
+    from client.bcgs.bcgs_names import names_20k, tile_bounds, tile_names
+except ImportError:
+    from bcgs.bcgs_names import names_20k, tile_bounds, tile_names
+
+
+class BcgsNamesTest(unittest.TestCase):
+
+    # Known 20k sheets: the corner sheets of 092G (Vancouver), 082E (Penticton) and 093A (Quesnel Lake)
+    TILES = {
+        "092G001": (-124.0, 49.9, -123.8, 50.0),
+        "092G100": (-122.2, 49.0, -122.0, 49.1),
+        "082E001": (-120.0, 49.9, -119.8, 50.0),
+        "093A001": (-122.0, 52.9, -121.8, 53.0),
+    }
+
+    def test_names_20k(self):
+        names = list(self.TILES)
+        bounds = np.array(list(self.TILES.values()))
+        lon, lat = bounds[:, [0, 2]].mean(axis=1), bounds[:, [1, 3]].mean(axis=1)
+
+        np.testing.assert_array_equal(names_20k(lon, lat, epsg=None), names)
+
+    def test_tile_bounds(self):
+        np.testing.assert_allclose(tile_bounds(list(self.TILES)), list(self.TILES.values()))
+        np.testing.assert_allclose(tile_bounds(["092G025.1.1.1"]), [(-123.2, 49.7875, -123.175, 49.8)])
+
+    def test_round_trip(self):
+        rng = np.random.default_rng(0)
+        lon, lat = rng.uniform(-139.0, -114.0, 1000), rng.uniform(48.3, 60.0, 1000)
+
+        for levels in range(4):
+            names = tile_names(lon, lat, epsg=None, levels=levels)
+            bounds = tile_bounds(names)
+            self.assertTrue(np.all((bounds[:, 0] <= lon) & (lon <= bounds[:, 2])))
+            self.assertTrue(np.all((bounds[:, 1] <= lat) & (lat <= bounds[:, 3])))
+
+            centers = tile_names(bounds[:, [0, 2]].mean(axis=1), bounds[:, [1, 3]].mean(axis=1), None, levels)
+            np.testing.assert_array_equal(centers, names)
+
+    def test_empty(self):
+        self.assertEqual(len(tile_names([], [])), 0)
+        self.assertEqual(tile_bounds([]).shape, (0, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,9 @@
 __all__ = [
     "EclipseCopy",
+    "CopyJournal",
+    "IngestPipeline",
+    "DriveScanner",
+    "ScanEntry",
     "RiProcessSourceDir",
     "RiProcessExtName",
     "GeoBCDirName",
@@ -7,5 +11,8 @@ __all__ = [
 ]
 
 from .eclipse_copy import EclipseCopy
+from .copy_journal import CopyJournal
+from .ingest_pipeline import IngestPipeline
+from .scanner import DriveScanner, ScanEntry
 from .folder_map import KISIK_TO_GEOBC
 from .const import RiProcessExtName, RiProcessSourceDir, GeoBCDirName
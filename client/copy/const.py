@@ -85,3 +85,37 @@ class RiProcessSourceDir:
     RAW_LIDAR = [f"06_RIEGL_PROC{path.sep}04_EXPORT"]
     IMU_GPS = [f"05_INS-GPS_PROC{path.sep}01_POS", f"01_MON{path.sep}INS-GPS_1", f"02_FULL{path.sep}INS-GPS_1"]
     ALL = [*AUXILIARY, *COVERAGE, *BASE_STATION, *CONTROL, *RAW_LIDAR, *IMU_GPS]
+
+
+class CopyConfig:
+    """
+    Enum class containing default tuning parameters for EclipseCopy.
+
+    Note that the source and destination stream limits are applied independently
+    of the worker count. The number of concurrent copies is therefore bounded by
+    the smallest of the three values.
+    """
+
+    WORKERS = 8      # Size of the copy worker pool
+    SRC_STREAMS = 4  # Max concurrent open streams on the source (external) drive
+    DST_STREAMS = 8  # Max concurrent open streams on the destination NAS
+    CHUNK_SIZE = 8 * 1024 ** 2          # Read/write block size used by the copy loop (bytes)
+    RESUME_MIN_BYTES = 64 * 1024 ** 2   # Partial copies smaller than this are restarted rather than resumed
+    PART_SUFFIX = ".eclipse_part"       # Suffix of in-progress destination files
+    CHECKSUM_DIGEST_SIZE = 32           # BLAKE2b digest size (bytes) of the checksum computed during copy
+
+
+class PipelineConfig:
+    """
+    Enum class containing default tuning parameters for IngestPipeline.
+
+    Each queue holds at most 'QUEUE_SIZE' files between two stages, so the
+    number of files in flight (and the memory used) is bounded whatever the
+    size of the drive: a slow destination blocks the copiers, which blocks
+    the scanner.
+    """
+
+    QUEUE_SIZE = 256         # Max files queued between two stages
+    EXTRACT_WORKERS = 4      # Number of LAS/LAZ header reader threads
+    WRITE_BATCH_SIZE = 1000  # Records posted per batch by the writer
+    POLL_INTERVAL = 0.2      # Seconds a blocked stage waits before checking for an abort
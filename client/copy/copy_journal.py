@@ -0,0 +1,174 @@
+# system imports
+import os
+import json
+import threading
+from typing import Optional
+
+
+class JournalState:
+    """Valid states of a copy journal entry."""
+
+    PARTIAL = "partial"
+    DONE = "done"
+
+
+class CopyJournal:
+
+    """
+    Append-only journal of the files copied by an EclipseCopy session.
+
+    Each line of the journal is a JSON object describing one source file, its
+    destination, and the size and modification time (ns) of the source at the
+    time it was copied. The last entry for a given source file wins, meaning a
+    file is considered verified only if its latest entry is 'done' and the
+    source has not changed since.
+
+    The journal is safe to share between copy worker threads.
+    """
+
+    FILE_NAME = "copy_journal.jsonl"
+
+    def __init__(self, journal_dir: str):
+
+        """
+        Initialize a CopyJournal object, loading any existing journal in 'journal_dir'.
+
+        :param journal_dir: Directory holding the journal file (e.g. 'eclipse_config.temp_hidden_dir(src)').
+        :raises OSError: If the journal file cannot be opened for writing.
+        """
+
+        self._path = os.path.join(journal_dir, self.FILE_NAME)
+        self._lock = threading.Lock()
+        self._entries = {}
+
+        self._load()
+        self._fp = open(self._path, "a", encoding="utf-8")
+
+    @property
+    def path(self) -> str:
+
+        """Get the path property (journal file path)."""
+
+        return self._path
+
+    def get(self, src: str) -> Optional[dict]:
+
+        """Get the latest journal entry for a source file."""
+
+        return self._entries.get(src)
+
+    def is_complete(self, src: str, dst: str, size: int, mtime: int) -> bool:
+
+        """
+        Check whether a source file has already been copied to 'dst'.
+
+        :param src: Source file path.
+        :param dst: Final destination file path.
+        :param size: Current size of the source file (bytes).
+        :param mtime: Current modification time of the source file (ns).
+        :return: True if the file can be skipped, else False.
+        """
+
+        entry = self._entries.get(src)
+        if not self._is_match(entry, JournalState.DONE, dst, size, mtime):
+            return False
+
+        try:  # make sure the destination copy still exists
+            return os.path.getsize(dst) == size
+        except OSError:
+            return False
+
+    def resume_offset(self, src: str, dst: str, part: str, size: int, mtime: int, block: int) -> int:
+
+        """
+        Get the byte offset a partial copy of 'src' can be resumed from.
+
+        The offset is rounded down to a multiple of 'block' and backed off by
+        one block, so that a torn final write is always rewritten.
+
+        :param src: Source file path.
+        :param dst: Final destination file path.
+        :param part: Path of the in-progress destination file.
+        :param size: Current size of the source file (bytes).
+        :param mtime: Current modification time of the source file (ns).
+        :param block: Block size of the copy loop (bytes).
+        :return: Offset to resume from, or 0 if the copy must be restarted.
+        """
+
+        entry = self._entries.get(src)
+        if not self._is_match(entry, JournalState.PARTIAL, dst, size, mtime):
+            return 0
+
+        try:
+            written = os.path.getsize(part)
+        except OSError:
+            return 0
+
+        if written > size:
+            return 0
+
+        return max(0, (written // block - 1) * block)
+
+    def start(self, src: str, dst: str, size: int, mtime: int):
+
+        """Record that a source file copy has started."""
+
+        self._write(src, JournalState.PARTIAL, dst, size, mtime)
+
+    def complete(self, src: str, dst: str, size: int, mtime: int, **extra):
+
+        """Record that a source file has been copied and renamed to its final name."""
+
+        self._write(src, JournalState.DONE, dst, size, mtime, **extra)
+
+    def close(self):
+
+        """Flush and close the journal file."""
+
+        with self._lock:
+            if not self._fp.closed:
+                self._fp.flush()
+                os.fsync(self._fp.fileno())
+                self._fp.close()
+
+    def __enter__(self) -> "CopyJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _write(self, src: str, state: str, dst: str, size: int, mtime: int, **extra):
+
+        """Append an entry to the journal and update the in-memory index."""
+
+        entry = {"src": src, "state": state, "dst": dst, "size": size, "mtime": mtime, **extra}
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self._entries[src] = entry
+            self._fp.write(line)
+            self._fp.flush()
+
+    def _load(self):
+
+        """Load an existing journal, ignoring a torn trailing line from an interrupted write."""
+
+        if not os.path.isfile(self._path):
+            return
+
+        with open(self._path, "r", encoding="utf-8") as fp:
+            for line in fp:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._entries[entry["src"]] = entry
+
+    @staticmethod
+    def _is_match(entry: Optional[dict], state: str, dst: str, size: int, mtime: int) -> bool:
+
+        """Check a journal entry against the expected state and source file attributes."""
+
+        return bool(entry) and (
+            entry["state"] == state and entry["dst"] == dst and
+            entry["size"] == size and entry["mtime"] == mtime
+        )
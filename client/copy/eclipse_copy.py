@@ -1,20 +1,28 @@
 # system imports
 import os
 import shutil
-from glob import glob
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union
 from tkinter.filedialog import askdirectory
 
 # user imports
 try:
-    from client.eclipse_config import NativeOS
-    from client.eclipse_request import EclipseRequest
-    from client.entity import Nasbox, SensorData, Drive
+    from client.eclipse_config import NativeOS, temp_hidden_dir
+    from client.eclipse_request import AsyncEclipseRequest, EclipseRequest
+    from client.entity import Nasbox, SensorDataBatch, Drive, Lidar
+    from client.lidar import LasHarvester, HarvestConfig, LasHullBuilder, HullConfig, LasFootprintBuilder, FootprintConfig
 except ImportError:
-    from eclipse_config import NativeOS
-    from eclipse_request import EclipseRequest
-    from entity import Nasbox, SensorData, Drive
-from .folder_map import FolderMapDefinition, FolderMapKey
+    from eclipse_config import NativeOS, temp_hidden_dir
+    from eclipse_request import AsyncEclipseRequest, EclipseRequest
+    from entity import Nasbox, SensorDataBatch, Drive, Lidar
+    from lidar import LasHarvester, HarvestConfig, LasHullBuilder, HullConfig, LasFootprintBuilder, FootprintConfig
+from .const import CopyConfig, PipelineConfig
+from .copy_journal import CopyJournal
+from .ingest_pipeline import IngestPipeline
+from .scanner import DriveScanner, ScanEntry
+from .folder_map import FolderMapDefinition
 if NativeOS.IS_LINUX:
     from client.entity import NasboxLinux as Nas
 elif NativeOS.IS_WINDOWS:
@@ -31,7 +39,10 @@ class EclipseCopy:
 
     def __init__(
             self, src: str, dst: str, nas_id: Optional[Union[int, str]] = -1,
-            delivery_id: Optional[Union[int, str]] = -1, folder_mapping: Optional[FolderMapDefinition] = None
+            delivery_id: Optional[Union[int, str]] = -1, folder_mapping: Optional[FolderMapDefinition] = None,
+            workers: int = CopyConfig.WORKERS, src_streams: int = CopyConfig.SRC_STREAMS,
+            dst_streams: int = CopyConfig.DST_STREAMS, journal_dir: Optional[str] = None,
+            verify: bool = False, scan: bool = True
     ):
 
         """
@@ -47,6 +58,12 @@ class EclipseCopy:
         :param nas_id: The id number of the NASbox being copied to.
         :param delivery_id: The id number of the delivery associated with the drive.
         :param folder_mapping: The folder mapping definition (e.g. 'from folder_map import KISIK_TO_GEOBC' )
+        :param workers: Number of files copied concurrently.
+        :param src_streams: Max number of files read concurrently from the source drive.
+        :param dst_streams: Max number of files written concurrently to the destination NAS.
+        :param journal_dir: Directory of the copy journal (defaults to the hidden temp directory of src).
+        :param verify: Read back each destination file and compare its checksum to the source.
+        :param scan: Scan the drive when 'src' is set. Pass False when using ingest(), which scans as it copies.
         """
 
         # handle typing of nas_id
@@ -73,15 +90,35 @@ class EclipseCopy:
 
         # list attributes
         self._files = []
-        self._records = []
+        self._entries = []
+        self._records = SensorDataBatch()
+        self._lidar_records = []
+        self._lidar_ids = {}
+
+        # dict attributes
+        self._checksums = {}
 
         # Entity attributes
         self._drive = None
         self._nasbox = None
 
+        # copy journal attributes
+        self._journal = None
+        self._journal_dir = journal_dir
+
+        # bool attributes
+        self._verify = verify
+        self._scan = scan
+
         # dict attributes
         self._folder_mapping = folder_mapping
 
+        # concurrency attributes
+        self._workers = 1
+        self._src_slots = threading.BoundedSemaphore(max(1, src_streams))
+        self._dst_slots = threading.BoundedSemaphore(max(1, dst_streams))
+        self.workers = workers
+
         # Call property setters for actual values passed
         self.src = src
         self.dst = dst
@@ -113,8 +150,14 @@ class EclipseCopy:
         else:  # set the src and update related properties.
             self._src = src
             self._drive = Drive()
-            self._drive.set_drive_info(src)
-            self._gather_files()
+            if not self._scan:  # the drive is counted by the ingest pipeline scan
+                self._drive.set_drive_info(src, file_count=0)
+                return
+            scanner = self._gather_files()
+            if scanner:  # reuse the scan counts rather than walking the drive again
+                self._drive.set_drive_info(src, file_count=scanner.file_count, file_bytes=scanner.matched_bytes)
+            else:
+                self._drive.set_drive_info(src)
 
     @property
     def dst(self) -> str:
@@ -182,6 +225,49 @@ class EclipseCopy:
 
         self._nasbox = nasbox
 
+    @property
+    def workers(self) -> int:
+
+        """Get the workers property (size of the copy worker pool)."""
+
+        return self._workers
+
+    @workers.setter
+    def workers(self, workers: int):
+
+        """
+        Set the workers property.
+
+        :param workers: Number of files copied concurrently (1 copies serially).
+        :raises ValueError:
+        """
+
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+
+        self._workers = workers
+
+    @property
+    def verify(self) -> bool:
+
+        """Get the verify property (read-back verification of copied files)."""
+
+        return self._verify
+
+    @verify.setter
+    def verify(self, verify: bool):
+
+        """Set the verify property."""
+
+        self._verify = verify
+
+    @property
+    def checksums(self) -> dict[str, str]:
+
+        """Get the checksums property (source file path to BLAKE2b hex digest)."""
+
+        return self._checksums
+
     @property
     def files(self) -> list:
 
@@ -190,12 +276,26 @@ class EclipseCopy:
         return self._files
 
     @property
-    def records(self) -> list:
+    def entries(self) -> list[ScanEntry]:
 
-        """Get the records property."""
+        """Get the entries property (scanned files with their size and mtime)."""
+
+        return self._entries
+
+    @property
+    def records(self) -> SensorDataBatch:
+
+        """Get the records property (columnar batch of SensorData records)."""
 
         return self._records
 
+    @property
+    def lidar_records(self) -> list[Lidar]:
+
+        """Get the lidar_records property (Lidar records harvested from the LAS/LAZ headers)."""
+
+        return self._lidar_records
+
     @property
     def nas_id(self):
 
@@ -224,11 +324,8 @@ class EclipseCopy:
         if self._drive and self._drive.nas_id <= 0:
             self._drive.nas_id = nas_id
 
-        if self._records:
-            # update the nas_id for the sensor data records
-            for record in self._records:
-                if record.nas_id <= 0:
-                    record.nas_id = nas_id
+        # update the nas_id for the sensor data records
+        self._records.set_nas_id(nas_id, unset_only=True)
 
     @property
     def delivery_id(self):
@@ -259,31 +356,37 @@ class EclipseCopy:
         if self._drive and self.delivery_id > 0:
             self._drive.delivery_id = delivery_id
 
-        if self._records:
-            # update the delivery_id for the sensor data records
-            for record in self._records:
-                if record.delivery_id > 0:
-                    record.delivery_id = delivery_id
+        # update the delivery_id for the sensor data records
+        self._records.set_delivery_id(delivery_id)
 
-    def _post_records(self, file_errs: dict) -> Union[dict, None]:
+    def _post_records(self, file_errs: dict) -> list:
 
         """
-        Issue a POST request to the server for all the file records.
+        Issue POST requests to the server for the drive record and all the file records.
+
+        The drive record is posted first, and the file records (in concurrent batches)
+        only if it was created, so no file records are left without their drive.
 
         :param file_errs: A list of files that failed to copy.
-        :return:
+        :return: A list holding the drive response and the file records response (None if no records,
+            or if the drive record failed to post).
         """
 
+        failed = set(file_errs["file"])
         file_records = [  # remove any files for record creation that failed to copy
-            f for f in self._files
-            if f not in file_errs["file"]
+            entry for entry in self._entries
+            if entry.path not in failed
         ]
-        records = self._create_records(file_records)
-        erq = EclipseRequest("POST", records)
-        res = erq.send()
-        return res
+        self._records = self._create_records(file_records)
 
-    def copy(self, dst: str = "") -> dict[str: list[str]]:
+        res_drive = EclipseRequest("POST", self._drive).send()
+        if not res_drive or not self._records:
+            return [res_drive, None]
+
+        res_records, = AsyncEclipseRequest.send_all(AsyncEclipseRequest("POST", self._records))
+        return [res_drive, res_records]
+
+    def copy(self, dst: str = "", workers: Optional[int] = None, verify: Optional[bool] = None) -> dict[str: list[str]]:
 
         """
         Copy from the delivered source folder structure and translate
@@ -293,6 +396,22 @@ class EclipseCopy:
         is defined by the folder tree delivered by the currently contracted
         company responsible for acquisition
 
+        Files are copied concurrently by a pool of 'workers' threads. Reads from the
+        source drive and writes to the destination are additionally bounded by the
+        'src_streams' and 'dst_streams' limits passed to the constructor.
+
+        Progress is recorded in a copy journal (see CopyJournal). Files are written under a
+        temporary name and renamed once complete, so an interrupted copy can be restarted:
+        files already copied are skipped, and large partial files are resumed from their
+        last written offset.
+
+        A BLAKE2b checksum of each file is computed while it is copied, and is posted
+        with the SensorData records. If 'verify' is set, each destination file is read
+        back and compared against that checksum before it is renamed.
+
+        :param dst: Optional destination override.
+        :param workers: Optional override of the worker count set on the constructor.
+        :param verify: Optional override of the verify property set on the constructor.
         :return: None if successful, else a dictionary containing any failed file copy items (keys: ["file", "err"])
         :raises MissingFkError:
         :raises MissingNetworkConfigError:
@@ -308,31 +427,380 @@ class EclipseCopy:
         if dst:  # option to overwrite destination by passing as argument.
             self.dst = dst
 
+        if workers is not None:
+            self.workers = workers
+
+        if verify is not None:
+            self.verify = verify
+
         # copy the files to the network location
         failed_copy = {"file": [], "err": []}
-        for file in self._files:
-            try:
-                f_dir = os.path.dirname(file)
-                f_dir = f_dir[1:] if f_dir.startswith(os.path.sep) else f_dir
-                dst = self._dst + os.path.sep + f_dir
-                os.makedirs(dst, exist_ok=True)
-                shutil.copy2(file, dst)
-
-            except Exception as err:
-                failed_copy["file"].append(file)
-                failed_copy["err"].append(err)
-
-        # Update the drive records.
-        erq = EclipseRequest("POST", self._drive)
-        res = erq.send()
-        if not res:
+        targets = self._create_dst_dirs(failed_copy)
+        self._journal = self._open_journal()
+        try:
+            with ThreadPoolExecutor(max_workers=self._workers) as pool:
+                futures = [
+                    (file, pool.submit(self._copy_file, file, dst_dir))
+                    for file, dst_dir in targets.items()
+                ]
+                for file, future in futures:
+                    err = future.exception()
+                    if err:
+                        failed_copy["file"].append(file)
+                        failed_copy["err"].append(err)
+        finally:
+            if self._journal:
+                self._journal.close()
+                self._journal = None
+
+        # Update the drive and file records.
+        res_drive, _ = self._post_records(failed_copy)
+        if not res_drive:
             raise ConnectionError("Failed to post drive record to Eclipse database.")
 
-        # Update the file records
-        self._post_records(failed_copy)
-
         return failed_copy
 
+    def ingest(
+            self, dst: str = "", queue_size: int = PipelineConfig.QUEUE_SIZE,
+            extract_workers: int = PipelineConfig.EXTRACT_WORKERS, epsg_codes: Optional[list[int]] = None
+    ) -> dict[str: list[str]]:
+
+        """
+        Copy the drive and post its records with a staged pipeline (see IngestPipeline).
+
+        Unlike copy(), which scans, copies and posts in sequence, the scan, the copies,
+        the LAS/LAZ header reads and the record posts overlap, connected by queues of at
+        most 'queue_size' files. Memory stays bounded whatever the size of the drive, and
+        a slow destination throttles the scan. The Lidar records of the LAS/LAZ files are
+        posted along with the SensorData records.
+
+        :param dst: Optional destination override.
+        :param queue_size: Max files queued between two stages.
+        :param extract_workers: Number of LAS/LAZ header reader threads.
+        :param epsg_codes: EPSG codes known to the server. Other codes are posted as None.
+        :return: A dictionary containing the files that failed to copy, extract or post, and the
+            drive (its 'src' path) if its record failed to post (keys: ["file", "err"]).
+        :raises MissingFkError:
+        """
+
+        if not self.dst and not dst:
+            raise ValueError("The 'dst_dir' property has not been set.")
+
+        if not self._is_valid_foreign_keys(self.nas_id, self.delivery_id):
+            raise MissingFkError
+
+        if not self.folder_mapping:
+            raise ValueError("The 'folder_mapping' property has not been set.")
+
+        if dst:
+            self.dst = dst
+
+        pipeline = IngestPipeline(
+            self, queue_size=queue_size, extract_workers=extract_workers, epsg_codes=epsg_codes
+        )
+        return pipeline.run()
+
+    def harvest_lidar(
+            self, failed_copy: Optional[dict] = None, workers: int = HarvestConfig.WORKERS,
+            epsg_codes: Optional[list[int]] = None
+    ) -> dict[str: list[str]]:
+
+        """
+        Create and post the Lidar records of the LAS/LAZ files found on the drive.
+
+        Only the header and VLRs of each file are read (see LasHarvester), by a pool of
+        'workers' processes. Call after copy(), passing its result to skip the files that
+        failed to copy.
+
+        :param failed_copy: The dictionary returned by copy() (keys: ["file", "err"]).
+        :param workers: Size of the header reader process pool.
+        :param epsg_codes: EPSG codes known to the server. Other codes are posted as None.
+        :return: A dictionary containing the files whose header could not be read, or whose
+            record was rejected by the server (keys: ["file", "err"]).
+        :raises MissingFkError:
+        :raises ConnectionError: If the server could not be reached.
+        """
+
+        if self.nas_id <= 0:
+            raise MissingFkError("Missing foreign keys: Make sure 'nas_id' is set correctly.")
+
+        if not self._entries:
+            self._gather_files()
+
+        skip = set(failed_copy["file"]) if failed_copy else set()
+        paths = [entry.path for entry in self._entries if entry.path not in skip]
+
+        harvester = LasHarvester(workers=workers, epsg_codes=epsg_codes)
+        self._lidar_records, failed_read = harvester.records(paths, nas_id=self._nas_id)
+
+        if self._lidar_records:
+            res, = AsyncEclipseRequest.send_all(AsyncEclipseRequest("POST", self._lidar_records))
+            if not res:
+                raise ConnectionError("Failed to post lidar records to Eclipse database.")
+            # keep the ids of the created records, to reference them from LidarStrip/LidarTile records
+            self._lidar_ids = {
+                record["file_path"]: record["id"] for record in EclipseRequest.created_records(res)
+                if "file_path" in record
+            }
+            if not EclipseRequest.is_created(res):
+                unposted = [
+                    record.file_path for record in self._lidar_records if record.file_path not in self._lidar_ids
+                ]
+                self._fail_unposted(failed_read, unposted, res, "lidar")
+
+        return failed_read
+
+    def hull_strips(
+            self, paths: Optional[list[str]] = None, workers: int = HullConfig.WORKERS,
+            decimate: int = HullConfig.DECIMATE
+    ) -> dict[str: list[str]]:
+
+        """
+        Compute and post the convex hulls (LidarStrip records) of the harvested LAS/LAZ strips.
+
+        Each strip is streamed in chunks by one of 'workers' processes (see LasHullBuilder),
+        so memory use is bounded regardless of the strip size. Call after harvest_lidar(),
+        which creates the Lidar records the LidarStrip records reference.
+
+        :param paths: Paths of the strips (defaults to all files posted by harvest_lidar()).
+        :param workers: Size of the point reader process pool.
+        :param decimate: Keep every n-th point when computing the hulls.
+        :return: A dictionary containing the files whose hull could not be computed, or whose
+            record was rejected by the server (keys: ["file", "err"]).
+        :raises ConnectionError: If the server could not be reached.
+        """
+
+        lidar_ids = self._lidar_ids
+        if paths is not None:
+            lidar_ids = {path: lidar_ids[path] for path in paths if path in lidar_ids}
+
+        builder = LasHullBuilder(workers=workers, decimate=decimate)
+        records, failed_hull = builder.records(lidar_ids)
+
+        if records:
+            res, = AsyncEclipseRequest.send_all(AsyncEclipseRequest("POST", records))
+            if not res:
+                raise ConnectionError("Failed to post lidar strip records to Eclipse database.")
+            if not EclipseRequest.is_created(res):
+                self._fail_unposted(failed_hull, self._unposted_files(records, res, lidar_ids), res, "lidar strip")
+
+        return failed_hull
+
+    def footprint_tiles(
+            self, paths: Optional[list[str]] = None, workers: int = FootprintConfig.WORKERS,
+            cell_size: float = FootprintConfig.CELL_SIZE
+    ) -> dict[str: list[str]]:
+
+        """
+        Compute and post the footprints and point density grids (LidarTile records) of the harvested LAS/LAZ tiles.
+
+        This is an optional ingest stage: each tile is streamed once, in chunks, by one of
+        'workers' processes (see LasFootprintBuilder). The footprint traces the cells of
+        'cell_size' holding points, so partial edge tiles don't count as fully covered.
+        Call after harvest_lidar(), which creates the Lidar records the LidarTile records reference.
+
+        :param paths: Paths of the tiles (defaults to all files posted by harvest_lidar()).
+        :param workers: Size of the point reader process pool.
+        :param cell_size: Occupancy grid cell size of the footprints.
+        :return: A dictionary containing the files whose footprint could not be computed, or whose
+            record was rejected by the server (keys: ["file", "err"]).
+        :raises ConnectionError: If the server could not be reached.
+        """
+
+        lidar_ids = self._lidar_ids
+        if paths is not None:
+            lidar_ids = {path: lidar_ids[path] for path in paths if path in lidar_ids}
+
+        builder = LasFootprintBuilder(workers=workers, cell_size=cell_size)
+        records, failed_footprint = builder.records(lidar_ids)
+
+        if records:
+            res, = AsyncEclipseRequest.send_all(AsyncEclipseRequest("POST", records))
+            if not res:
+                raise ConnectionError("Failed to post lidar tile records to Eclipse database.")
+            if not EclipseRequest.is_created(res):
+                self._fail_unposted(failed_footprint, self._unposted_files(records, res, lidar_ids), res, "lidar tile")
+
+        return failed_footprint
+
+    @staticmethod
+    def _unposted_files(records: list, res: list, lidar_ids: dict[str, int]) -> list[str]:
+
+        """Get the files of the LidarStrip/LidarTile records (keyed by Lidar id) missing from a POST response."""
+
+        created = {record["id"] for record in EclipseRequest.created_records(res)}
+        paths = {lidar_id: path for path, lidar_id in lidar_ids.items()}
+
+        return [paths[record.id] for record in records if record.id not in created]
+
+    @staticmethod
+    def _fail_unposted(failed: dict, files: list[str], res: list, name: str):
+
+        """Add the files whose records were rejected by the server to a failed dictionary (keys: ["file", "err"])."""
+
+        err = ConnectionError(
+            f"Failed to post {name} records to Eclipse database: {EclipseRequest.errors(res)[:1]}"
+        )
+        for file in files:
+            failed["file"].append(file)
+            failed["err"].append(err)
+
+    def _dst_dir(self, file: str) -> str:
+
+        """Get the destination directory of a source file."""
+
+        f_dir = os.path.dirname(file)
+        f_dir = f_dir[1:] if f_dir.startswith(os.path.sep) else f_dir
+        return self._dst + os.path.sep + f_dir
+
+    def _create_dst_dirs(self, failed_copy: dict) -> dict[str, str]:
+
+        """
+        Create every destination directory exactly once.
+
+        Files whose destination directory could not be created are added to
+        'failed_copy' and omitted from the returned mapping.
+
+        :param failed_copy: The failed copy dictionary (keys: ["file", "err"]).
+        :return: A dictionary mapping each copyable source file to its destination directory.
+        """
+
+        targets = {file: self._dst_dir(file) for file in self._files}
+
+        dir_errs = {}
+        for dst_dir in set(targets.values()):
+            try:
+                os.makedirs(dst_dir, exist_ok=True)
+            except OSError as err:
+                dir_errs[dst_dir] = err
+
+        if dir_errs:
+            for file, dst_dir in list(targets.items()):
+                if dst_dir in dir_errs:
+                    failed_copy["file"].append(file)
+                    failed_copy["err"].append(dir_errs[dst_dir])
+                    del targets[file]
+
+        return targets
+
+    def _open_journal(self) -> Optional[CopyJournal]:
+
+        """
+        Open the copy journal.
+
+        Falls back from the configured journal directory to the hidden temp directory
+        of the source, then of the destination (delivery drives may be read-only).
+        Returns None if no location is writable, in which case nothing is resumed.
+        """
+
+        if self._journal_dir:
+            try:
+                return CopyJournal(self._journal_dir)
+            except OSError:
+                pass
+
+        for parent in (self._src, self._dst):
+            try:
+                return CopyJournal(temp_hidden_dir(parent))
+            except OSError:
+                continue
+
+        return None
+
+    def _copy_file(self, file: str, dst_dir: str) -> str:
+
+        """
+        Copy a single file, holding one source and one destination stream slot.
+
+        The file is written to a temporary name in 'dst_dir' and atomically renamed
+        once complete. Files recorded as complete in the copy journal are skipped,
+        and partial copies of large files resume from their last written offset.
+
+        The checksum of the file is computed from the blocks as they are copied,
+        and stored in the 'checksums' property.
+
+        :param file: Source file path.
+        :param dst_dir: Existing destination directory.
+        :return: The destination file path.
+        :raises ChecksumMismatchError: If 'verify' is set and the read-back checksum differs.
+        """
+
+        journal = self._journal
+        dst_file = os.path.join(dst_dir, os.path.basename(file))
+        part_file = dst_file + CopyConfig.PART_SUFFIX
+        stat = os.stat(file)
+        size, mtime = stat.st_size, stat.st_mtime_ns
+
+        offset = 0
+        if journal:
+            if journal.is_complete(file, dst_file, size, mtime):
+                checksum = journal.get(file).get("checksum")
+                if checksum:
+                    self._checksums[file] = checksum
+                return dst_file
+            if size >= CopyConfig.RESUME_MIN_BYTES:
+                offset = journal.resume_offset(file, dst_file, part_file, size, mtime, CopyConfig.CHUNK_SIZE)
+            journal.start(file, dst_file, size, mtime)
+
+        digest = self._new_digest()
+        with self._src_slots, self._dst_slots:
+            with open(file, "rb") as fsrc, open(part_file, "r+b" if offset else "wb") as fdst:
+                if offset:  # the resumed prefix is hashed from the source rather than re-read from the NAS
+                    self._update_digest(digest, fsrc, offset)
+                fdst.seek(offset)
+                fdst.truncate()
+                while True:
+                    chunk = fsrc.read(CopyConfig.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    fdst.write(chunk)
+
+            checksum = digest.hexdigest()
+            if self._verify:
+                with open(part_file, "rb") as fdst:
+                    readback = self._new_digest()
+                    self._update_digest(readback, fdst)
+                if readback.hexdigest() != checksum:
+                    raise ChecksumMismatchError(file, checksum, readback.hexdigest())
+
+        shutil.copystat(file, part_file)
+        os.replace(part_file, dst_file)
+
+        self._checksums[file] = checksum
+        if journal:
+            journal.complete(file, dst_file, size, mtime, checksum=checksum)
+
+        return dst_file
+
+    @staticmethod
+    def _new_digest() -> hashlib.blake2b:
+
+        """Create a new hash object for file checksums."""
+
+        return hashlib.blake2b(digest_size=CopyConfig.CHECKSUM_DIGEST_SIZE)
+
+    @staticmethod
+    def _update_digest(digest: hashlib.blake2b, fp, n_bytes: int = -1):
+
+        """
+        Feed 'n_bytes' of an open binary file into 'digest' (all remaining bytes if negative).
+
+        :param digest: A hash object (see _new_digest()).
+        :param fp: A file object opened in binary mode.
+        :param n_bytes: Number of bytes to read.
+        """
+
+        remaining = n_bytes
+        while remaining:
+            size = CopyConfig.CHUNK_SIZE if remaining < 0 else min(remaining, CopyConfig.CHUNK_SIZE)
+            chunk = fp.read(size)
+            if not chunk:
+                break
+            digest.update(chunk)
+            if remaining > 0:
+                remaining -= len(chunk)
+
     @staticmethod
     def _is_valid_foreign_keys(nas_id: int, delivery_id: int) -> bool:
 
@@ -340,7 +808,7 @@ class EclipseCopy:
 
         return nas_id > 0 or delivery_id > 0
 
-    def _gather_files(self):
+    def _gather_files(self) -> Optional[DriveScanner]:
 
         """
         Copy from the delivered source folder structure and translate
@@ -349,53 +817,39 @@ class EclipseCopy:
         Note that as of August 12, 2023, the folder structure of src
         is defined by the folder tree delivered by the currently contracted
         company responsible for acquisition
+
+        The drive is walked once by a DriveScanner, and the stat results of
+        each file are kept in the 'entries' property. The same walk counts all
+        files on the drive for the Drive record.
+
+        :return: The DriveScanner used (holding the scan counts), or None if no folder mapping is set.
         """
 
         fmap = self.folder_mapping
-        if fmap:
-            src_files = []
-            for folder in fmap.keys():
-
-                sources = fmap[folder][FolderMapKey.SOURCE_FOLDERS]
-                extensions = fmap[folder][FolderMapKey.FILE_EXTENSIONS]
+        if not fmap:
+            return None
 
-                for source in sources:  # Gather files with desired extensions
-                    is_recursive = source.endswith("*")
-                    src_full = os.path.join(self._src, source)  # join the src root with current relative path
-                    files = []
-                    for ext in extensions:
-                        files.extend(
-                            glob(os.path.join(src_full, "*" + ext), recursive=is_recursive)
-                        )
-                    if files:
-                        src_files.extend(files)
+        scanner = DriveScanner(self._src, fmap, count_all=True)
+        entries = scanner.scan()
+        if entries:  # If files found with extensions, copy them to the GeoBC folder mappings
+            self._entries = entries
+            self._files = [entry.path for entry in entries]
 
-            if src_files:  # If files found with extensions, copy them to the GeoBC folder mappings
-                self._files = src_files
+        return scanner
 
-    def _create_records(self, files: list[str]) -> list[SensorData]:
+    def _create_records(self, entries: list[ScanEntry]) -> SensorDataBatch:
 
         """
-        Copy from the delivered source folder structure and translate
-        into the GeoBC defined folder structure.
+        Create the SensorData records of the copied files.
 
-        Note that as of August 12, 2023, the folder structure of src
-        is defined by the folder tree delivered by the currently contracted
-        company responsible for acquisition
-        """
+        Records are built from the size and mtime cached by the scan,
+        so no file is stat'ed again.
 
-        records = []
-
-        if files:
-            for f in files:
-                record = SensorData(file_path=f)
-                if self._nas_id > 0:
-                    record.nas_id = self._nas_id
-                if self._delivery_id > 0:
-                    record.delivery_id = self._delivery_id
-                records.append(record)
+        :param entries: Scanned entries of the files to create records for.
+        :return: A columnar batch of SensorData records.
+        """
 
-        return records
+        return SensorDataBatch.from_entries(entries, self._nas_id, self._delivery_id, self._checksums)
 
 
 class MissingFkError(Exception):
@@ -406,6 +860,14 @@ class MissingFkError(Exception):
         super().__init__(self.message)
 
 
+class ChecksumMismatchError(Exception):
+    """Exception indicating that a destination file does not match the checksum of its source."""
+
+    def __init__(self, file: str, expected: str, actual: str):
+        self.message = f"Checksum mismatch for '{file}': expected {expected}, read back {actual}."
+        super().__init__(self.message)
+
+
 def main():
 
     # Quick and dirty "GUI"
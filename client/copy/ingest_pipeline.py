@@ -0,0 +1,345 @@
+# system imports
+import os
+import queue
+import threading
+from typing import Callable, Optional
+
+# user imports
+try:
+    from client.eclipse_request import EclipseRequest
+    from client.entity import SensorDataBatch, Lidar
+    from client.lidar import LasHarvester, null_unknown_epsg, read_las_header
+except ImportError:
+    from eclipse_request import EclipseRequest
+    from entity import SensorDataBatch, Lidar
+    from lidar import LasHarvester, null_unknown_epsg, read_las_header
+from .const import PipelineConfig
+from .scanner import DriveScanner, ScanEntry
+
+
+# End of stream marker, sent once to each consumer of a queue
+_DONE = object()
+
+
+class PipelineAbortedError(Exception):
+    """Exception raised inside a pipeline stage when another stage failed."""
+
+
+class IngestPipeline:
+
+    """
+    Staged ingestion of a delivery drive: scan -> copy -> extract -> write.
+
+    The stages run concurrently, connected by bounded queues:
+
+    - the scanner walks the drive (DriveScanner.iter_scan()), queueing files as they are found;
+    - a pool of copier threads copies the files to the NAS (EclipseCopy._copy_file(),
+      with the journal, stream limits and fused checksums of EclipseCopy.copy());
+    - a pool of extractor threads reads the headers of the LAS/LAZ files (a few KB each,
+      so the reads are I/O bound and threads avoid the process start up cost);
+    - a single writer posts the SensorData and Lidar records in batches.
+
+    Since every queue is bounded, a slow stage throttles the stages before it (e.g. a
+    slow NAS blocks the scanner), and no list of all the files on the drive is built.
+    If a stage fails, the other stages stop and the error is raised by run().
+
+    The drive record is posted before any stage starts, like EclipseCopy.copy(), so no
+    file record is left without its drive; its file count is updated once the scan is done.
+
+    Errors on a single file don't stop the pipeline: the file is reported in the
+    returned dictionary (keys: ["file", "err"]), like EclipseCopy.copy(). So are the
+    failed post or update of the drive record, under the path of the drive.
+
+    >>> ecopy = EclipseCopy(src, dst, nas_id=1, delivery_id=4, folder_mapping=KISIK_TO_GEOBC, scan=False)
+    >>> failed = IngestPipeline(ecopy).run()
+    """
+
+    def __init__(
+            self, eclipse_copy, queue_size: int = PipelineConfig.QUEUE_SIZE,
+            extract_workers: int = PipelineConfig.EXTRACT_WORKERS,
+            batch_size: int = PipelineConfig.WRITE_BATCH_SIZE, epsg_codes: Optional[list[int]] = None
+    ):
+
+        """
+        Initialize an IngestPipeline object.
+
+        :param eclipse_copy: The EclipseCopy holding the source, destination, foreign keys and copy settings.
+        :param queue_size: Max files queued between two stages.
+        :param extract_workers: Number of LAS/LAZ header reader threads.
+        :param batch_size: Records posted per batch by the writer.
+        :param epsg_codes: EPSG codes known to the server. Other codes are posted as None.
+        """
+
+        self._copy = eclipse_copy
+        self._queue_size = max(1, queue_size)
+        self._extract_workers = max(1, extract_workers)
+        self._batch_size = max(1, batch_size)
+        self._epsg_codes = frozenset(epsg_codes) if epsg_codes is not None else None
+
+        self._scanner = None
+        self._posted_count = 0
+
+        # failure bookkeeping, shared by the stages
+        self._abort = threading.Event()
+        self._error = None
+        self._failed = {"file": [], "err": []}
+        self._lock = threading.Lock()
+        self._dst_dirs = set()
+
+    @property
+    def scanner(self) -> Optional[DriveScanner]:
+
+        """Get the scanner property (holding the scan counts of the last run)."""
+
+        return self._scanner
+
+    @property
+    def posted_count(self) -> int:
+
+        """Get the posted_count property (number of SensorData records posted by the last run)."""
+
+        return self._posted_count
+
+    def run(self) -> dict[str: list]:
+
+        """
+        Post the drive record, then run the pipeline until every file on the drive is copied
+        and recorded, and update the file count of the drive record.
+
+        If the drive record could not be posted, no stage is run. Drive record failures are
+        reported with the files, under the path of the drive.
+
+        :return: A dictionary containing the files that failed to copy, extract or post,
+            and the drive if its record failed to post or update (keys: ["file", "err"]).
+        """
+
+        ecopy = self._copy
+        self._abort.clear()
+        self._error = None
+        self._failed = {"file": [], "err": []}
+        self._posted_count = 0
+        self._scanner = DriveScanner(ecopy.src, ecopy.folder_mapping, count_all=True)
+
+        # the drive is recorded first: its file count is only known once the scan is done
+        drive = ecopy.drive
+        drive.set_drive_info(ecopy.src, file_count=0)
+        created = EclipseRequest.created_records(EclipseRequest("POST", drive).send())
+        if not created:
+            self._fail(ecopy.src, ConnectionError("Failed to post drive record to Eclipse database."))
+            return self._failed
+        drive.id = created[0]["id"]
+
+        copy_q = queue.Queue(self._queue_size)
+        extract_q = queue.Queue(self._queue_size)
+        write_q = queue.Queue(self._queue_size)
+
+        ecopy._journal = ecopy._open_journal()
+        try:
+            scanner = self._start(self._scan, copy_q, ecopy.workers)
+            copiers = [self._start(self._copy_files, copy_q, extract_q) for _ in range(ecopy.workers)]
+            extractors = [self._start(self._extract, extract_q, write_q) for _ in range(self._extract_workers)]
+            writer = self._start(self._write, write_q)
+
+            # signal the end of each stage once all its producers are done
+            scanner.join()
+            self._join(copiers, extract_q, len(extractors))
+            self._join(extractors, write_q, 1)
+            writer.join()
+        finally:
+            self._abort.set()  # unblocks any stage still waiting (e.g. on an interrupt)
+            if ecopy._journal:
+                ecopy._journal.close()
+                ecopy._journal = None
+
+        if self._error:
+            raise self._error
+
+        drive.set_drive_info(ecopy.src, file_count=self._scanner.file_count, file_bytes=self._scanner.matched_bytes)
+        if not EclipseRequest.is_created(EclipseRequest("PATCH", drive).send()):
+            self._fail(ecopy.src, ConnectionError("Failed to update the drive record in Eclipse database."))
+
+        return self._failed
+
+    def _start(self, stage: Callable, *args) -> threading.Thread:
+
+        """Start a stage in a daemon thread."""
+
+        thread = threading.Thread(target=self._run_stage, args=(stage, *args), daemon=True)
+        thread.start()
+
+        return thread
+
+    def _run_stage(self, stage: Callable, *args):
+
+        """Run a stage, aborting the pipeline if it fails."""
+
+        try:
+            stage(*args)
+        except PipelineAbortedError:
+            pass
+        except BaseException as err:
+            with self._lock:
+                if self._error is None:
+                    self._error = err
+            self._abort.set()
+
+    def _join(self, threads: list[threading.Thread], out_q: queue.Queue, consumers: int):
+
+        """Wait for the producers of 'out_q', then send the end marker to each of its consumers."""
+
+        for thread in threads:
+            thread.join()
+
+        if not self._abort.is_set():
+            for _ in range(consumers):
+                self._put(out_q, _DONE)
+
+    def _scan(self, copy_q: queue.Queue, copiers: int):
+
+        """Scanner stage: queue the files of the drive as they are found."""
+
+        for entry in self._scanner.iter_scan():
+            self._put(copy_q, entry)
+
+        for _ in range(copiers):
+            self._put(copy_q, _DONE)
+
+    def _copy_files(self, copy_q: queue.Queue, extract_q: queue.Queue):
+
+        """Copier stage: copy each file to the destination, queueing it with its checksum."""
+
+        ecopy = self._copy
+        while True:
+            entry = self._get(copy_q)
+            if entry is _DONE:
+                return
+
+            try:
+                dst_dir = ecopy._dst_dir(entry.path)
+                self._make_dir(dst_dir)
+                ecopy._copy_file(entry.path, dst_dir)
+            except Exception as err:
+                self._fail(entry.path, err)
+                continue
+
+            # the checksum is handed down the pipeline, rather than kept for the whole drive
+            checksum = ecopy.checksums.pop(entry.path, "")
+            self._put(extract_q, (entry, checksum))
+
+    def _extract(self, extract_q: queue.Queue, write_q: queue.Queue):
+
+        """Extractor stage: read the header of each LAS/LAZ file (other files are passed through)."""
+
+        while True:
+            item = self._get(extract_q)
+            if item is _DONE:
+                return
+
+            entry, checksum = item
+            header = None
+            if LasHarvester.is_las(entry.path):
+                try:
+                    header = read_las_header(entry.path)
+                except Exception as err:  # the file is still recorded as SensorData
+                    self._fail(entry.path, err)
+
+            self._put(write_q, (entry, checksum, header))
+
+    def _write(self, write_q: queue.Queue):
+
+        """Writer stage: post the records in batches."""
+
+        entries, checksums, headers = [], {}, []
+        while True:
+            item = self._get(write_q)
+            done = item is _DONE
+            if not done:
+                entry, checksum, header = item
+                entries.append(entry)
+                checksums[entry.path] = checksum
+                if header is not None:
+                    headers.append(header)
+
+            if entries and (done or len(entries) >= self._batch_size):
+                self._post(entries, checksums, headers)
+                entries, checksums, headers = [], {}, []
+
+            if done:
+                return
+
+    def _post(self, entries: list[ScanEntry], checksums: dict[str, str], headers: list):
+
+        """Post a batch of SensorData records, and the Lidar records of its LAS/LAZ files."""
+
+        ecopy = self._copy
+        batch = SensorDataBatch.from_entries(entries, ecopy.nas_id, ecopy.delivery_id, checksums)
+        res = EclipseRequest("POST", batch, batch_size=self._batch_size).send()
+        if not EclipseRequest.is_created(res):
+            err = ConnectionError("Failed to post sensor data records to Eclipse database.")
+            for entry in entries:
+                self._fail(entry.path, err)
+        else:
+            self._posted_count += len(entries)
+
+        if not headers:
+            return
+
+        records = [Lidar.from_header(header, ecopy.nas_id) for header in headers]
+        null_unknown_epsg(records, self._epsg_codes)
+
+        res = EclipseRequest("POST", records, batch_size=self._batch_size).send()
+        if not EclipseRequest.is_created(res):
+            err = ConnectionError("Failed to post lidar records to Eclipse database.")
+            for header in headers:
+                self._fail(header.path, err)
+            return
+
+        # keep the ids of the created records, to reference them from LidarStrip/LidarTile records
+        ecopy._lidar_ids.update(
+            (record["file_path"], record["id"]) for record in res
+            if isinstance(record, dict) and "id" in record
+        )
+
+    def _make_dir(self, dst_dir: str):
+
+        """Create a destination directory once."""
+
+        if dst_dir in self._dst_dirs:
+            return
+
+        os.makedirs(dst_dir, exist_ok=True)
+        with self._lock:
+            self._dst_dirs.add(dst_dir)
+
+    def _fail(self, file: str, err: Exception):
+
+        """Record a file that failed a stage."""
+
+        with self._lock:
+            self._failed["file"].append(file)
+            self._failed["err"].append(err)
+
+    def _put(self, q: queue.Queue, item):
+
+        """Put an item on a queue, blocking while it is full (backpressure) unless the pipeline is aborted."""
+
+        while True:
+            if self._abort.is_set():
+                raise PipelineAbortedError
+            try:
+                q.put(item, timeout=PipelineConfig.POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, q: queue.Queue):
+
+        """Get an item from a queue, blocking while it is empty unless the pipeline is aborted."""
+
+        while True:
+            if self._abort.is_set():
+                raise PipelineAbortedError
+            try:
+                return q.get(timeout=PipelineConfig.POLL_INTERVAL)
+            except queue.Empty:
+                continue
@@ -0,0 +1,217 @@
+# system imports
+import os
+import re
+import fnmatch
+from typing import Iterator, NamedTuple, Optional
+
+# user imports
+from .folder_map import FolderMapDefinition, FolderMapKey
+
+
+class ScanEntry(NamedTuple):
+    """A file found by DriveScanner, with the stat results cached at scan time."""
+
+    path: str
+    size: int   # bytes
+    mtime: int  # ns
+
+
+class _ExtMatcher:
+
+    """
+    Matches file names against a set of file extensions.
+
+    Plain extensions (e.g. '.laz', '.shp.xml') are matched with a single str.endswith()
+    call on a precompiled suffix tuple. Extensions containing wildcards (e.g. 'pos.*')
+    are compiled into one regular expression, matching as glob('*' + ext) would.
+    """
+
+    _MAGIC = re.compile(r"[*?\[]")
+
+    def __init__(self, extensions: frozenset):
+
+        exts = [os.path.normcase(ext) for ext in extensions]
+        self._suffixes = tuple(ext for ext in exts if not self._MAGIC.search(ext))
+
+        patterns = [fnmatch.translate("*" + ext) for ext in exts if self._MAGIC.search(ext)]
+        self._regex = re.compile("|".join(patterns)) if patterns else None
+
+    def __call__(self, name: str) -> bool:
+
+        name = os.path.normcase(name)
+        if self._suffixes and name.endswith(self._suffixes):
+            return True
+
+        return bool(self._regex and self._regex.match(name))
+
+
+class DriveScanner:
+
+    """
+    Single pass scanner of the files selected by a folder mapping.
+
+    Replaces one glob() per (source folder, extension) pair with one os.scandir()
+    walk of the drive. Every directory is listed at most once, whatever the number of
+    extensions or overlapping recursive source folders, and only directories that are
+    (or lead to) mapped source folders are visited.
+
+    Matching follows glob() semantics: source folders ending with '*' (e.g.
+    '03_RIEGL_RAW/02_RXP/**') are searched recursively, others only at their top
+    level, and hidden files and directories are skipped.
+
+    With 'count_all' set, the whole drive is walked instead (without following
+    symbolic links, as os.walk does), and every file on it is counted in 'file_count'.
+    This lets the drive be traversed once for both the file count and the copy.
+    The counters are updated as the scan runs.
+
+    >>> from client.copy import KISIK_TO_GEOBC
+    >>> entries = DriveScanner("/media/drive", KISIK_TO_GEOBC).scan()
+    """
+
+    def __init__(self, root: str, folder_mapping: FolderMapDefinition, count_all: bool = False):
+
+        """
+        Initialize a DriveScanner object.
+
+        :param root: Root of the drive (or directory) to scan.
+        :param folder_mapping: The folder mapping definition (e.g. 'from folder_map import KISIK_TO_GEOBC' )
+        :param count_all: Walk the whole drive, counting every file in 'file_count'.
+        """
+
+        self._root = root
+        self._root_key = self._key(root)
+        self._count_all = count_all
+        self._exact = {}      # dir -> extensions matched in the dir only
+        self._recursive = {}  # dir -> extensions matched in the dir and all its subdirectories
+        self._ancestors = set()
+        self._matchers = {}
+
+        # scan counters
+        self._file_count = 0
+        self._matched_count = 0
+        self._matched_bytes = 0
+
+        for folder in folder_mapping.keys():
+            sources = folder_mapping[folder][FolderMapKey.SOURCE_FOLDERS]
+            extensions = folder_mapping[folder][FolderMapKey.FILE_EXTENSIONS]
+
+            for source in sources:
+                is_recursive = source.endswith("*")
+                source_dir = self._key(os.path.join(root, source.rstrip("*")))
+                rules = self._recursive if is_recursive else self._exact
+                rules[source_dir] = rules.get(source_dir, frozenset()) | frozenset(extensions)
+                self._add_ancestors(source_dir)
+
+    @property
+    def root(self) -> str:
+
+        """Get the root property."""
+
+        return self._root
+
+    @property
+    def file_count(self) -> int:
+
+        """Get the file_count property (all files seen by the scan, see 'count_all')."""
+
+        return self._file_count
+
+    @property
+    def matched_count(self) -> int:
+
+        """Get the matched_count property (number of files matched by the folder mapping)."""
+
+        return self._matched_count
+
+    @property
+    def matched_bytes(self) -> int:
+
+        """Get the matched_bytes property (total size of the files matched by the folder mapping)."""
+
+        return self._matched_bytes
+
+    def scan(self) -> list[ScanEntry]:
+
+        """Scan the drive, returning all matching files."""
+
+        return list(self.iter_scan())
+
+    def iter_scan(self) -> Iterator[ScanEntry]:
+
+        """
+        Scan the drive, yielding matching files as they are found.
+
+        Unreadable directories are skipped.
+        """
+
+        self._file_count = self._matched_count = self._matched_bytes = 0
+
+        # (directory, inherited recursive extensions, whether the directory can hold matches)
+        stack = [(self._root, frozenset(), True)]
+        while stack:
+            cur_dir, inherited, matchable = stack.pop()
+            key = self._key(cur_dir)
+
+            recursive, matcher = frozenset(), None
+            if matchable:
+                recursive = inherited | self._recursive.get(key, frozenset())
+                matcher = self._matcher(recursive | self._exact.get(key, frozenset()))
+
+            try:
+                with os.scandir(cur_dir) as it:
+                    for entry in it:
+                        hidden = entry.name.startswith(".")
+                        if entry.is_dir():
+                            is_mapped = matchable and not hidden and (
+                                recursive or self._key(entry.path) in self._ancestors
+                            )
+                            if is_mapped:
+                                stack.append((entry.path, recursive, True))
+                            elif self._count_all and not entry.is_symlink():
+                                stack.append((entry.path, frozenset(), False))
+                            continue
+
+                        self._file_count += 1
+                        if hidden or not (matcher and matcher(entry.name)):
+                            continue
+
+                        try:
+                            stat = entry.stat()
+                        except OSError:  # e.g. broken symbolic link
+                            continue
+                        self._matched_count += 1
+                        self._matched_bytes += stat.st_size
+                        yield ScanEntry(entry.path, stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                continue
+
+    def _matcher(self, extensions: frozenset) -> Optional[_ExtMatcher]:
+
+        """Get the (cached) matcher of a set of extensions."""
+
+        if not extensions:
+            return None
+
+        if extensions not in self._matchers:
+            self._matchers[extensions] = _ExtMatcher(extensions)
+
+        return self._matchers[extensions]
+
+    def _add_ancestors(self, source_dir: str):
+
+        """Register 'source_dir' and its parents below the root as directories to visit."""
+
+        cur_dir = source_dir
+        while cur_dir != self._root_key and cur_dir not in self._ancestors:
+            self._ancestors.add(cur_dir)
+            parent = os.path.dirname(cur_dir)
+            if parent == cur_dir:  # 'source_dir' is not below the root
+                break
+            cur_dir = parent
+
+    @staticmethod
+    def _key(path: str) -> str:
+
+        """Normalize a directory path for lookups."""
+
+        return os.path.normcase(os.path.normpath(path))
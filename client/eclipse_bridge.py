@@ -1,6 +1,6 @@
 from entity import Delivery
 from copy import EclipseCopy
-from eclipse_request import EclipseRequest
+from eclipse_request import EclipseRequest, AsyncEclipseRequest
 
 
 class delivery:
@@ -23,7 +23,9 @@ class delivery:
 
     def checkDuplicates(self, entity):
         
-        ereq = EclipseRequest("GET", entity)
+        # filter on the server, only downloading the compared fields
+        params = {'receiver_name': self.receiver_name, 'date': self.date, 'fields': 'receiver_name,date'}
+        ereq = EclipseRequest("GET", entity, params)
         res = ereq.send()
 
         tempDict = {
@@ -31,9 +33,21 @@ class delivery:
                 'date': self.date
                     }
         for resDict in res:
-            resFiltered = {k:v for k,v in resDict.items() if k not in 'comments'}
-
-            if tempDict == resFiltered:
+            if tempDict == resDict:
                 return True
-        
-    
\ No newline at end of file
+
+
+def postRecords(*entityGroups, concurrency=AsyncEclipseRequest.CONCURRENCY):
+    """
+    Post independent groups of records (e.g. drives, sensor data, trajectories) concurrently.
+
+    Each group is a single Entity or a list of Entities of the same type. Returns the
+    response of each group, in order, in the same shape EclipseRequest.send() returns
+    (None for empty groups).
+    """
+
+    ereqs = [AsyncEclipseRequest("POST", group) for group in entityGroups if group]
+    ress = iter(AsyncEclipseRequest.send_all(*ereqs, concurrency=concurrency))
+
+    return [next(ress) if group else None for group in entityGroups]
+
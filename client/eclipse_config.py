@@ -1,5 +1,6 @@
 import os
 import sys
+import copy  # noqa: F401 (see the chdir below)
 import ctypes
 import psutil
 from stat import FILE_ATTRIBUTE_HIDDEN
@@ -54,9 +55,20 @@ class _Host:
     DEFAULT = LOOPBACK_ADDR
 
 
+class _Http:
+
+    """Defaults for the shared HTTP session used by EclipseRequest."""
+
+    POOL_SIZE = 10                        # Max pooled keep-alive connections to the server
+    TIMEOUT = (5.0, 120.0)                # (connect, read) timeout in seconds
+    RETRIES = 3                           # Retries on connection errors and RETRY_STATUS responses
+    BACKOFF = 0.5                         # Backoff factor (sleep = BACKOFF * 2 ** (retry - 1))
+    RETRY_STATUS = (502, 503, 504)        # Status codes retried for idempotent requests
+
+
 class NetworkConfig:
     """
-    Enum class encapsulating constants for Hostnames, IPs and, Port Numbers.
+    Enum class encapsulating constants for Hostnames, IPs, Port Numbers and HTTP settings.
 
     Accessing a port number:
     >>> NetworkConfig.PORT.DEFAULT
@@ -65,10 +77,14 @@ class NetworkConfig:
     Accessing a hostname or IP:
     >>> NetworkConfig.HOST.DEFAULT
     >>> NetworkConfig.HOST.LOCALHOST
+
+    Accessing HTTP session defaults:
+    >>> NetworkConfig.HTTP.TIMEOUT
     """
 
     PORT = _Port
     HOST = _Host
+    HTTP = _Http
 
 # ------------------------------------
 
@@ -101,6 +117,9 @@ class NativeOS:
 APP_DATA_DIR = "." + os.path.sep + "data"
 GEOBC_LOGO_DATA = "geobc_logo.b64"
 # Base64 encoding of the icon for the Province of BC
+# The working directory becomes the client directory: with '' on sys.path (e.g. 'python -c'),
+# the client 'copy' package would then shadow the stdlib module, which is imported above
+# so that later imports of it (e.g. by requests, through http.cookiejar) get the stdlib one.
 os.chdir(
     os.path.dirname(
         os.path.abspath(__file__)
@@ -131,7 +150,8 @@ def temp_hidden_dir(parent_dir):
     temp_dir = os.path.join(parent_dir, ECLIPSE_TEMP_DIR)
     if not os.path.isdir(temp_dir):
         os.mkdir(temp_dir)
-        ctypes.windll.kernel32.SetFileAttributesW(temp_dir, FILE_ATTRIBUTE_HIDDEN)
+        if hasattr(ctypes, "windll"):  # leading '.' already hides the directory elsewhere
+            ctypes.windll.kernel32.SetFileAttributesW(temp_dir, FILE_ATTRIBUTE_HIDDEN)
     return temp_dir
 
 
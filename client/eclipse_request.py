@@ -1,17 +1,25 @@
 # system imports
+import os
 import json
+import asyncio
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Union, Optional
 from urllib.parse import urljoin
 
 # user imports
-from eclipse_config import NetworkConfig
 try:
+    from client.eclipse_config import NetworkConfig
     from client.entity.entity import Entity
-    from client.entity.entity_attrs import ENTITY_ATTR_MAP
+    from client.entity.entity_attrs import ENTITY_ATTR_MAP, EntityName
+    from client.entity.sensor_data_batch import SensorDataBatch
 except ImportError:
+    from eclipse_config import NetworkConfig
     from entity.entity import Entity
-    from entity.entity_attrs import ENTITY_ATTR_MAP
+    from entity.entity_attrs import ENTITY_ATTR_MAP, EntityName
+    from entity.sensor_data_batch import SensorDataBatch
 
 
 class _EclipseHttpMethod:
@@ -20,7 +28,8 @@ class _EclipseHttpMethod:
 
     GET = "GET"
     POST = "POST"
-    LIST = [GET, POST]
+    PATCH = "PATCH"
+    LIST = [GET, POST, PATCH]
 
 
 class EclipseRequest:
@@ -31,7 +40,36 @@ class EclipseRequest:
     _HOST = NetworkConfig.HOST.DEFAULT
     _ENDPOINT = f"http://{_HOST}:{str(_PORT)}/eclipse/api/"
 
-    def __init__(self, http_method: str, entities: Union[Entity, list[Entity]], url_params: Optional[dict] = None):
+    # Entities whose endpoints accept a list of records at '<endpoint>/bulk/'
+    _BULK_ENTITIES = (EntityName.SENSOR_DATA, EntityName.LIDAR, EntityName.LIDAR_STRIP, EntityName.LIDAR_TILE)
+    _BULK_ENDPOINT = "bulk/"
+    BATCH_SIZE = 1000
+
+    # Query parameters accepted by every endpoint (field projection and cursor pagination)
+    _RESERVED_PARAMS = ("fields", "cursor", "page_size")
+
+    # Filter lookups accepted as query parameter suffixes (e.g. 'delivery_id__in')
+    _LOOKUPS = ("exact", "in", "range", "gte", "lte")
+
+    # Entities whose endpoints return GeoJSON and accept geometry filters
+    _SPATIAL_ENTITIES = (EntityName.LIDAR_TILE, EntityName.LIDAR_STRIP, EntityName.DERIVED_PRODUCT)
+    _SPATIAL_PARAMS = ("bbox", "intersects")
+
+    # Shared HTTP session (one per process, see session())
+    _session = None
+    _session_pid = None
+    _session_lock = threading.Lock()
+    _session_config = {
+        "pool_size": NetworkConfig.HTTP.POOL_SIZE,
+        "timeout": NetworkConfig.HTTP.TIMEOUT,
+        "retries": NetworkConfig.HTTP.RETRIES,
+        "backoff": NetworkConfig.HTTP.BACKOFF,
+    }
+
+    def __init__(
+            self, http_method: str, entities: Union[Entity, list[Entity]],
+            url_params: Optional[dict] = None, batch_size: int = BATCH_SIZE
+    ):
 
         """
         Initialize EclipseRequest object.
@@ -45,14 +83,33 @@ class EclipseRequest:
         >>> drive = Drive()
         >>> erq = EclipseRequest("GET", drive, params)
 
+        GET request returning only the 'id' and 'serial_number' fields of every drive:
+        >>> erq = EclipseRequest("GET", drive, {"fields": "id,serial_number"})
+
+        GET request filtered on the server with a lookup (see '_LOOKUPS'):
+        >>> erq = EclipseRequest("GET", drive, {"delivery_id__in": "1,2,3"})
+
+        GET request for the lidar tiles intersecting a polygon (returns a GeoJSON FeatureCollection):
+        >>> erq = EclipseRequest("GET", tile, {"intersects": "POLYGON((...))"})
+
         POST request for multiple drive entities:
         >>> from client.entity.drive import Drive
         >>> drives = [Drive(nas_id=1, delivery_id=1), Drive(nas_id=2, delivery_id=1), Drive(nas_id=3, delivery_id=1)]
         >>> erq = EclipseRequest("POST", drives, params=None)
 
+        PATCH request updating the record of a posted drive (one request per entity, to '<endpoint>/<id>/'):
+        >>> drive.id = 1
+        >>> erq = EclipseRequest("PATCH", drive)
+
+        POST request for a columnar batch of sensor data records (sent as JSON lines):
+        >>> from client.entity import SensorDataBatch
+        >>> erq = EclipseRequest("POST", SensorDataBatch.from_entries(entries, nas_id=1, delivery_id=1))
+
 
         :param http_method: A valid HTTP request method (e.g. 'GET', 'Get', 'gEt').
         :param entities: One or more objects that intherit from the Entity base class (e.g. Drive object)
+        :param url_params: Optional url query parameters (GET only).
+        :param batch_size: Max records per POST for entities with a bulk endpoint (e.g. SensorData).
         :raises ValueError:
         """
 
@@ -61,6 +118,11 @@ class EclipseRequest:
         self._endpoint = ""
         self._entities = None
         self._valid_params = None
+        self._is_bulk = False
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        self.batch_size = batch_size
 
         # Validate http method
         if http_method.upper() not in _EclipseHttpMethod.LIST:
@@ -71,6 +133,11 @@ class EclipseRequest:
         # call the entities setter
         self.entities = entities
 
+        if self.http_method == _EclipseHttpMethod.PATCH and any(
+                getattr(entity, "id", None) is None for entity in self._entities
+        ):
+            raise ValueError("PATCH requests require entities with an id")
+
         # validate url params
         if url_params and self._is_valid_params(url_params):
             self._url_params = url_params
@@ -78,7 +145,7 @@ class EclipseRequest:
             self._url_params = None
 
     @property
-    def data(self) -> list:
+    def data(self) -> Union[list, SensorDataBatch]:
 
         """Get EclipseRequest 'data' property."""
 
@@ -146,8 +213,83 @@ class EclipseRequest:
 
         e_ref = self._entities[0]
         self._endpoint = self._ENDPOINT + e_ref.name + "/"
-        self._valid_params = ENTITY_ATTR_MAP[e_ref.name]
-        self._data = [e.serialize(as_dict=True) for e in self.entities]
+        self._is_bulk = e_ref.name in self._BULK_ENTITIES
+        self._valid_params = ENTITY_ATTR_MAP[e_ref.name] or ()
+        if e_ref.name in self._SPATIAL_ENTITIES:
+            self._valid_params += self._SPATIAL_PARAMS
+
+        # batches are kept columnar, and serialized per chunk when posted
+        if isinstance(e_ref, SensorDataBatch):
+            if len(self._entities) > 1:
+                raise ValueError("Only one SensorDataBatch can be sent per request")
+            self._data = e_ref
+        else:
+            self._data = [e.serialize(as_dict=True) for e in self.entities]
+
+    @classmethod
+    def session(cls) -> requests.Session:
+
+        """
+        Get the HTTP session shared by all EclipseRequest instances.
+
+        The session keeps connections to the server alive in a pool, and retries
+        connection errors (and gateway errors for GET requests) with exponential backoff.
+        A new session is created after a fork, since pooled sockets can't be shared
+        across processes.
+
+        :return: The shared requests.Session.
+        """
+
+        pid = os.getpid()
+        if cls._session is None or cls._session_pid != pid:
+            with cls._session_lock:
+                if cls._session is None or cls._session_pid != pid:
+                    config = cls._session_config
+                    cls._session = cls._create_session(config["pool_size"], config["retries"], config["backoff"])
+                    cls._session_pid = pid
+
+        return cls._session
+
+    @classmethod
+    def configure_session(
+            cls, pool_size: Optional[int] = None, timeout: Optional[Union[float, tuple]] = None,
+            retries: Optional[int] = None, backoff: Optional[float] = None
+    ):
+
+        """
+        Configure the shared HTTP session. Arguments left as None keep their current value.
+
+        The existing session (if any) is closed, and a new one is created on next use.
+
+        :param pool_size: Max number of pooled keep-alive connections.
+        :param timeout: Request timeout in seconds, or a (connect, read) tuple.
+        :param retries: Max number of retries.
+        :param backoff: Retry backoff factor.
+        """
+
+        config = {"pool_size": pool_size, "timeout": timeout, "retries": retries, "backoff": backoff}
+        with cls._session_lock:
+            cls._session_config.update({k: v for k, v in config.items() if v is not None})
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
+
+    @staticmethod
+    def _create_session(pool_size: int, retries: int, backoff: float) -> requests.Session:
+
+        """Create a pooled requests.Session with retries."""
+
+        retry = Retry(
+            total=retries, backoff_factor=backoff,
+            status_forcelist=NetworkConfig.HTTP.RETRY_STATUS, raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
 
     def send(self) -> Union[dict, None]:
 
@@ -163,6 +305,8 @@ class EclipseRequest:
                 res = self._get(self.endpoint, self.url_params)
             elif self.http_method == _EclipseHttpMethod.POST:
                 res = self._post(self.endpoint, self.data)
+            elif self.http_method == _EclipseHttpMethod.PATCH:
+                res = self._patch(self.endpoint, self.data)
         except requests.RequestException as e:
             print(f"Request failed: {e}")
         except json.JSONDecodeError:
@@ -170,38 +314,178 @@ class EclipseRequest:
 
         return res
 
-    def _get(self, endpoint: str, params: Optional[dict]) -> str:
+    @staticmethod
+    def is_created(res: Optional[list]) -> bool:
+
+        """
+        Check that a POST response holds created records, not errors.
+
+        Each rejected bulk chunk adds an error object ({"errors": ...} or {"detail": ...})
+        to the response, so a response can be truthy and still hold no created record.
+        """
+
+        return bool(res) and not EclipseRequest.errors(res)
+
+    @staticmethod
+    def errors(res: Optional[list]) -> list[dict]:
+
+        """Get the error objects of a POST response (one per rejected request)."""
+
+        return [
+            record for record in res or []
+            if isinstance(record, dict) and ("errors" in record or "detail" in record)
+        ]
+
+    @staticmethod
+    def created_records(res: Optional[list]) -> list[dict]:
+
+        """Get the created records of a POST response (GeoJSON responses list their features)."""
+
+        records = []
+        for record in res or []:
+            if isinstance(record, dict) and "features" in record:
+                records.extend(record["features"])
+            elif isinstance(record, dict) and "id" in record:
+                records.append(record)
+
+        return records
+
+    def _get(self, endpoint: str, params: Optional[dict]) -> Union[list, dict]:
 
         """
         Generic GET request handler.
 
+        List endpoints are paginated by the server: the 'next' link of each page
+        is followed until the last page, and the results of all pages are returned.
+        For GeoJSON endpoints, a FeatureCollection holding the features of all pages
+        is returned.
+
         :param endpoint: API endpoint.
         :param params: A valid url query params dictionary.
         :return:
         """
 
         url = urljoin(self._ENDPOINT, endpoint)
-        res = requests.get(url, params=params)
-        return res.json()
+        session = self.session()
+        timeout = self._session_config["timeout"]
+
+        res = session.get(url, params=params, timeout=timeout).json()
+        key = self._page_key(res)
+        if key is None:
+            return res
+
+        results = list(res[key])
+        while res["next"]:
+            # the 'next' link already holds the query params and the cursor
+            res = session.get(res["next"], timeout=timeout).json()
+            results.extend(res[key])
+
+        if key == "features":
+            return {"type": "FeatureCollection", "features": results}
+
+        return results
+
+    @staticmethod
+    def _page_key(res: Union[list, dict]) -> Optional[str]:
+
+        """Get the key holding the records of a paginated GET response, or None if not paginated."""
+
+        if not isinstance(res, dict) or "next" not in res:
+            return None
+
+        for key in ("results", "features"):
+            if key in res:
+                return key
+
+        return None
 
     def _post(self, endpoint: str, data: Union[list[str], list[dict]]) -> list:
 
         """
         Generic POST request handler.
 
+        Records for entities with a bulk endpoint are sent in chunks of 'batch_size',
+        one request per chunk. All other records are sent one request per record.
+
         :param endpoint: API endpoint.
         :param data: A valid url query params dictionary.
         :return:
         """
 
         ress = []
-        url = urljoin(self._ENDPOINT, endpoint)
-        for _data in data:
-            res = requests.post(url, json=_data)
-            ress.append(res.json())
+        session = self.session()
+        timeout = self._session_config["timeout"]
+        for url, payload in self._post_payloads(endpoint, data):
+            res = session.post(url, timeout=timeout, **self._body(payload))
+            self._collect(ress, res.json())
+
+        return ress
+
+    def _patch(self, endpoint: str, data: list[dict]) -> list:
+
+        """
+        Generic PATCH request handler: one request per entity, to the url of its record.
+
+        Rejected updates are wrapped as {"errors": ...}, like the rejected bulk POSTs.
+
+        :param endpoint: API endpoint.
+        :param data: Serialized entities (in the order of 'entities').
+        :return: A list of the updated records and errors.
+        """
+
+        ress = []
+        session = self.session()
+        timeout = self._session_config["timeout"]
+        for entity, payload in zip(self._entities, data):
+            url = urljoin(urljoin(self._ENDPOINT, endpoint), f"{entity.id}/")
+            res = session.patch(url, json=payload, timeout=timeout)
+            self._collect(ress, res.json() if res.ok else {"errors": res.json()})
 
         return ress
 
+    def _post_payloads(self, endpoint: str, data: Union[list[str], list[dict], SensorDataBatch]) -> list[tuple]:
+
+        """
+        Split POST data into (url, payload) pairs, one per HTTP request.
+
+        A SensorDataBatch is always sent to the bulk endpoint, each chunk encoded as JSON lines.
+
+        :param endpoint: API endpoint.
+        :param data: Serialized entities, or a SensorDataBatch.
+        :return: A list of (url, payload) tuples.
+        """
+
+        url = urljoin(self._ENDPOINT, endpoint)
+        if isinstance(data, SensorDataBatch):
+            url = urljoin(url, self._BULK_ENDPOINT)
+            return [(url, chunk.to_jsonl()) for chunk in data.chunks(self.batch_size)]
+
+        if self._is_bulk and len(data) > 1:
+            url = urljoin(url, self._BULK_ENDPOINT)
+            return [(url, data[i:i + self.batch_size]) for i in range(0, len(data), self.batch_size)]
+
+        return [(url, _data) for _data in data]
+
+    @staticmethod
+    def _body(payload: Union[list, dict, bytes]) -> dict:
+
+        """Get the request body arguments of a POST payload (bytes payloads are pre-encoded JSON lines)."""
+
+        if isinstance(payload, bytes):
+            return {"data": payload, "headers": {"Content-Type": SensorDataBatch.JSONL_CONTENT_TYPE}}
+
+        return {"json": payload}
+
+    @staticmethod
+    def _collect(ress: list, res: Union[list, dict]):
+
+        """Append a POST response to 'ress' (bulk responses list created records, errors are a single object)."""
+
+        if isinstance(res, list):
+            ress.extend(res)
+        else:
+            ress.append(res)
+
     def _is_valid_params(self, params: dict) -> bool:
 
         """
@@ -215,8 +499,166 @@ class EclipseRequest:
         if not params:
             return False
 
-        params_in = set(params.keys())
-        params_valid = set(self._valid_params)
+        params_in = {self._strip_lookup(param) for param in params.keys()}
+        params_valid = set(self._valid_params).union(self._RESERVED_PARAMS)
         params_diff = list(params_in.difference(params_valid))
 
         return len(params_diff) == 0
+
+    def _strip_lookup(self, param: str) -> str:
+
+        """Strip a filter lookup suffix from a query parameter (e.g. 'nas_id__in' -> 'nas_id')."""
+
+        name, sep, lookup = param.rpartition("__")
+        return name if sep and lookup in self._LOOKUPS else param
+
+
+class AsyncEclipseRequest(EclipseRequest):
+
+    """
+    Asyncio variant of EclipseRequest. Sends the HTTP requests of one or more
+    EclipseRequests concurrently, with a bound on the number in flight.
+
+    Requests are issued on worker threads through the shared, pooled session
+    (see EclipseRequest.session()), so the concurrency should not exceed the pool size.
+
+    Post sensor data records and lidar records concurrently:
+    >>> sensor_req = AsyncEclipseRequest("POST", sensor_records)
+    >>> lidar_req = AsyncEclipseRequest("POST", lidar_records)
+    >>> sensor_res, lidar_res = AsyncEclipseRequest.send_all(sensor_req, lidar_req)
+    """
+
+    CONCURRENCY = NetworkConfig.HTTP.POOL_SIZE
+
+    def __init__(
+            self, http_method: str, entities: Union[Entity, list[Entity]],
+            url_params: Optional[dict] = None, batch_size: int = EclipseRequest.BATCH_SIZE,
+            concurrency: int = CONCURRENCY
+    ):
+
+        """
+        Initialize AsyncEclipseRequest object.
+
+        :param http_method: A valid HTTP request method (e.g. 'GET', 'Get', 'gEt').
+        :param entities: One or more objects that intherit from the Entity base class (e.g. Drive object)
+        :param url_params: Optional url query parameters (GET only).
+        :param batch_size: Max records per POST for entities with a bulk endpoint (e.g. SensorData).
+        :param concurrency: Max number of HTTP requests in flight when sent on its own.
+        :raises ValueError:
+        """
+
+        super().__init__(http_method, entities, url_params, batch_size)
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self.concurrency = concurrency
+
+    async def send_async(self, semaphore: Optional[asyncio.Semaphore] = None) -> Union[list, dict, None]:
+
+        """
+        Async send handler for eclipse_request.
+
+        :param semaphore: Optional semaphore shared with other requests to bound concurrency.
+        :return: The same response send() would return, or None on failure.
+        """
+
+        semaphore = semaphore or asyncio.Semaphore(self.concurrency)
+
+        res = None
+        try:
+            if self.http_method == _EclipseHttpMethod.GET:
+                async with semaphore:
+                    res = await asyncio.to_thread(self._get, self.endpoint, self.url_params)
+            elif self.http_method == _EclipseHttpMethod.POST:
+                res = await self._post_async(self.endpoint, self.data, semaphore)
+            elif self.http_method == _EclipseHttpMethod.PATCH:
+                async with semaphore:
+                    res = await asyncio.to_thread(self._patch, self.endpoint, self.data)
+        except requests.RequestException as e:
+            print(f"Request failed: {e}")
+        except json.JSONDecodeError:
+            print("Failed to parse JSON response")
+
+        return res
+
+    async def _post_async(
+            self, endpoint: str, data: Union[list[str], list[dict], SensorDataBatch], semaphore: asyncio.Semaphore
+    ) -> list:
+
+        """
+        Concurrent POST request handler. Responses are collected in request order.
+
+        :param endpoint: API endpoint.
+        :param data: Serialized entities.
+        :param semaphore: Semaphore bounding the number of requests in flight.
+        :return:
+        """
+
+        session = self.session()
+        timeout = self._session_config["timeout"]
+
+        async def post(url: str, payload: Union[list, dict, bytes]) -> Union[list, dict]:
+            async with semaphore:
+                res = await asyncio.to_thread(session.post, url, timeout=timeout, **self._body(payload))
+            return res.json()
+
+        responses = await asyncio.gather(
+            *(post(url, payload) for url, payload in self._post_payloads(endpoint, data))
+        )
+
+        ress = []
+        for res in responses:
+            self._collect(ress, res)
+
+        return ress
+
+    @staticmethod
+    async def gather(*requests_: "AsyncEclipseRequest", concurrency: int = CONCURRENCY) -> list:
+
+        """
+        Send several requests concurrently, sharing one concurrency bound.
+
+        :param requests_: AsyncEclipseRequest objects.
+        :param concurrency: Max number of HTTP requests in flight across all requests.
+        :return: A list holding the response of each request, in order.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+        return list(await asyncio.gather(*(erq.send_async(semaphore) for erq in requests_)))
+
+    @classmethod
+    def send_all(cls, *requests_: "AsyncEclipseRequest", concurrency: int = CONCURRENCY) -> list:
+
+        """
+        Blocking wrapper of gather() for synchronous callers (e.g. EclipseCopy).
+
+        asyncio.run() can't be nested: if the caller's thread already runs an event loop
+        (e.g. a notebook), the requests run on their own loop in a helper thread, which
+        blocks the caller's loop until they are done. Coroutines should await gather().
+
+        :param requests_: AsyncEclipseRequest objects.
+        :param concurrency: Max number of HTTP requests in flight across all requests.
+        :return: A list holding the response of each request, in order.
+        """
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(cls.gather(*requests_, concurrency=concurrency))
+
+        result = {}
+
+        def run():
+            try:
+                result["ress"] = asyncio.run(cls.gather(*requests_, concurrency=concurrency))
+            except BaseException as err:
+                result["err"] = err
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join()
+
+        if "err" in result:
+            raise result["err"]
+
+        return result["ress"]
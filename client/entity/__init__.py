@@ -2,6 +2,10 @@ __all__ = [
     "Drive",
     "Delivery",
     "SensorData",
+    "SensorDataBatch",
+    "Lidar",
+    "LidarStrip",
+    "LidarTile",
     "Nasbox",
     "NasboxLinux",
     "NasboxWindows"
@@ -10,5 +14,9 @@ __all__ = [
 from .drive import Drive
 from .delivery import Delivery
 from .sensor_data import SensorData
+from .sensor_data_batch import SensorDataBatch
+from .lidar import Lidar
+from .lidar_strip import LidarStrip
+from .lidar_tile import LidarTile
 from .nasbox import Nasbox, NasboxLinux, NasboxWindows
 from .entity_attrs import EntityName, EntityAttributes, ENTITY_ATTR_MAP
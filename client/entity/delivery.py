@@ -6,7 +6,7 @@ class Delivery(Entity):
 
     def __init__(self, receiver_name, date, comments):
         super().__init__()
-        Entity.name = EntityName.DELIVERY
+        self._name = EntityName.DELIVERY
         self.receiver_name_ = receiver_name
         self.date_ = date
         self.comments_ = comments
@@ -39,6 +39,18 @@ class Drive(Entity):
         self.nas_id_ = nas_id
         self.delivery_id_ = delivery_id
 
+        self._file_bytes = -1
+        self._id = None
+
+    # -- ID (of the posted record, not serialized)
+    @property
+    def id(self) -> Optional[int]:
+        return self._id
+
+    @id.setter
+    def id(self, record_id: Optional[int]):
+        self._id = record_id
+
     # -- DRIVE_PATH
     @property
     def drive_path(self):
@@ -121,9 +133,24 @@ class Drive(Entity):
     def storage_used_gb(self):
         return self.storage_used_gb_
 
-    def set_drive_info(self, drive_path: Optional[str] = None):
+    @property
+    def file_bytes(self) -> int:
+
+        """Get the file_bytes property (total size of the files selected for copy, -1 if unknown)."""
+
+        return self._file_bytes
 
-        """Set the storage_used_gb and storage_total_gb properties."""
+    def set_drive_info(
+            self, drive_path: Optional[str] = None, file_count: Optional[int] = None, file_bytes: Optional[int] = None
+    ):
+
+        """
+        Set the storage_used_gb and storage_total_gb properties.
+
+        The 'file_count' and 'file_bytes' arguments take counts from an existing
+        scan of the drive (e.g. DriveScanner with 'count_all'). If 'file_count'
+        is not passed, the drive is walked to count its files.
+        """
 
         # update the drive path if passed as arg
         if drive_path:
@@ -131,12 +158,18 @@ class Drive(Entity):
 
         # otherwise, use the existing drive path.
         if self.drive_path_ and os.path.exists(self.drive_path_):
-            self.file_count = 0      # setter looks at drive path when passed an empty string.
+            if file_count is not None:
+                self.file_count_ = file_count
+            else:
+                self.file_count = 0  # setter looks at drive path when passed 0.
             self.serial_number = ""  # setter looks at drive path when passed an empty string.
             usage = shutil.disk_usage(self.drive_path_)
             self.storage_total_gb_ = round(usage.total / (1024 ** 3), 2)
             self.storage_used_gb_ = round(usage.used / (1024 ** 3), 2)
 
+        if file_bytes is not None:
+            self._file_bytes = file_bytes
+
     @property
     def file_count(self):
         return self.file_count_
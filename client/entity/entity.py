@@ -1,9 +1,12 @@
 import json
+from functools import lru_cache
 from typing import Union
 
 
 class Entity(object):
 
+    __slots__ = ("_name",)
+
     def __init__(self):
 
         self._name = ""
@@ -20,5 +23,24 @@ class Entity(object):
         """
         Serialize the object to a JSON-formatted string.
         """
-        data = {k[:-1]: v for k, v in self.__dict__.items() if not k.startswith('_')}
+        data = {k[:-1]: v for k, v in self._attrs().items() if not k.startswith('_')}
         return data if as_dict else json.dumps(data, indent=4)
+
+    def _attrs(self) -> dict:
+        """
+        Get the instance attributes, from both __slots__ and __dict__.
+        """
+        attrs = {slot: getattr(self, slot) for slot in self._slot_names(type(self)) if hasattr(self, slot)}
+        attrs.update(getattr(self, "__dict__", {}))
+        return attrs
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _slot_names(cls: type) -> tuple:
+        """
+        Get the __slots__ declared by a class and its bases.
+        """
+        return tuple(
+            slot for base in reversed(cls.__mro__)
+            for slot in base.__dict__.get("__slots__", ())
+        )
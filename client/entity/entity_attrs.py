@@ -12,10 +12,10 @@ class EntityName:
     UTM_ZONE = "utmzone"
     DELIVERY = "delivery"
     BCGS2500K = "bcgs2500k"
-    LIDAR_STRIP = "lidarraw"
+    LIDAR_STRIP = "lidarstrip"
     TRAJECTORY = "trajectory"
     SENSOR_DATA = "sensordata"
-    LIDAR_TILE = "lidarclassified"
+    LIDAR_TILE = "lidartile"
     DERIVED_PRODUCT = "derivedproduct"
     PROCESSING_STATUS = "processingstatus"
     SPATIAL_REFERENCE = "spatialreference"
@@ -27,18 +27,20 @@ class EntityAttributes:
 
     DRIVE = ("file_count", "serial_number", "storage_total_gb", "storage_used_gb", "nas_id", "delivery_id")
     EPOCH = None
-    LIDAR = None
+    LIDAR = (
+        "id", "file_name", "lidar_type", "version", "point_record_format", "epsg_code", "nas_id", "trajectory_id"
+    )
     NASBOX = None
     ECLIPSE = None
     BCGS20K = None
     UTM_ZONE = None
     TRAJECTORY = None
-    SENSOR_DATA = ("file_path", "file_name", "file_size", "delivery_id", "nas_id", "trajectory_id")
-    DELIVERY = ("receiver_name", "comments", "timestamp")
-    LIDAR_RAW = None
+    SENSOR_DATA = ("file_path", "file_name", "file_size", "checksum", "delivery_id", "nas_id", "trajectory_id")
+    DELIVERY = ("receiver_name", "comments", "date")
+    LIDAR_RAW = ("id", "file_source_id")
     BCGS2500K = None
-    DERIVED_PRODUCT = None
-    LIDAR_CLASSIFIED = None
+    DERIVED_PRODUCT = ("id", "derived_product_type", "file_name", "epsg_code", "nas", "tile_20k")
+    LIDAR_CLASSIFIED = ("id", "tile_2500k")
     PROCESSING_STATUS = None
     SPATIAL_REFERENCE = None
 
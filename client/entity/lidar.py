@@ -0,0 +1,148 @@
+import os
+from typing import Optional
+
+from .entity import Entity
+from .entity_attrs import EntityName
+from .sensor_data import GB_CONVERT
+
+
+class Lidar(Entity):
+
+    # Compact representation: deliveries can hold tens of thousands of LAS/LAZ files.
+    __slots__ = (
+        "file_name_", "file_path_", "file_size_", "x_min_", "x_max_", "y_min_", "y_max_",
+        "lidar_type_", "version_", "point_record_format_", "epsg_code_", "nas_id_", "trajectory_id_"
+    )
+
+    # Decimal places of the extent columns on the server
+    EXTENT_DECIMALS = 3
+
+    def __init__(
+            self, file_path: str = "", file_size: Optional[int] = None, nas_id: Optional[int] = None,
+            trajectory_id: Optional[int] = None, lidar_type: Optional[str] = None
+    ):
+
+        """
+        Initialize a Lidar object.
+
+        The header fields (extent, version, point record format and EPSG code) are left
+        unset; see from_header() to create a record from a harvested LAS/LAZ header.
+
+        :param file_path: Path of the LAS/LAZ file.
+        :param file_size: Size of the file (bytes).
+        :param nas_id: The id number of the NASbox holding the file.
+        :param trajectory_id: The id number of the trajectory associated with the file.
+        :param lidar_type: Single character LiDAR type code.
+        """
+
+        super().__init__()
+        self._name = EntityName.LIDAR
+
+        self.file_path_ = file_path
+        self.file_name_ = os.path.basename(file_path)
+        self.file_size_ = file_size / GB_CONVERT if file_size is not None else None
+
+        self.x_min_ = None
+        self.x_max_ = None
+        self.y_min_ = None
+        self.y_max_ = None
+        self.version_ = None
+        self.point_record_format_ = None
+        self.epsg_code_ = None
+
+        self.lidar_type_ = lidar_type
+        self.nas_id_ = nas_id
+        self.trajectory_id_ = trajectory_id
+
+    @classmethod
+    def from_header(
+            cls, header, nas_id: Optional[int] = None, trajectory_id: Optional[int] = None,
+            lidar_type: Optional[str] = None
+    ) -> "Lidar":
+
+        """
+        Create a Lidar object from a harvested LAS/LAZ header, without touching the file system.
+
+        :param header: A LasHeaderInfo (see lidar.read_las_header()).
+        :param nas_id: The id number of the NASbox holding the file.
+        :param trajectory_id: The id number of the trajectory associated with the file.
+        :param lidar_type: Single character LiDAR type code.
+        """
+
+        lidar = cls(header.path, header.size, nas_id, trajectory_id, lidar_type)
+        lidar.set_extent(header.x_min, header.x_max, header.y_min, header.y_max)
+        lidar.version_ = header.version
+        lidar.point_record_format_ = header.point_format
+        lidar.epsg_code_ = header.epsg_code
+
+        return lidar
+
+    @property
+    def file_name(self) -> str:
+        return self.file_name_
+
+    @property
+    def file_path(self) -> str:
+        return self.file_path_
+
+    @property
+    def file_size(self) -> Optional[float]:
+
+        """Get the file_size property (GB)."""
+
+        return self.file_size_
+
+    @property
+    def extent(self) -> tuple:
+
+        """Get the (x_min, x_max, y_min, y_max) extent of the points."""
+
+        return self.x_min_, self.x_max_, self.y_min_, self.y_max_
+
+    def set_extent(self, x_min: float, x_max: float, y_min: float, y_max: float):
+
+        """Set the extent of the points, rounded to the precision stored by the server."""
+
+        self.x_min_, self.x_max_, self.y_min_, self.y_max_ = (
+            round(float(v), self.EXTENT_DECIMALS) for v in (x_min, x_max, y_min, y_max)
+        )
+
+    @property
+    def version(self) -> Optional[float]:
+        return self.version_
+
+    @property
+    def point_record_format(self) -> Optional[int]:
+        return self.point_record_format_
+
+    @property
+    def epsg_code(self) -> Optional[int]:
+        return self.epsg_code_
+
+    @epsg_code.setter
+    def epsg_code(self, epsg_code: Optional[int]):
+        self.epsg_code_ = epsg_code
+
+    @property
+    def lidar_type(self) -> Optional[str]:
+        return self.lidar_type_
+
+    @lidar_type.setter
+    def lidar_type(self, lidar_type: Optional[str]):
+        self.lidar_type_ = lidar_type
+
+    @property
+    def nas_id(self) -> Optional[int]:
+        return self.nas_id_
+
+    @nas_id.setter
+    def nas_id(self, nas_id: int):
+        self.nas_id_ = nas_id
+
+    @property
+    def trajectory_id(self) -> Optional[int]:
+        return self.trajectory_id_
+
+    @trajectory_id.setter
+    def trajectory_id(self, trajectory_id: int):
+        self.trajectory_id_ = trajectory_id
@@ -0,0 +1,54 @@
+from typing import Optional
+
+from .entity import Entity
+from .entity_attrs import EntityName
+
+
+class LidarStrip(Entity):
+
+    __slots__ = ("id_", "convex_hull_", "file_source_id_")
+
+    def __init__(self, lidar_id: int, convex_hull: Optional[dict] = None, file_source_id: Optional[int] = None):
+
+        """
+        Initialize a LidarStrip object.
+
+        :param lidar_id: The id number of the Lidar record of the strip.
+        :param convex_hull: The convex hull of the strip points, as a GeoJSON Polygon (EPSG:3005).
+        :param file_source_id: The file source id (flight line) from the LAS header.
+        """
+
+        super().__init__()
+        self._name = EntityName.LIDAR_STRIP
+
+        self.id_ = lidar_id
+        self.convex_hull_ = convex_hull
+        self.file_source_id_ = file_source_id
+
+    @classmethod
+    def from_hull(cls, hull, lidar_id: int) -> "LidarStrip":
+
+        """
+        Create a LidarStrip object from a computed hull.
+
+        :param hull: A StripHull (see lidar.read_strip_hull()).
+        :param lidar_id: The id number of the Lidar record of the strip.
+        """
+
+        return cls(lidar_id, hull.geojson(), hull.file_source_id)
+
+    @property
+    def id(self) -> int:
+        return self.id_
+
+    @property
+    def convex_hull(self) -> Optional[dict]:
+        return self.convex_hull_
+
+    @convex_hull.setter
+    def convex_hull(self, convex_hull: dict):
+        self.convex_hull_ = convex_hull
+
+    @property
+    def file_source_id(self) -> Optional[int]:
+        return self.file_source_id_
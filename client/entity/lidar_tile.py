@@ -0,0 +1,61 @@
+from typing import Optional
+
+from .entity import Entity
+from .entity_attrs import EntityName
+
+
+class LidarTile(Entity):
+
+    __slots__ = ("id_", "bounding_box_", "footprint_", "density_")
+
+    def __init__(
+            self, lidar_id: int, bounding_box: Optional[dict] = None, footprint: Optional[dict] = None,
+            density: Optional[dict] = None
+    ):
+
+        """
+        Initialize a LidarTile object.
+
+        The BCGS 2500k tile is assigned by the database from the footprint.
+
+        :param lidar_id: The id number of the Lidar record of the tile.
+        :param bounding_box: The extent of the tile, as a GeoJSON Polygon (EPSG:3005).
+        :param footprint: The area covered by the tile points, as a GeoJSON MultiPolygon (EPSG:3005).
+        :param density: The point count grid of the tile.
+        """
+
+        super().__init__()
+        self._name = EntityName.LIDAR_TILE
+
+        self.id_ = lidar_id
+        self.bounding_box_ = bounding_box
+        self.footprint_ = footprint
+        self.density_ = density
+
+    @classmethod
+    def from_footprint(cls, footprint, lidar_id: int) -> "LidarTile":
+
+        """
+        Create a LidarTile object from a computed footprint.
+
+        :param footprint: A TileFootprint (see lidar.read_tile_footprint()).
+        :param lidar_id: The id number of the Lidar record of the tile.
+        """
+
+        return cls(lidar_id, footprint.bounding_box, footprint.footprint, footprint.density)
+
+    @property
+    def id(self) -> int:
+        return self.id_
+
+    @property
+    def bounding_box(self) -> Optional[dict]:
+        return self.bounding_box_
+
+    @property
+    def footprint(self) -> Optional[dict]:
+        return self.footprint_
+
+    @property
+    def density(self) -> Optional[dict]:
+        return self.density_
@@ -10,22 +10,55 @@ GB_CONVERT = (1024 * 1024 * 1024)
 
 class SensorData(Entity):
 
-    def __init__(self, nas_id: Optional[int] = -1, delivery_id: int = -1, file_path: Optional[str] = ""):
+    # Compact representation: deliveries can hold hundreds of thousands of records.
+    __slots__ = ("nas_id_", "delivery_id_", "file_path_", "file_name_", "file_size_", "checksum_", "_mtime")
+
+    def __init__(
+            self, nas_id: Optional[int] = -1, delivery_id: int = -1, file_path: Optional[str] = "",
+            file_size: Optional[int] = None, mtime: Optional[int] = None
+    ):
+
+        """
+        Initialize a SensorData object.
+
+        If 'file_size' is passed (e.g. from a cached stat result, see from_entry()),
+        the file is not stat'ed again.
+
+        :param nas_id: The id number of the NASbox holding the file.
+        :param delivery_id: The id number of the delivery associated with the file.
+        :param file_path: Path of the file.
+        :param file_size: Precomputed size of the file (bytes).
+        :param mtime: Precomputed modification time of the file (ns).
+        :raises FileNotFoundError:
+        """
+
         super().__init__()
-        Entity.name = EntityName.SENSOR_DATA
+        self._name = EntityName.SENSOR_DATA
 
         self.nas_id_ = nas_id
         self.delivery_id_ = delivery_id
+        self.checksum_ = ""
+
+        self.file_path_ = ""
+        self.file_name_ = ""
+        self.file_size_ = float("nan")
+        self._mtime = mtime
 
         if file_path:
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"No such path: '{file_path}'")
-            self.file_path_ = file_path
-            self.file_name_ = os.path.basename(file_path)
-            self.file_size_ = os.path.getsize(file_path) / GB_CONVERT
-        else:
-            self.file_name_ = ""
-            self.file_size_ = float("nan")
+            self._set_file(file_path, file_size, mtime)
+
+    @classmethod
+    def from_entry(cls, entry, nas_id: Optional[int] = -1, delivery_id: int = -1) -> "SensorData":
+
+        """
+        Create a SensorData object from a scanned file entry, without touching the file system.
+
+        :param entry: An object with 'path', 'size' (bytes) and 'mtime' (ns) attributes (e.g. ScanEntry).
+        :param nas_id: The id number of the NASbox holding the file.
+        :param delivery_id: The id number of the delivery associated with the file.
+        """
+
+        return cls(nas_id, delivery_id, entry.path, entry.size, entry.mtime)
 
     @property
     def nas_id(self) -> int:
@@ -51,15 +84,38 @@ class SensorData(Entity):
     def file_size(self) -> float:
         return self.file_size_
 
+    @property
+    def mtime(self) -> Optional[int]:
+        return self._mtime
+
+    @property
+    def checksum(self) -> str:
+        return self.checksum_
+
+    @checksum.setter
+    def checksum(self, checksum: str):
+        self.checksum_ = checksum
+
     @property
     def file_path(self) -> str:
         return self.file_path_
 
     @file_path.setter
     def file_path(self, file_path: str):
-        if os.path.exists(file_path):
-            self.file_path_ = file_path
-            self.file_name_ = os.path.basename(file_path)
-            self.file_size_ = os.path.getsize(file_path) / GB_CONVERT
-        else:
-            raise FileNotFoundError(f"No such path: '{file_path}'")
+        self._set_file(file_path)
+
+    def _set_file(self, file_path: str, file_size: Optional[int] = None, mtime: Optional[int] = None):
+
+        """Set the file properties, with a single stat call if 'file_size' is not passed."""
+
+        if file_size is None:
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"No such path: '{file_path}'")
+            file_size, mtime = stat.st_size, stat.st_mtime_ns
+
+        self.file_path_ = file_path
+        self.file_name_ = os.path.basename(file_path)
+        self.file_size_ = file_size / GB_CONVERT
+        self._mtime = mtime
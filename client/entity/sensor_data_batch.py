@@ -0,0 +1,294 @@
+import os
+import json
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from .entity import Entity
+from .entity_attrs import EntityName
+from .sensor_data import SensorData, GB_CONVERT
+
+
+class SensorDataBatch(Entity):
+
+    """
+    Columnar container of SensorData records.
+
+    Holds the records of a delivery as parallel columns (numpy arrays for the
+    numeric fields) instead of one SensorData object per file. Foreign keys are
+    assigned to all records at once, and the batch serializes straight to a
+    bulk payload (JSON lines or Arrow IPC) without building per-record dicts.
+
+    >>> batch = SensorDataBatch.from_entries(scanner.scan(), nas_id=1)
+    >>> batch.set_delivery_id(4)
+    >>> payload = batch.to_jsonl()
+    """
+
+    __slots__ = ("_file_paths", "_file_sizes", "_mtimes", "_checksums", "_nas_ids", "_delivery_ids")
+
+    JSONL_CONTENT_TYPE = "application/x-ndjson"
+
+    def __init__(
+            self, file_paths: Iterable[str] = (), file_sizes: Optional[Iterable[int]] = None,
+            mtimes: Optional[Iterable[int]] = None, checksums: Optional[Iterable[str]] = None,
+            nas_id: Optional[int] = -1, delivery_id: int = -1
+    ):
+
+        """
+        Initialize a SensorDataBatch object.
+
+        If 'file_sizes' is not passed, every file is stat'ed once (see from_entries()
+        to build a batch from cached stat results instead).
+
+        :param file_paths: Paths of the files.
+        :param file_sizes: Sizes of the files (bytes).
+        :param mtimes: Modification times of the files (ns).
+        :param checksums: Checksums of the files ('' if unknown).
+        :param nas_id: The id number of the NASbox holding the files.
+        :param delivery_id: The id number of the delivery associated with the files.
+        :raises FileNotFoundError:
+        :raises ValueError: If the columns are not the same length.
+        """
+
+        super().__init__()
+        self._name = EntityName.SENSOR_DATA
+
+        self._file_paths = list(file_paths)
+        count = len(self._file_paths)
+
+        if file_sizes is None:
+            stats = [self._stat(path) for path in self._file_paths]
+            file_sizes = [stat.st_size for stat in stats]
+            mtimes = [stat.st_mtime_ns for stat in stats]
+
+        self._file_sizes = np.fromiter(file_sizes, dtype=np.int64, count=count)
+        self._mtimes = (
+            np.fromiter(mtimes, dtype=np.int64, count=count) if mtimes is not None
+            else np.zeros(count, dtype=np.int64)
+        )
+        self._checksums = list(checksums) if checksums is not None else [""] * count
+        if len(self._checksums) != count:
+            raise ValueError("All columns must have the same length")
+
+        self._nas_ids = np.full(count, nas_id, dtype=np.int64)
+        self._delivery_ids = np.full(count, delivery_id, dtype=np.int64)
+
+    @classmethod
+    def from_entries(
+            cls, entries: Iterable, nas_id: Optional[int] = -1, delivery_id: int = -1,
+            checksums: Optional[dict] = None
+    ) -> "SensorDataBatch":
+
+        """
+        Create a SensorDataBatch from scanned file entries, without touching the file system.
+
+        :param entries: Objects with 'path', 'size' (bytes) and 'mtime' (ns) attributes (e.g. ScanEntry).
+        :param nas_id: The id number of the NASbox holding the files.
+        :param delivery_id: The id number of the delivery associated with the files.
+        :param checksums: Optional map of file path to checksum.
+        """
+
+        entries = list(entries)
+        paths = [entry.path for entry in entries]
+        checksums = checksums or {}
+
+        return cls(
+            paths, (entry.size for entry in entries), (entry.mtime for entry in entries),
+            [checksums.get(path, "") for path in paths], nas_id, delivery_id
+        )
+
+    @property
+    def file_paths(self) -> list[str]:
+        return self._file_paths
+
+    @property
+    def file_sizes(self) -> np.ndarray:
+
+        """Get the file_sizes property (bytes)."""
+
+        return self._file_sizes
+
+    @property
+    def mtimes(self) -> np.ndarray:
+
+        """Get the mtimes property (ns)."""
+
+        return self._mtimes
+
+    @property
+    def checksums(self) -> list[str]:
+        return self._checksums
+
+    @property
+    def nas_ids(self) -> np.ndarray:
+        return self._nas_ids
+
+    @property
+    def delivery_ids(self) -> np.ndarray:
+        return self._delivery_ids
+
+    def set_nas_id(self, nas_id: int, unset_only: bool = False):
+
+        """
+        Set the nas_id of the records.
+
+        :param nas_id: The id number of the NASbox holding the files.
+        :param unset_only: Only set records without a valid nas_id (<= 0).
+        """
+
+        self._assign(self._nas_ids, nas_id, unset_only)
+
+    def set_delivery_id(self, delivery_id: int, unset_only: bool = False):
+
+        """
+        Set the delivery_id of the records.
+
+        :param delivery_id: The id number of the delivery associated with the files.
+        :param unset_only: Only set records without a valid delivery_id (<= 0).
+        """
+
+        self._assign(self._delivery_ids, delivery_id, unset_only)
+
+    def chunks(self, size: int) -> Iterator["SensorDataBatch"]:
+
+        """
+        Split the batch into consecutive batches of at most 'size' records.
+
+        Numeric columns of the chunks are views of this batch's columns (no copy).
+        """
+
+        if size < 1:
+            raise ValueError("size must be >= 1")
+
+        for start in range(0, len(self), size):
+            yield self._slice(slice(start, start + size))
+
+    def serialize(self, as_dict: bool = False):
+
+        """
+        Serialize the records to a list of dictionaries, or a JSON-formatted string.
+
+        Prefer to_jsonl() or to_arrow_ipc() for large batches.
+        """
+
+        data = [dict(zip(self._columns(), row)) for row in self._rows()]
+        return data if as_dict else json.dumps(data, indent=4)
+
+    def to_jsonl(self) -> bytes:
+
+        """
+        Serialize the records to JSON lines (one JSON object per record), e.g. for
+        the 'sensordata/bulk/' endpoint with the 'application/x-ndjson' content type.
+        """
+
+        columns = [json.dumps(column) for column in self._columns()]
+        template = "{{" + ", ".join(f"{column}: {{}}" for column in columns) + "}}"
+
+        lines = [template.format(*map(json.dumps, row)) for row in self._rows()]
+        return ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+
+    def to_arrow(self) -> "pa.Table":
+
+        """
+        Get the records as an Arrow table, with the same columns as serialize().
+
+        :raises ImportError: If pyarrow is not installed.
+        """
+
+        if pa is None:
+            raise ImportError("pyarrow is required for Arrow serialization")
+
+        return pa.table({
+            "nas_id": self._nas_ids,
+            "delivery_id": self._delivery_ids,
+            "file_path": pa.array(self._file_paths, type=pa.string()),
+            "file_name": pa.array(self._file_names(), type=pa.string()),
+            "file_size": self._file_sizes / GB_CONVERT,
+            "checksum": pa.array(self._checksums, type=pa.string()),
+        })
+
+    def to_arrow_ipc(self) -> bytes:
+
+        """
+        Serialize the records to the Arrow IPC stream format.
+
+        :raises ImportError: If pyarrow is not installed.
+        """
+
+        table = self.to_arrow()
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        return sink.getvalue().to_pybytes()
+
+    def __len__(self) -> int:
+        return len(self._file_paths)
+
+    def __getitem__(self, index: int) -> SensorData:
+
+        """Get a single record as a SensorData object."""
+
+        record = SensorData(
+            int(self._nas_ids[index]), int(self._delivery_ids[index]), self._file_paths[index],
+            int(self._file_sizes[index]), int(self._mtimes[index])
+        )
+        record.checksum = self._checksums[index]
+
+        return record
+
+    def __iter__(self) -> Iterator[SensorData]:
+        return (self[i] for i in range(len(self)))
+
+    def _columns(self) -> tuple:
+
+        """Get the serialized column names, in the order SensorData.serialize() uses."""
+
+        return "nas_id", "delivery_id", "file_path", "file_name", "file_size", "checksum"
+
+    def _rows(self) -> Iterator[tuple]:
+
+        """Get the serialized records as tuples of plain Python values."""
+
+        return zip(
+            self._nas_ids.tolist(), self._delivery_ids.tolist(), self._file_paths,
+            self._file_names(), (self._file_sizes / GB_CONVERT).tolist(), self._checksums
+        )
+
+    def _file_names(self) -> list[str]:
+        return [os.path.basename(path) for path in self._file_paths]
+
+    def _slice(self, index: slice) -> "SensorDataBatch":
+
+        """Get a batch holding a slice of the records."""
+
+        batch = SensorDataBatch()
+        batch._file_paths = self._file_paths[index]
+        batch._file_sizes = self._file_sizes[index]
+        batch._mtimes = self._mtimes[index]
+        batch._checksums = self._checksums[index]
+        batch._nas_ids = self._nas_ids[index]
+        batch._delivery_ids = self._delivery_ids[index]
+
+        return batch
+
+    @staticmethod
+    def _assign(column: np.ndarray, value: int, unset_only: bool):
+
+        """Assign a foreign key to all records, or only the records without a valid key."""
+
+        if unset_only:
+            column[column <= 0] = value
+        else:
+            column.fill(value)
+
+    @staticmethod
+    def _stat(file_path: str) -> os.stat_result:
+        try:
+            return os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No such path: '{file_path}'")
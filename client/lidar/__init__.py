@@ -0,0 +1,23 @@
+__all__ = [
+    "LasHarvester",
+    "LasHeaderInfo",
+    "read_las_header",
+    "LasHullBuilder",
+    "StripHull",
+    "read_strip_hull",
+    "LasFootprintBuilder",
+    "TileFootprint",
+    "read_tile_footprint",
+    "LasFileExt",
+    "HarvestConfig",
+    "HullConfig",
+    "FootprintConfig",
+    "null_unknown_epsg",
+]
+
+from .las_harvester import LasHarvester
+from .las_header import LasHeaderInfo, read_las_header
+from .las_hull import LasHullBuilder, StripHull, read_strip_hull
+from .las_footprint import LasFootprintBuilder, TileFootprint, read_tile_footprint
+from .const import LasFileExt, HarvestConfig, HullConfig, FootprintConfig
+from .file_pool import null_unknown_epsg
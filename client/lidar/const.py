@@ -0,0 +1,58 @@
+import os
+
+
+class LasFileExt:
+
+    """Enum class containing the LAS/LAZ point cloud file extensions."""
+
+    LAS = ".las"
+    LAZ = ".laz"
+    LIST = [LAS, LAZ]
+
+
+class HarvestConfig:
+
+    """
+    Enum class containing default tuning parameters for LasHarvester.
+
+    Header reads are small (a few KB per file), so the work is dominated by
+    file open latency: chunking the paths sent to each worker process keeps
+    the inter-process overhead low on deliveries with tens of thousands of files.
+    """
+
+    WORKERS = os.cpu_count() or 4  # Size of the header reader process pool
+    CHUNK_SIZE = 64                # Paths sent to a worker process per task
+    POOL_MIN_FILES = 32            # Below this file count, headers are read in the calling process
+
+
+class HullConfig:
+
+    """
+    Enum class containing default tuning parameters for LasHullBuilder.
+
+    Memory per worker is bounded by the chunk size: about 30-70 bytes per point
+    (depending on the point format) for the chunk read, plus the hull vertices.
+    """
+
+    WORKERS = os.cpu_count() or 4  # Size of the point reader process pool (one file per task)
+    CHUNK_POINTS = 1_000_000       # Points read (and decompressed) per chunk
+    DECIMATE = 1                   # Keep every n-th point of each chunk (1 keeps all points)
+    EPSG = 3005                    # EPSG code of the LidarStrip.convex_hull column
+
+
+class FootprintConfig:
+
+    """
+    Enum class containing default tuning parameters for LasFootprintBuilder.
+
+    The footprint is traced on an occupancy grid of 'CELL_SIZE' cells: a cell is
+    covered if it holds at least one point. Gaps narrower than about
+    'CLOSING' cells (e.g. between scan lines) are closed before tracing.
+    """
+
+    WORKERS = os.cpu_count() or 4  # Size of the point reader process pool (one file per task)
+    CHUNK_POINTS = 1_000_000       # Points read (and decompressed) per chunk
+    CELL_SIZE = 5.0                # Occupancy grid cell size (CRS units, usually m)
+    DENSITY_CELL_SIZE = 25.0       # Point count grid cell size (CRS units, usually m)
+    CLOSING = 1                    # Morphological closing iterations applied to the occupancy grid
+    EPSG = 3005                    # EPSG code of the LidarTile geometry columns
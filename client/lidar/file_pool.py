@@ -0,0 +1,108 @@
+# system imports
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Collection, Iterable, Optional
+
+# user imports
+from .const import HarvestConfig
+
+
+def map_files(
+        func: Callable, paths: Iterable[str], workers: int, chunk_size: int = 1,
+        min_files: int = HarvestConfig.POOL_MIN_FILES
+) -> tuple[list, dict[str, list]]:
+
+    """
+    Apply 'func' to each file, in a pool of worker processes.
+
+    Errors raised by 'func' are collected rather than raised, so one bad file
+    doesn't stop the pool. Workers are spawned rather than forked on every OS:
+    forking a process that runs threads (copy workers, LAZ decompression
+    threads) can deadlock the children. If there are fewer than 'min_files' files (or a single
+    worker), the files are processed in the calling process.
+
+    :param func: A picklable (module level) function taking a file path.
+    :param paths: Paths of the files.
+    :param workers: Size of the process pool.
+    :param chunk_size: Number of paths sent to a worker process per task.
+    :param min_files: Minimum number of files for which a pool is started.
+    :return: The results of the files processed, and a dictionary of the files that failed (keys: ["file", "err"]).
+    """
+
+    paths = list(paths)
+    safe = partial(_call_safe, func)
+
+    if workers <= 1 or len(paths) < min_files:
+        outcomes = [safe(path) for path in paths]
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths)), mp_context=context) as pool:
+            outcomes = list(pool.map(safe, paths, chunksize=max(1, chunk_size)))
+
+    results = []
+    failed = {"file": [], "err": []}
+    for path, (result, err) in zip(paths, outcomes):
+        if err is not None:
+            failed["file"].append(path)
+            failed["err"].append(err)
+        else:
+            results.append(result)
+
+    return results, failed
+
+
+def null_unknown_epsg(records: Iterable, epsg_codes: Optional[Collection[int]]):
+
+    """
+    Set the EPSG code of records to None where it isn't one of 'epsg_codes' (codes
+    missing from the server's SpatialReference table fail the record's foreign key).
+
+    :param records: Records with an 'epsg_code' property (e.g. Lidar).
+    :param epsg_codes: EPSG codes known to the server (None: keep every code).
+    """
+
+    if epsg_codes is None:
+        return
+
+    for record in records:
+        if record.epsg_code not in epsg_codes:
+            record.epsg_code = None
+
+
+def keep_epsg(results: list, epsg: Optional[int], failed: dict[str, list], kind: str) -> list:
+
+    """
+    Keep the results (e.g. hulls, footprints) whose coordinates are in 'epsg'.
+
+    The others come from files of unknown CRS, which can't be transformed: posting them
+    would store their geometries in the wrong CRS. They are added to 'failed'.
+
+    :param results: Results with 'path' and 'epsg_code' fields.
+    :param epsg: EPSG code the results were transformed to (None: keep every result).
+    :param failed: A dictionary of the files that failed (keys: ["file", "err"]).
+    :param kind: Name of the results in the error messages (e.g. 'hull').
+    :return: The results in 'epsg' coordinates.
+    """
+
+    if epsg is None:
+        return results
+
+    for result in results:
+        if result.epsg_code != epsg:
+            failed["file"].append(result.path)
+            failed["err"].append(
+                ValueError(f"'{result.path}' has no known CRS: its {kind} can't be transformed to EPSG:{epsg}")
+            )
+
+    return [result for result in results if result.epsg_code == epsg]
+
+
+def _call_safe(func: Callable, path: str) -> tuple[Optional[object], Optional[Exception]]:
+
+    """Call 'func' in a worker process, returning the error instead of raising it (keeps the pool running)."""
+
+    try:
+        return func(path), None
+    except Exception as err:
+        return None, err
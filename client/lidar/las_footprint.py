@@ -0,0 +1,239 @@
+# system imports
+import math
+from functools import partial
+from typing import Iterable, NamedTuple, Optional
+
+# user imports
+import laspy
+import numpy as np
+from scipy import ndimage
+from shapely.geometry import MultiPolygon, box, mapping
+from shapely.ops import transform, unary_union
+try:
+    from client.entity import LidarTile
+except ImportError:
+    from entity import LidarTile
+from .const import FootprintConfig
+from .file_pool import keep_epsg, map_files
+from .las_header import parse_epsg
+
+
+class TileFootprint(NamedTuple):
+
+    """Footprint and point density grid of a LAS/LAZ tile."""
+
+    path: str
+    point_count: int
+    epsg_code: Optional[int]  # EPSG code of the geometries (None if the file CRS is unknown)
+    bounding_box: dict        # GeoJSON Polygon of the header extent
+    footprint: dict           # GeoJSON MultiPolygon of the area covered by points
+    density: dict             # Point count grid (see read_tile_footprint())
+
+
+def read_tile_footprint(
+        path: str, cell_size: float = FootprintConfig.CELL_SIZE,
+        density_cell_size: float = FootprintConfig.DENSITY_CELL_SIZE,
+        chunk_points: int = FootprintConfig.CHUNK_POINTS, closing: int = FootprintConfig.CLOSING,
+        epsg: Optional[int] = FootprintConfig.EPSG
+) -> TileFootprint:
+
+    """
+    Compute the footprint and the point density grid of a LAS/LAZ file, in one pass.
+
+    Points are read (and decompressed) 'chunk_points' at a time, and binned into an
+    occupancy grid and a point count grid laid over the header extent; nothing else is
+    kept between chunks. The footprint is the union of the occupied cells (after
+    'closing' iterations of morphological closing), clipped to the header extent.
+
+    The density grid is returned in the file CRS as a dictionary:
+    {"epsg_code", "origin": [x_min, y_max], "cell_size", "shape": [rows, cols], "counts"},
+    with 'counts' holding rows from north to south.
+
+    :param path: Path of the LAS/LAZ file.
+    :param cell_size: Occupancy grid cell size.
+    :param density_cell_size: Point count grid cell size.
+    :param chunk_points: Number of points read per chunk.
+    :param closing: Morphological closing iterations applied to the occupancy grid (0 to disable).
+    :param epsg: EPSG code to transform the geometries to (None keeps the file CRS).
+    :return: The footprint of the file.
+    :raises ValueError: If the file holds no points.
+    :raises laspy.LaspyException: If the file is not a valid LAS/LAZ file.
+    """
+
+    with laspy.open(path) as reader:
+        header = reader.header
+        x_min, y_min = float(header.mins[0]), float(header.mins[1])
+        x_max, y_max = float(header.maxs[0]), float(header.maxs[1])
+
+        occupied = np.zeros(_grid_shape(x_min, y_min, x_max, y_max, cell_size), dtype=bool)
+        counts = np.zeros(_grid_shape(x_min, y_min, x_max, y_max, density_cell_size), dtype=np.int64)
+
+        point_count = 0
+        for points in reader.chunk_iterator(max(1, chunk_points)):
+            x, y = np.asarray(points.x), np.asarray(points.y)
+            point_count += len(x)
+            occupied.flat[_cell_index(x, y, x_min, y_max, cell_size, occupied.shape)] = True
+            counts += np.bincount(
+                _cell_index(x, y, x_min, y_max, density_cell_size, counts.shape), minlength=counts.size
+            ).reshape(counts.shape)
+
+    if not point_count:
+        raise ValueError(f"'{path}' holds no points")
+
+    if closing > 0:
+        occupied = _close(occupied, closing)
+
+    bounds = box(x_min, y_min, x_max, y_max)
+    footprint = _trace(occupied, x_min, y_max, cell_size).intersection(bounds)
+
+    src_epsg = parse_epsg(header)
+    if epsg is not None and src_epsg is not None and src_epsg != epsg:
+        from pyproj import Transformer
+
+        project = Transformer.from_crs(src_epsg, epsg, always_xy=True).transform
+        bounds, footprint = transform(project, bounds), transform(project, footprint)
+        geom_epsg = epsg
+    else:
+        geom_epsg = src_epsg
+
+    if not isinstance(footprint, MultiPolygon):
+        footprint = MultiPolygon([footprint]) if not footprint.is_empty else MultiPolygon()
+
+    density = {
+        "epsg_code": src_epsg,
+        "origin": [x_min, y_max],
+        "cell_size": density_cell_size,
+        "shape": list(counts.shape),
+        "counts": counts.tolist(),
+    }
+
+    return TileFootprint(path, point_count, geom_epsg, mapping(bounds), mapping(footprint), density)
+
+
+def _grid_shape(x_min: float, y_min: float, x_max: float, y_max: float, cell_size: float) -> tuple[int, int]:
+
+    """Get the (rows, cols) shape of a grid of 'cell_size' cells covering an extent."""
+
+    return max(1, math.ceil((y_max - y_min) / cell_size)), max(1, math.ceil((x_max - x_min) / cell_size))
+
+
+def _cell_index(
+        x: np.ndarray, y: np.ndarray, x_min: float, y_max: float, cell_size: float, shape: tuple[int, int]
+) -> np.ndarray:
+
+    """Get the flat (row major, north-up) grid cell index of each point."""
+
+    rows = np.clip(((y_max - y) / cell_size).astype(np.int64), 0, shape[0] - 1)
+    cols = np.clip(((x - x_min) / cell_size).astype(np.int64), 0, shape[1] - 1)
+
+    return rows * shape[1] + cols
+
+
+def _close(occupied: np.ndarray, iterations: int) -> np.ndarray:
+
+    """Morphological closing of the occupancy grid, without eroding the grid edges."""
+
+    padded = np.pad(occupied, iterations)
+    closed = ndimage.binary_closing(padded, iterations=iterations)
+
+    return closed[iterations:-iterations, iterations:-iterations]
+
+
+def _trace(occupied: np.ndarray, x_min: float, y_max: float, cell_size: float):
+
+    """Get the union of the occupied cells, merged row by row into runs of cells."""
+
+    # run starts/ends of each row (argwhere is row major, so they pair up)
+    edges = np.diff(np.pad(occupied, ((0, 0), (1, 1))).astype(np.int8), axis=1)
+    starts, ends = np.argwhere(edges == 1), np.argwhere(edges == -1)
+
+    runs = [
+        box(x_min + c0 * cell_size, y_max - (r + 1) * cell_size, x_min + c1 * cell_size, y_max - r * cell_size)
+        for (r, c0), (_, c1) in zip(starts.tolist(), ends.tolist())
+    ]
+
+    return unary_union(runs)
+
+
+class LasFootprintBuilder:
+
+    """
+    Compute the footprints and point density grids of LAS/LAZ tiles.
+
+    Each file is streamed once, in chunks, by a worker process (see
+    read_tile_footprint()), and files are processed across all cores.
+
+    >>> builder = LasFootprintBuilder(cell_size=2.0)
+    >>> records, failed = builder.records({"/nas/tile_092g025.laz": 31})
+    """
+
+    def __init__(
+            self, workers: int = FootprintConfig.WORKERS, cell_size: float = FootprintConfig.CELL_SIZE,
+            density_cell_size: float = FootprintConfig.DENSITY_CELL_SIZE,
+            chunk_points: int = FootprintConfig.CHUNK_POINTS, closing: int = FootprintConfig.CLOSING,
+            epsg: Optional[int] = FootprintConfig.EPSG
+    ):
+
+        """
+        Initialize a LasFootprintBuilder object.
+
+        :param workers: Size of the point reader process pool.
+        :param cell_size: Occupancy grid cell size.
+        :param density_cell_size: Point count grid cell size.
+        :param chunk_points: Number of points read per chunk.
+        :param closing: Morphological closing iterations applied to the occupancy grid.
+        :param epsg: EPSG code to transform the geometries to (the LidarTile columns are in EPSG:3005).
+        """
+
+        if cell_size <= 0 or density_cell_size <= 0:
+            raise ValueError("Cell sizes must be > 0")
+
+        self._workers = max(1, workers)
+        self._cell_size = cell_size
+        self._density_cell_size = density_cell_size
+        self._chunk_points = max(1, chunk_points)
+        self._closing = max(0, closing)
+        self._epsg = epsg
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    @property
+    def density_cell_size(self) -> float:
+        return self._density_cell_size
+
+    def build(self, paths: Iterable[str]) -> tuple[list[TileFootprint], dict[str, list]]:
+
+        """
+        Compute the footprints of LAS/LAZ files.
+
+        :param paths: Paths of the files.
+        :return: The footprints, and a dictionary of the files that failed (keys: ["file", "err"]).
+        """
+
+        func = partial(
+            read_tile_footprint, cell_size=self._cell_size, density_cell_size=self._density_cell_size,
+            chunk_points=self._chunk_points, closing=self._closing, epsg=self._epsg
+        )
+        return map_files(func, paths, self._workers, min_files=2)
+
+    def records(self, lidar_ids: dict[str, int]) -> tuple[list[LidarTile], dict[str, list]]:
+
+        """
+        Create the LidarTile records of LAS/LAZ files.
+
+        :param lidar_ids: Map of file path to the id of its Lidar record.
+        :return: The LidarTile records, and a dictionary of the files that failed (keys: ["file", "err"]),
+            including the files whose CRS is unknown when 'epsg' is set.
+        """
+
+        footprints, failed = self.build(lidar_ids)
+        footprints = keep_epsg(footprints, self._epsg, failed, "footprint")
+        records = [LidarTile.from_footprint(footprint, lidar_ids[footprint.path]) for footprint in footprints]
+
+        return records, failed
@@ -0,0 +1,93 @@
+# system imports
+import os
+from typing import Iterable, Optional
+
+# user imports
+try:
+    from client.entity import Lidar
+except ImportError:
+    from entity import Lidar
+from .const import HarvestConfig, LasFileExt
+from .file_pool import map_files, null_unknown_epsg
+from .las_header import LasHeaderInfo, read_las_header
+
+
+class LasHarvester:
+
+    """
+    Catalogue LAS/LAZ files from their headers.
+
+    Headers are read by a pool of worker processes (see read_las_header()), so a
+    delivery of tens of thousands of files is catalogued without reading any point data.
+
+    >>> harvester = LasHarvester(epsg_codes=[3005, 2955])
+    >>> records, failed = harvester.records(paths, nas_id=1)
+    """
+
+    def __init__(
+            self, workers: int = HarvestConfig.WORKERS, chunk_size: int = HarvestConfig.CHUNK_SIZE,
+            epsg_codes: Optional[Iterable[int]] = None
+    ):
+
+        """
+        Initialize a LasHarvester object.
+
+        :param workers: Size of the header reader process pool.
+        :param chunk_size: Number of paths sent to a worker process per task.
+        :param epsg_codes: EPSG codes known to the server (SpatialReference table). Parsed
+            codes not in this set are recorded as None. All codes are kept if not passed.
+        """
+
+        self._workers = max(1, workers)
+        self._chunk_size = max(1, chunk_size)
+        self._epsg_codes = frozenset(epsg_codes) if epsg_codes is not None else None
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @staticmethod
+    def is_las(path: str) -> bool:
+
+        """Check whether a path has a LAS/LAZ file extension."""
+
+        return os.path.splitext(path)[1].lower() in LasFileExt.LIST
+
+    def harvest(self, paths: Iterable[str]) -> tuple[list[LasHeaderInfo], dict[str, list]]:
+
+        """
+        Read the headers of LAS/LAZ files.
+
+        Paths without a LAS/LAZ extension are ignored.
+
+        :param paths: Paths of the files.
+        :return: The headers read, and a dictionary of the files that failed (keys: ["file", "err"]).
+        """
+
+        paths = [path for path in paths if self.is_las(path)]
+        return map_files(read_las_header, paths, self._workers, self._chunk_size)
+
+    def records(
+            self, paths: Iterable[str], nas_id: Optional[int] = None, trajectory_id: Optional[int] = None,
+            lidar_type: Optional[str] = None
+    ) -> tuple[list[Lidar], dict[str, list]]:
+
+        """
+        Create the Lidar records of LAS/LAZ files from their headers.
+
+        :param paths: Paths of the files.
+        :param nas_id: The id number of the NASbox holding the files.
+        :param trajectory_id: The id number of the trajectory associated with the files.
+        :param lidar_type: Single character LiDAR type code.
+        :return: The Lidar records, and a dictionary of the files that failed (keys: ["file", "err"]).
+        """
+
+        headers, failed = self.harvest(paths)
+        records = [Lidar.from_header(header, nas_id, trajectory_id, lidar_type) for header in headers]
+        null_unknown_epsg(records, self._epsg_codes)
+
+        return records, failed
@@ -0,0 +1,79 @@
+# system imports
+import os
+from typing import NamedTuple, Optional
+
+# user imports
+import laspy
+
+
+class LasHeaderInfo(NamedTuple):
+
+    """Fields of a LAS/LAZ public header block needed for a Lidar record."""
+
+    path: str
+    size: int             # File size (bytes)
+    version: float        # LAS version (e.g. 1.4)
+    point_format: int     # Point data record format id
+    point_count: int
+    file_source_id: int
+    x_min: float
+    x_max: float
+    y_min: float
+    y_max: float
+    epsg_code: Optional[int]
+
+
+def read_las_header(path: str) -> LasHeaderInfo:
+
+    """
+    Read the public header block and the (E)VLRs of a LAS/LAZ file.
+
+    Only the header and the variable length records are read: the point data is
+    never read, nor decompressed for LAZ files. The EPSG code is parsed from the
+    CRS VLRs (WKT or GeoTIFF keys), and is None if missing or not resolvable.
+    For compound CRSs, the EPSG code of the horizontal CRS is returned.
+
+    :param path: Path of the LAS/LAZ file.
+    :return: The header fields.
+    :raises FileNotFoundError:
+    :raises laspy.LaspyException: If the file is not a valid LAS/LAZ file.
+    """
+
+    with open(path, "rb") as fp:
+        header = laspy.LasHeader.read_from(fp, read_evlrs=True)
+        size = os.fstat(fp.fileno()).st_size
+
+    mins, maxs = header.mins, header.maxs
+
+    return LasHeaderInfo(
+        path=path,
+        size=size,
+        version=float(f"{header.version.major}.{header.version.minor}"),
+        point_format=int(header.point_format.id),
+        point_count=int(header.point_count),
+        file_source_id=int(header.file_source_id),
+        x_min=float(mins[0]),
+        x_max=float(maxs[0]),
+        y_min=float(mins[1]),
+        y_max=float(maxs[1]),
+        epsg_code=parse_epsg(header),
+    )
+
+
+def parse_epsg(header: "laspy.LasHeader") -> Optional[int]:
+
+    """Get the EPSG code of the CRS stored in the header VLRs, or None."""
+
+    try:
+        crs = header.parse_crs()
+    except Exception:  # malformed CRS VLRs, or pyproj not installed
+        return None
+
+    if crs is None:
+        return None
+
+    epsg = crs.to_epsg()
+    if epsg is None and crs.is_compound:
+        epsg = crs.sub_crs_list[0].to_epsg()
+
+    return epsg
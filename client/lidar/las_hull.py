@@ -0,0 +1,185 @@
+# system imports
+from functools import partial
+from typing import Iterable, NamedTuple, Optional
+
+# user imports
+import laspy
+import numpy as np
+from scipy.spatial import ConvexHull
+try:
+    from scipy.spatial import QhullError
+except ImportError:  # scipy < 1.8
+    from scipy.spatial.qhull import QhullError
+try:
+    from client.entity import LidarStrip
+except ImportError:
+    from entity import LidarStrip
+from .const import HullConfig
+from .file_pool import keep_epsg, map_files
+from .las_header import parse_epsg
+
+
+class StripHull(NamedTuple):
+
+    """Convex hull of the points of a LAS/LAZ file."""
+
+    path: str
+    file_source_id: int
+    point_count: int             # Points read (after decimation)
+    epsg_code: Optional[int]     # EPSG code of the coordinates (None if the file CRS is unknown)
+    coordinates: list            # Closed ring of [x, y] vertices, counter-clockwise
+
+    def geojson(self) -> dict:
+
+        """Get the hull as a GeoJSON Polygon."""
+
+        return {"type": "Polygon", "coordinates": [self.coordinates]}
+
+
+def read_strip_hull(
+        path: str, chunk_points: int = HullConfig.CHUNK_POINTS, decimate: int = HullConfig.DECIMATE,
+        epsg: Optional[int] = HullConfig.EPSG
+) -> StripHull:
+
+    """
+    Compute the convex hull of the points of a LAS/LAZ file, in bounded memory.
+
+    Points are read (and decompressed) 'chunk_points' at a time. The hull of each
+    chunk is merged with the running hull, so only the current hull vertices are
+    kept between chunks. The hull is computed on the unscaled integer coordinates
+    and only its vertices are scaled (the scaling is affine, so the hull is the same).
+
+    Decimating ('decimate' > 1) speeds up the hull computation, but may shrink the
+    hull slightly; the points are still read and decompressed.
+
+    :param path: Path of the LAS/LAZ file.
+    :param chunk_points: Number of points read per chunk.
+    :param decimate: Keep every n-th point of each chunk.
+    :param epsg: EPSG code to transform the hull to (None keeps the file CRS).
+    :return: The hull of the file.
+    :raises ValueError: If the points don't span an area (fewer than 3 distinct, non collinear points).
+    :raises laspy.LaspyException: If the file is not a valid LAS/LAZ file.
+    """
+
+    decimate = max(1, decimate)
+    vertices = None
+    point_count = 0
+
+    with laspy.open(path) as reader:
+        header = reader.header
+        for points in reader.chunk_iterator(max(1, chunk_points)):
+            xy = np.column_stack((points.X[::decimate], points.Y[::decimate])).astype(np.float64)
+            point_count += len(xy)
+            vertices = _merge_hull(vertices, xy)
+
+    if vertices is None or len(vertices) < 3:
+        raise ValueError(f"Points of '{path}' don't span an area")
+
+    x = vertices[:, 0] * header.scales[0] + header.offsets[0]
+    y = vertices[:, 1] * header.scales[1] + header.offsets[1]
+
+    src_epsg = parse_epsg(header)
+    if epsg is not None and src_epsg is not None and src_epsg != epsg:
+        x, y = _transform(x, y, src_epsg, epsg)
+        src_epsg = epsg
+
+    ring = np.column_stack((x, y))
+    ring = np.vstack((ring, ring[:1])).tolist()
+
+    return StripHull(path, int(header.file_source_id), point_count, src_epsg, ring)
+
+
+def _merge_hull(vertices: Optional[np.ndarray], points: np.ndarray) -> np.ndarray:
+
+    """Get the hull vertices (counter-clockwise) of the running hull vertices and a chunk of points."""
+
+    if vertices is not None:
+        points = np.vstack((vertices, points))
+
+    if len(points) < 3:
+        return points
+
+    try:
+        return points[ConvexHull(points).vertices]
+    except QhullError:  # all points collinear (or equal): keep the two extremes
+        order = np.lexsort((points[:, 1], points[:, 0]))
+        return np.unique(points[order[[0, -1]]], axis=0)
+
+
+def _transform(x: np.ndarray, y: np.ndarray, src_epsg: int, dst_epsg: int) -> tuple:
+
+    """Transform hull vertices between CRSs."""
+
+    from pyproj import Transformer
+
+    transformer = Transformer.from_crs(src_epsg, dst_epsg, always_xy=True)
+    return transformer.transform(x, y)
+
+
+class LasHullBuilder:
+
+    """
+    Compute the convex hulls of LAS/LAZ strips.
+
+    Each file is streamed in chunks by a worker process (see read_strip_hull()),
+    so memory stays bounded regardless of strip size, and files are processed
+    across all cores.
+
+    >>> builder = LasHullBuilder(decimate=4)
+    >>> records, failed = builder.records({"/nas/strip_001.laz": 12})
+    """
+
+    def __init__(
+            self, workers: int = HullConfig.WORKERS, chunk_points: int = HullConfig.CHUNK_POINTS,
+            decimate: int = HullConfig.DECIMATE, epsg: Optional[int] = HullConfig.EPSG
+    ):
+
+        """
+        Initialize a LasHullBuilder object.
+
+        :param workers: Size of the point reader process pool.
+        :param chunk_points: Number of points read per chunk.
+        :param decimate: Keep every n-th point of each chunk.
+        :param epsg: EPSG code to transform the hulls to (the LidarStrip column is in EPSG:3005).
+        """
+
+        self._workers = max(1, workers)
+        self._chunk_points = max(1, chunk_points)
+        self._decimate = max(1, decimate)
+        self._epsg = epsg
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def decimate(self) -> int:
+        return self._decimate
+
+    def build(self, paths: Iterable[str]) -> tuple[list[StripHull], dict[str, list]]:
+
+        """
+        Compute the hulls of LAS/LAZ files.
+
+        :param paths: Paths of the files.
+        :return: The hulls, and a dictionary of the files that failed (keys: ["file", "err"]).
+        """
+
+        func = partial(read_strip_hull, chunk_points=self._chunk_points, decimate=self._decimate, epsg=self._epsg)
+        return map_files(func, paths, self._workers, min_files=2)
+
+    def records(self, lidar_ids: dict[str, int]) -> tuple[list[LidarStrip], dict[str, list]]:
+
+        """
+        Create the LidarStrip records of LAS/LAZ files.
+
+        :param lidar_ids: Map of file path to the id of its Lidar record.
+        :return: The LidarStrip records, and a dictionary of the files that failed (keys: ["file", "err"]),
+            including the files whose CRS is unknown when 'epsg' is set.
+        """
+
+        hulls, failed = self.build(lidar_ids)
+        hulls = keep_epsg(hulls, self._epsg, failed, "hull")
+        records = [LidarStrip.from_hull(hull, lidar_ids[hull.path]) for hull in hulls]
+
+        return records, failed
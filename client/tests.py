@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+import subprocess
+
+# Root of the repository (the client is imported as the 'client' package from there)
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ImportTest(unittest.TestCase):
+
+    """
+    Import the client packages in a fresh interpreter, from the repository root: importing
+    eclipse_config changes the working directory, where the client 'copy' package can
+    shadow the stdlib module (see eclipse_config).
+    """
+
+    MODULES = (
+        "from client.copy import EclipseCopy",
+        "from client.eclipse_request import EclipseRequest, AsyncEclipseRequest",
+        "from client.bcgs import BcgsIndex",
+        "from client.lidar import LasHarvester",
+    )
+
+    def test_imports(self):
+        for statement in self.MODULES:
+            with self.subTest(statement=statement):
+                proc = subprocess.run(
+                    [sys.executable, "-c", statement], cwd=REPO_DIR, capture_output=True, text=True
+                )
+                self.assertEqual(proc.returncode, 0, proc.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+-- BCGS20k LiDAR coverage
+--
+-- BCGS20kCoverage holds, for each 20k tile, the area covered by the union of the
+-- intersecting LidarTile footprints, and the covered fraction of the tile. The
+-- point footprint of a tile is used when computed, else its bounding box. It is
+-- refreshed incrementally: a statement-level trigger on LidarTile recomputes only
+-- the 20k tiles touched by the inserted, updated or deleted footprints, rather than
+-- the province-wide union. BCGS20k.is_covered is kept in sync with the coverage.
+--
+-- Run after 'eclipse_insertion.sql'. To (re)build the coverage of every tile:
+--
+-- SELECT eclipse_refresh_coverage();
+
+
+-- Covered fraction at (or above) which a 20k tile is flagged as covered
+CREATE OR REPLACE FUNCTION eclipse_coverage_threshold() RETURNS DOUBLE PRECISION AS $$
+    SELECT 0.99::DOUBLE PRECISION;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE TABLE IF NOT EXISTS BCGS20kCoverage (
+  tile_20k VARCHAR(32) PRIMARY KEY REFERENCES BCGS20k(tile_20k) ON DELETE CASCADE,
+  covered_area DOUBLE PRECISION NOT NULL DEFAULT 0, -- m^2
+  coverage DOUBLE PRECISION NOT NULL DEFAULT 0, -- covered fraction of the tile [0, 1]
+  tile_count INTEGER NOT NULL DEFAULT 0, -- number of intersecting LidarTiles
+  updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_bcgs20kcoverage_coverage ON BCGS20kCoverage (coverage);
+
+
+-- Recompute the coverage of the given 20k tiles (all tiles if NULL).
+-- Returns the number of tiles refreshed.
+CREATE OR REPLACE FUNCTION eclipse_refresh_coverage(tiles TEXT[] DEFAULT NULL) RETURNS BIGINT AS $$
+DECLARE
+    refreshed BIGINT;
+BEGIN
+    INSERT INTO BCGS20kCoverage (tile_20k, covered_area, coverage, tile_count, updated_at)
+    SELECT
+        g.tile_20k,
+        COALESCE(ST_Area(u.footprint), 0),
+        COALESCE(LEAST(ST_Area(u.footprint) / NULLIF(ST_Area(g.geometry), 0), 1), 0),
+        u.tile_count,
+        CURRENT_TIMESTAMP
+    FROM BCGS20k g
+    CROSS JOIN LATERAL (
+        SELECT ST_Union(ST_Intersection(COALESCE(t.footprint, t.bounding_box), g.geometry)) AS footprint, COUNT(*) AS tile_count
+        FROM LidarTile t
+        WHERE ST_Intersects(t.bounding_box, g.geometry)
+    ) u
+    WHERE tiles IS NULL OR g.tile_20k = ANY(tiles)
+    ON CONFLICT (tile_20k) DO UPDATE SET
+        covered_area = EXCLUDED.covered_area,
+        coverage = EXCLUDED.coverage,
+        tile_count = EXCLUDED.tile_count,
+        updated_at = EXCLUDED.updated_at;
+    GET DIAGNOSTICS refreshed = ROW_COUNT;
+
+    UPDATE BCGS20k g
+    SET is_covered = (c.coverage >= eclipse_coverage_threshold())
+    FROM BCGS20kCoverage c
+    WHERE c.tile_20k = g.tile_20k
+      AND (tiles IS NULL OR g.tile_20k = ANY(tiles))
+      AND g.is_covered IS DISTINCT FROM (c.coverage >= eclipse_coverage_threshold());
+
+    RETURN refreshed;
+END $$ LANGUAGE plpgsql;
+
+
+-- Refresh the 20k tiles touched by the footprints of a LidarTile statement
+CREATE OR REPLACE FUNCTION eclipse_lidartile_coverage() RETURNS TRIGGER AS $$
+DECLARE
+    tiles TEXT[];
+BEGIN
+    -- ignore the tile assignment UPDATE issued by 'eclipse_triggers.sql' (footprints are unchanged)
+    IF pg_trigger_depth() > 1 THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT g.tile_20k) INTO tiles
+        FROM new_rows n JOIN BCGS20k g ON ST_Intersects(g.geometry, n.bounding_box);
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT g.tile_20k) INTO tiles
+        FROM old_rows o JOIN BCGS20k g ON ST_Intersects(g.geometry, o.bounding_box);
+    ELSE
+        -- only footprints that changed (the point footprint lies within the bounding box)
+        SELECT array_agg(DISTINCT g.tile_20k) INTO tiles
+        FROM (
+            SELECT n.bounding_box AS footprint
+            FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE NOT (n.bounding_box IS NOT DISTINCT FROM o.bounding_box AND n.footprint IS NOT DISTINCT FROM o.footprint)
+            UNION ALL
+            SELECT o.bounding_box
+            FROM new_rows n JOIN old_rows o ON o.id = n.id
+            WHERE NOT (n.bounding_box IS NOT DISTINCT FROM o.bounding_box AND n.footprint IS NOT DISTINCT FROM o.footprint)
+        ) f
+        JOIN BCGS20k g ON ST_Intersects(g.geometry, f.footprint);
+    END IF;
+
+    IF tiles IS NOT NULL THEN
+        PERFORM eclipse_refresh_coverage(tiles);
+    END IF;
+
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_lidartile_coverage_insert ON LidarTile;
+CREATE TRIGGER trg_lidartile_coverage_insert
+AFTER INSERT ON LidarTile
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION eclipse_lidartile_coverage();
+
+DROP TRIGGER IF EXISTS trg_lidartile_coverage_update ON LidarTile;
+CREATE TRIGGER trg_lidartile_coverage_update
+AFTER UPDATE ON LidarTile
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION eclipse_lidartile_coverage();
+
+DROP TRIGGER IF EXISTS trg_lidartile_coverage_delete ON LidarTile;
+CREATE TRIGGER trg_lidartile_coverage_delete
+AFTER DELETE ON LidarTile
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION eclipse_lidartile_coverage();
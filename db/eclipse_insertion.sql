@@ -74,3 +74,12 @@ ADD COLUMN tile_2500k VARCHAR(20) REFERENCES BCGS2500k(tile_2500k);
 -- -- Add tile_20k FK to DerivedProductFile table
 ALTER TABLE DerivedProduct
 ADD COLUMN tile_20k VARCHAR(20) REFERENCES BCGS20k(tile_20k);
+
+-- Index the grid geometry (built after the bulk load)
+CREATE INDEX IF NOT EXISTS idx_bcgs20k_geometry ON BCGS20k USING GIST (geometry);
+CREATE INDEX IF NOT EXISTS idx_bcgs2500k_geometry ON BCGS2500k USING GIST (geometry);
+
+-- Index the tile FK columns filtered by the API
+CREATE INDEX IF NOT EXISTS idx_bcgs2500k_tile_20k ON BCGS2500k (tile_20k);
+CREATE INDEX IF NOT EXISTS idx_lidartile_tile_2500k ON LidarTile (tile_2500k);
+CREATE INDEX IF NOT EXISTS idx_derivedproduct_tile_20k ON DerivedProduct (tile_20k);
@@ -0,0 +1,100 @@
+-- Migrate the footprint columns of an existing eclipse database from native
+-- POLYGON to PostGIS geometry(Polygon, 3005), and the BCGS grid geometry to
+-- geometry(MultiPolygon, 3005), with GiST indexes. Also adds the columns
+-- introduced since (SensorData checksum, LAS header fields, LidarTile footprint
+-- and density).
+--
+-- Databases created with the current 'eclipse_schema.sql' already use these
+-- types; the script is idempotent and only converts columns that need it.
+-- Existing footprints are backfilled in place by the type conversion (one
+-- table rewrite per column), inside a single transaction.
+
+BEGIN;
+
+-- Convert a native POLYGON column to geometry(Polygon, 3005) and (re)build its GiST index
+CREATE OR REPLACE FUNCTION eclipse_migrate_polygon(tbl TEXT, col TEXT) RETURNS VOID AS $$
+DECLARE
+    idx TEXT := format('idx_%s_%s', tbl, col);
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = tbl AND column_name = col AND udt_name = 'polygon'
+    ) THEN
+        -- indexes on the native type can't be converted
+        EXECUTE format('DROP INDEX IF EXISTS %I', idx);
+        EXECUTE format(
+            'ALTER TABLE %I ALTER COLUMN %I TYPE geometry(Polygon, 3005) USING ST_SetSRID(%I::geometry, 3005)',
+            tbl, col, col
+        );
+        RAISE NOTICE 'Converted %.% to geometry(Polygon, 3005)', tbl, col;
+    END IF;
+
+    EXECUTE format('CREATE INDEX IF NOT EXISTS %I ON %I USING GIST (%I)', idx, tbl, col);
+END $$ LANGUAGE plpgsql;
+
+-- Set the SRID of a BCGS grid geometry column loaded without one (shp2pgsql without '-s')
+CREATE OR REPLACE FUNCTION eclipse_migrate_grid(tbl TEXT) RETURNS VOID AS $$
+DECLARE
+    idx TEXT := format('idx_%s_geometry', tbl);
+BEGIN
+    IF to_regclass(format('public.%I', tbl)) IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- shp2pgsql names the geometry column 'geom' unless loaded with '-g geometry'
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = tbl AND column_name = 'geom'
+    ) AND NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = tbl AND column_name = 'geometry'
+    ) THEN
+        EXECUTE format('ALTER TABLE %I RENAME COLUMN geom TO geometry', tbl);
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM geometry_columns
+        WHERE f_table_schema = 'public' AND f_table_name = tbl AND f_geometry_column = 'geometry'
+          AND srid = 3005 AND type = 'MULTIPOLYGON'
+    ) THEN
+        EXECUTE format(
+            'ALTER TABLE %I ALTER COLUMN geometry TYPE geometry(MultiPolygon, 3005) '
+            'USING ST_Multi(CASE WHEN ST_SRID(geometry) = 0 THEN ST_SetSRID(geometry, 3005) '
+            'ELSE ST_Transform(geometry, 3005) END)',
+            tbl
+        );
+        RAISE NOTICE 'Converted %.geometry to geometry(MultiPolygon, 3005)', tbl;
+    END IF;
+
+    EXECUTE format('CREATE INDEX IF NOT EXISTS %I ON %I USING GIST (geometry)', idx, tbl);
+END $$ LANGUAGE plpgsql;
+
+-- SensorData checksum (computed during copy)
+ALTER TABLE SensorData ADD COLUMN IF NOT EXISTS checksum VARCHAR(128);
+
+-- LAS header columns
+ALTER TABLE Lidar ADD COLUMN IF NOT EXISTS point_record_format SMALLINT;
+
+-- LidarTile point footprint and density grid
+ALTER TABLE LidarTile ADD COLUMN IF NOT EXISTS footprint geometry(MultiPolygon, 3005);
+ALTER TABLE LidarTile ADD COLUMN IF NOT EXISTS density JSONB;
+CREATE INDEX IF NOT EXISTS idx_lidartile_footprint ON LidarTile USING GIST (footprint);
+
+-- Footprints
+SELECT eclipse_migrate_polygon('lidartile', 'bounding_box');
+SELECT eclipse_migrate_polygon('lidarstrip', 'convex_hull');
+SELECT eclipse_migrate_polygon('derivedproduct', 'bounding_box');
+
+-- BCGS grids
+SELECT eclipse_migrate_grid('bcgs20k');
+SELECT eclipse_migrate_grid('bcgs2500k');
+
+DROP FUNCTION eclipse_migrate_polygon(TEXT, TEXT);
+DROP FUNCTION eclipse_migrate_grid(TEXT);
+
+COMMIT;
+
+-- Refresh planner statistics for the new columns and indexes
+ANALYZE LidarTile;
+ANALYZE LidarStrip;
+ANALYZE DerivedProduct;
@@ -79,6 +79,7 @@ CREATE TABLE IF NOT EXISTS SensorData (
   file_name VARCHAR(255),
   file_path VARCHAR(255),
   file_size VARCHAR(255),
+  checksum VARCHAR(128), -- BLAKE2b hex digest computed during copy
   nas_id INTEGER REFERENCES NASBox(id),
   delivery_id INTEGER REFERENCES Delivery(id),
   trajectory_id INTEGER REFERENCES Trajectory(id)
@@ -96,6 +97,7 @@ CREATE TABLE IF NOT EXISTS Lidar (
   y_max REAL,
   lidar_type CHAR,
   version REAL,
+  point_record_format SMALLINT,
   epsg_code INTEGER REFERENCES SpatialReference(epsg_code),
   nas_id INTEGER REFERENCES NASBox(id),
   trajectory_id INTEGER REFERENCES Trajectory(id)
@@ -105,13 +107,15 @@ CREATE TABLE IF NOT EXISTS Lidar (
 -- -- tile_2500k reference added in 'eclipse_insertion.sql' script
 CREATE TABLE IF NOT EXISTS LidarTile (
   id SERIAL PRIMARY KEY REFERENCES Lidar(id),
-  bounding_box POLYGON
+  bounding_box geometry(Polygon, 3005),
+  footprint geometry(MultiPolygon, 3005), -- area actually covered by points (occupancy grid)
+  density JSONB -- low resolution point count grid
 );
 
 -- Create the LidarRaw table
 CREATE TABLE IF NOT EXISTS LidarStrip (
   id SERIAL PRIMARY KEY REFERENCES Lidar(id),
-  convex_hull POLYGON,
+  convex_hull geometry(Polygon, 3005),
   file_source_id INTEGER
 );
 
@@ -128,7 +132,7 @@ CREATE TABLE IF NOT EXISTS DerivedProduct (
   x_max REAL,
   y_min REAL,
   y_max REAL,
-  bounding_box POLYGON,
+  bounding_box geometry(Polygon, 3005),
   epsg_code INTEGER REFERENCES SpatialReference(epsg_code),
   nas_id INTEGER REFERENCES NASBox(id)
 );
@@ -162,3 +166,34 @@ CREATE TABLE IF NOT EXISTS ProcessingStatus (
 --  delivery_id INTEGER REFERENCES Delivery(id),
 --  epsg_code INTEGER REFERENCES SpatialReference(epsg_code)
 --);
+
+
+-- CREATE INDEXES
+--
+-- B-tree indexes on the FK and lookup columns filtered by the API
+-- (e.g. 'sensordata/?delivery_id=1', 'drive/?serial_number=DEADBEEF')
+CREATE INDEX IF NOT EXISTS idx_trajectory_nas_id ON Trajectory (nas_id);
+CREATE INDEX IF NOT EXISTS idx_trajectory_file_name ON Trajectory (file_name);
+
+CREATE INDEX IF NOT EXISTS idx_sensordata_nas_id ON SensorData (nas_id);
+CREATE INDEX IF NOT EXISTS idx_sensordata_delivery_id ON SensorData (delivery_id);
+CREATE INDEX IF NOT EXISTS idx_sensordata_trajectory_id ON SensorData (trajectory_id);
+CREATE INDEX IF NOT EXISTS idx_sensordata_file_name ON SensorData (file_name);
+
+CREATE INDEX IF NOT EXISTS idx_lidar_nas_id ON Lidar (nas_id);
+CREATE INDEX IF NOT EXISTS idx_lidar_trajectory_id ON Lidar (trajectory_id);
+CREATE INDEX IF NOT EXISTS idx_lidar_file_name ON Lidar (file_name);
+
+CREATE INDEX IF NOT EXISTS idx_derivedproduct_nas_id ON DerivedProduct (nas_id);
+
+CREATE INDEX IF NOT EXISTS idx_drive_nas_id ON Drive (nas_id);
+CREATE INDEX IF NOT EXISTS idx_drive_delivery_id ON Drive (delivery_id);
+CREATE INDEX IF NOT EXISTS idx_drive_serial_number ON Drive (serial_number);
+
+CREATE INDEX IF NOT EXISTS idx_processingstatus_lidar_id ON ProcessingStatus (lidar_id);
+
+-- GiST indexes on the footprint columns filtered by the 'bbox' and 'intersects' API filters
+CREATE INDEX IF NOT EXISTS idx_lidartile_bounding_box ON LidarTile USING GIST (bounding_box);
+CREATE INDEX IF NOT EXISTS idx_lidartile_footprint ON LidarTile USING GIST (footprint);
+CREATE INDEX IF NOT EXISTS idx_lidarstrip_convex_hull ON LidarStrip USING GIST (convex_hull);
+CREATE INDEX IF NOT EXISTS idx_derivedproduct_bounding_box ON DerivedProduct USING GIST (bounding_box);
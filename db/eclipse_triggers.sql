@@ -0,0 +1,99 @@
+-- Automatic BCGS tile assignment
+--
+-- Fills LidarTile.tile_2500k and DerivedProduct.tile_20k from an indexed spatial
+-- join of the footprints against the BCGS grids. The triggers are statement level
+-- and read the inserted/updated rows from a transition table, so a bulk insert of
+-- a whole delivery is assigned with one set-based UPDATE instead of one per row.
+--
+-- A footprint is assigned the tile holding a point on its surface (a single GiST
+-- index probe per footprint). Rows that already have a tile keep it; set the tile
+-- to NULL to have it reassigned. Run after 'eclipse_insertion.sql', which adds the
+-- tile columns.
+
+
+-- LidarTile -> BCGS2500k
+CREATE OR REPLACE FUNCTION eclipse_assign_tile_2500k() RETURNS TRIGGER AS $$
+BEGIN
+    -- ignore the UPDATE issued below
+    IF pg_trigger_depth() > 1 THEN
+        RETURN NULL;
+    END IF;
+
+    UPDATE LidarTile t
+    SET tile_2500k = (
+        SELECT g.tile_2500k FROM BCGS2500k g
+        WHERE ST_Intersects(g.geometry, ST_PointOnSurface(n.bounding_box))
+        LIMIT 1
+    )
+    FROM new_rows n
+    WHERE t.id = n.id AND n.bounding_box IS NOT NULL AND n.tile_2500k IS NULL;
+
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_lidartile_tile_insert ON LidarTile;
+CREATE TRIGGER trg_lidartile_tile_insert
+AFTER INSERT ON LidarTile
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION eclipse_assign_tile_2500k();
+
+DROP TRIGGER IF EXISTS trg_lidartile_tile_update ON LidarTile;
+CREATE TRIGGER trg_lidartile_tile_update
+AFTER UPDATE ON LidarTile
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION eclipse_assign_tile_2500k();
+
+
+-- DerivedProduct -> BCGS20k
+CREATE OR REPLACE FUNCTION eclipse_assign_tile_20k() RETURNS TRIGGER AS $$
+BEGIN
+    -- ignore the UPDATE issued below
+    IF pg_trigger_depth() > 1 THEN
+        RETURN NULL;
+    END IF;
+
+    UPDATE DerivedProduct p
+    SET tile_20k = (
+        SELECT g.tile_20k FROM BCGS20k g
+        WHERE ST_Intersects(g.geometry, ST_PointOnSurface(n.bounding_box))
+        LIMIT 1
+    )
+    FROM new_rows n
+    WHERE p.id = n.id AND n.bounding_box IS NOT NULL AND n.tile_20k IS NULL;
+
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_derivedproduct_tile_insert ON DerivedProduct;
+CREATE TRIGGER trg_derivedproduct_tile_insert
+AFTER INSERT ON DerivedProduct
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION eclipse_assign_tile_20k();
+
+DROP TRIGGER IF EXISTS trg_derivedproduct_tile_update ON DerivedProduct;
+CREATE TRIGGER trg_derivedproduct_tile_update
+AFTER UPDATE ON DerivedProduct
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION eclipse_assign_tile_20k();
+
+
+-- Backfill: assign tiles to every footprint without one (e.g. rows loaded before
+-- the triggers existed). Returns the number of LidarTile and DerivedProduct rows assigned.
+--
+-- SELECT * FROM eclipse_assign_tiles();
+CREATE OR REPLACE FUNCTION eclipse_assign_tiles(OUT lidartile_count BIGINT, OUT derivedproduct_count BIGINT) AS $$
+BEGIN
+    UPDATE LidarTile t
+    SET tile_2500k = g.tile_2500k
+    FROM BCGS2500k g
+    WHERE t.tile_2500k IS NULL AND t.bounding_box IS NOT NULL
+      AND ST_Intersects(g.geometry, ST_PointOnSurface(t.bounding_box));
+    GET DIAGNOSTICS lidartile_count = ROW_COUNT;
+
+    UPDATE DerivedProduct p
+    SET tile_20k = g.tile_20k
+    FROM BCGS20k g
+    WHERE p.tile_20k IS NULL AND p.bounding_box IS NOT NULL
+      AND ST_Intersects(g.geometry, ST_PointOnSurface(p.bounding_box));
+    GET DIAGNOSTICS derivedproduct_count = ROW_COUNT;
+END $$ LANGUAGE plpgsql;
@@ -0,0 +1,206 @@
+"""
+Split a BCGS grid shapefile into one shapefile per map tile, or load it into the BCGS tables.
+
+The grid is read once and its features grouped by map tile, instead of one
+'ogr2ogr -where' (a full scan of the province-wide grid) per tile. The per-tile
+shapefiles ('<out_dir>/<tile>/<tile>.shp', as written by the former split
+scripts) are written in parallel. With '--table', the tiles are instead
+streamed straight into BCGS20k or BCGS2500k with COPY (see eclipse.bulk_load),
+the features of a tile dissolved into a single MultiPolygon. BCGS2500k rows
+reference their 20k tile (the first 7 characters of the name, e.g. 092G025 of
+092G025.1.1.1): load bcgs20k first. The load invalidates the server's cached
+BCGS responses through the Django settings (eclipse.settings unless
+DJANGO_SETTINGS_MODULE is set): run it with the server's ECLIPSE_CACHE_DIR, or
+clear that directory afterwards.
+
+python split_bcgs.py ../data/BCGS_20K/BCGS_20K_GRID/20K_GRID_polygon.shp --out-dir ../data/BCGS_20K/tiles
+python split_bcgs.py "${BCGS_SHP_20K}" --table bcgs20k --dbname eclipse --host localhost --user postgres
+python split_bcgs.py "${BCGS_SHP_2500K}" --table bcgs2500k --dbname eclipse --host localhost --user postgres
+"""
+
+# system imports
+import os
+import sys
+import argparse
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterator, Optional
+
+import fiona
+from shapely import wkb
+from shapely.geometry import MultiPolygon, shape
+from shapely.ops import unary_union
+
+# Map tile attribute table column name
+TILE_NAME_COL = "MAP_TILE"
+
+# Tiles written per task of a worker process
+CHUNK_TILES = 64
+
+# BC Albers (the SRID the grids are loaded with)
+EPSG_ALBERS_CSRS = 3005
+
+# Length of a 20k tile name (e.g. 092G025), the prefix of its 2500k tile names
+TILE_20K_LEN = 7
+
+
+def read_tiles(shp: str, tile_col: str = TILE_NAME_COL) -> tuple[dict, dict]:
+
+    """
+    Read a grid shapefile once and group its features by map tile.
+
+    :param shp: Path of the grid shapefile.
+    :param tile_col: Attribute holding the map tile name.
+    :return: The source profile (driver, crs, schema, encoding) and a map of tile name to features.
+    :raises KeyError: If the shapefile has no 'tile_col' attribute.
+    """
+
+    tiles = defaultdict(list)
+    with fiona.open(shp) as src:
+        if tile_col not in src.schema["properties"]:
+            raise KeyError(f"No '{tile_col}' attribute in '{shp}'")
+
+        profile = {"driver": src.driver, "crs_wkt": src.crs_wkt, "schema": src.schema, "encoding": src.encoding}
+        for feature in src:
+            feature = _to_dict(feature)
+            tiles[str(feature["properties"][tile_col]).strip()].append(feature)
+
+    return profile, tiles
+
+
+def split(shp: str, out_dir: str, workers: Optional[int] = None, tile_col: str = TILE_NAME_COL) -> int:
+
+    """
+    Write every map tile of a grid shapefile to '<out_dir>/<tile>/<tile>.shp'.
+
+    :param shp: Path of the grid shapefile.
+    :param out_dir: Output directory.
+    :param workers: Number of writer processes (defaults to the CPU count).
+    :param tile_col: Attribute holding the map tile name.
+    :return: The number of tiles written.
+    """
+
+    profile, tiles = read_tiles(shp, tile_col)
+    write = partial(_write_tiles, out_dir, profile)
+    chunks = list(_chunks(list(tiles.items()), CHUNK_TILES))
+
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+    if workers <= 1:
+        return sum(map(write, chunks))
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        return sum(pool.map(write, chunks))
+
+
+def load(
+        shp: str, table: str, params: dict, srid: int = EPSG_ALBERS_CSRS, tile_col: str = TILE_NAME_COL,
+        update: bool = True
+) -> int:
+
+    """
+    Load the map tiles of a grid shapefile into a BCGS table (no per-tile files).
+
+    The 2500k tiles are loaded with their 20k tile, which must already be in bcgs20k.
+
+    :param shp: Path of the grid shapefile.
+    :param table: Target table ('bcgs20k' or 'bcgs2500k').
+    :param params: psycopg2 connection parameters.
+    :param srid: SRID of the grid coordinates.
+    :param tile_col: Attribute holding the map tile name.
+    :param update: Update the geometry of the tiles already loaded (else they are kept).
+    :return: The number of tiles inserted or updated.
+    """
+
+    from eclipse.bulk_load import CopyLoader
+
+    table = table.lower()
+    _, tiles = read_tiles(shp, tile_col)
+    if table == "bcgs2500k":
+        loader = CopyLoader(table, ("tile_2500k", "tile_20k", "geometry"), update=update, params=params)
+        rows = ((tile, tile[:TILE_20K_LEN], _ewkb(features, srid)) for tile, features in tiles.items())
+    else:
+        loader = CopyLoader(table, ("tile_20k", "geometry"), update=update, params=params)
+        rows = ((tile, _ewkb(features, srid)) for tile, features in tiles.items())
+
+    return loader.load_rows(rows)
+
+
+def _write_tiles(out_dir: str, profile: dict, tiles: list) -> int:
+
+    """Write a chunk of (tile name, features) to per-tile shapefiles, in a worker process."""
+
+    for tile, features in tiles:
+        tile_dir = os.path.join(out_dir, tile)
+        os.makedirs(tile_dir, exist_ok=True)
+        with fiona.open(os.path.join(tile_dir, f"{tile}.shp"), "w", **profile) as dst:
+            dst.writerecords(features)
+
+    return len(tiles)
+
+
+def _ewkb(features: list, srid: int) -> str:
+
+    """Dissolve the features of a tile into a MultiPolygon, as hex EWKB."""
+
+    geometry = unary_union([shape(feature["geometry"]) for feature in features])
+    if not isinstance(geometry, MultiPolygon):
+        geometry = MultiPolygon([geometry])
+
+    return wkb.dumps(geometry, hex=True, srid=srid)
+
+
+def _to_dict(feature) -> dict:
+
+    """Get a feature as a picklable GeoJSON-like dict (fiona >= 1.9 yields Feature objects)."""
+
+    if isinstance(feature, dict):
+        return feature
+
+    return fiona.model.to_dict(feature)
+
+
+def _chunks(items: list, size: int) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split a BCGS grid shapefile by map tile, or load it into a table.")
+    parser.add_argument("shp", help="Grid shapefile")
+    parser.add_argument("--tile-col", default=TILE_NAME_COL, help="Map tile attribute")
+    parser.add_argument("--out-dir", help="Output directory of the per-tile shapefiles")
+    parser.add_argument("--workers", type=int, help="Number of writer processes")
+    parser.add_argument("--table", choices=("bcgs20k", "bcgs2500k"), help="Load the tiles into a table instead")
+    parser.add_argument("--srid", type=int, default=EPSG_ALBERS_CSRS)
+    parser.add_argument("--dbname", default="eclipse")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port")
+    parser.add_argument("--user", default="postgres")
+    parser.add_argument("--password")
+    args = parser.parse_args()
+
+    if args.table:
+        # the loader lives in the Django project, and invalidates its response cache
+        sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "server"))
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "eclipse.settings")
+        import django
+        django.setup()
+        params = {
+            k: v for k, v in
+            {"dbname": args.dbname, "host": args.host, "port": args.port, "user": args.user,
+             "password": args.password}.items() if v
+        }
+        count = load(args.shp, args.table, params, args.srid, args.tile_col)
+        print(f"Loaded {count} tiles into {args.table}")
+    elif args.out_dir:
+        count = split(args.shp, args.out_dir, args.workers, args.tile_col)
+        print(f"Wrote {count} tiles to {args.out_dir}")
+    else:
+        parser.error("one of --out-dir or --table is required")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,17 +18,25 @@ echo "  Database creation and table generation complete."
 psql -h "${HOST_NAME}" -d "${DB_NAME}" -U "${USER_NAME}" -f "${SCRIPT_REFTABLE}"
 echo "  Initial reference tables generated."
 
-# Read and insert BCGS 2500K and 20K tile geometry into reference tables
+# Read and insert BCGS 2500K and 20K tile geometry into reference tables (-D: COPY instead of one INSERT per tile)
 echo "  Creating BCGS reference tables ..."
 # -- BCGS20K Grid insertion
 chmod -R a+rw "${BCGS_SHP_DIR_20K}"
-shp2pgsql -c -m "${COLUMN_MAP_20K}" -W "${ENCODING}" "${BCGS_SHP_20K}" "${TABLE_BCGS20K}" | psql -h "${HOST_NAME}" -d "${DB_NAME}" -U "${USER_NAME}"
+shp2pgsql -c -D -s "${EPSG_ALBERS_CSRS}" -g geometry -m "${COLUMN_MAP_20K}" -W "${ENCODING}" "${BCGS_SHP_20K}" "${TABLE_BCGS20K}" | psql -h "${HOST_NAME}" -d "${DB_NAME}" -U "${USER_NAME}"
 echo "  BCGS20K reference table done."
 # -- BCGS2500K Grid insertion
 chmod -R a+rw "${BCGS_SHP_DIR_2500K}"
-shp2pgsql -c -m "${COLUMN_MAP_2500K}" -W "${ENCODING}" "${BCGS_SHP_2500K}" "${TABLE_BCGS2500K}" | psql -h "${HOST_NAME}" -d "${DB_NAME}" -U "${USER_NAME}"
+shp2pgsql -c -D -s "${EPSG_ALBERS_CSRS}" -g geometry -m "${COLUMN_MAP_2500K}" -W "${ENCODING}" "${BCGS_SHP_2500K}" "${TABLE_BCGS2500K}" | psql -h "${HOST_NAME}" -d "${DB_NAME}" -U "${USER_NAME}"
 echo "  BCGS2500K reference table done."
 
 # Run post insertion
 psql -h "${HOST_NAME}" -d "${DB_NAME}" -U "${USER_NAME}" -f "${SCRIPT_INSERTION}"
+
+# Create the BCGS tile assignment triggers
+psql -h "${HOST_NAME}" -d "${DB_NAME}" -U "${USER_NAME}" -f "${SCRIPT_TRIGGERS}"
+echo "  BCGS tile assignment triggers created."
+
+# Create the BCGS20k coverage table and triggers
+psql -h "${HOST_NAME}" -d "${DB_NAME}" -U "${USER_NAME}" -f "${SCRIPT_COVERAGE}"
+echo "  BCGS20k coverage created."
 echo "================ Complete! ================"
@@ -13,6 +13,9 @@ set SCRIPT_ROLES=%PATH_SQL_SCRIPTS%\%DB%_roles.sql
 set SCRIPT_SCHEMA=%PATH_SQL_SCRIPTS%\%DB%_schema.sql
 set SCRIPT_REFTABLE=%PATH_SQL_SCRIPTS%\%DB%_reftables.sql
 set SCRIPT_INSERTION=%PATH_SQL_SCRIPTS%\%DB%_insertion.sql
+set SCRIPT_TRIGGERS=%PATH_SQL_SCRIPTS%\%DB%_triggers.sql
+set SCRIPT_COVERAGE=%PATH_SQL_SCRIPTS%\%DB%_coverage.sql
+set SCRIPT_MIGRATE_GEOMETRY=%PATH_SQL_SCRIPTS%\%DB%_migrate_geometry.sql
 
 REM Relative paths to files containing data
 set COLUMN_MAP_20K=%DIR_SCRIPT_DATA%\col-map-20K
@@ -22,6 +22,8 @@ set SCRIPT_ROLES=%PATH_SQL_SCRIPTS%\%DB%_roles.sql
 set SCRIPT_SCHEMA=%PATH_SQL_SCRIPTS%\%DB%_schema.sql
 set SCRIPT_REFTABLE=%PATH_SQL_SCRIPTS%/%DB%_reftables.sql
 set SCRIPT_INSERTION=%PATH_SQL_SCRIPTS%/%DB%_insertion.sql
+set SCRIPT_TRIGGERS=%PATH_SQL_SCRIPTS%/%DB%_triggers.sql
+set SCRIPT_COVERAGE=%PATH_SQL_SCRIPTS%/%DB%_coverage.sql
 
 REM Relative paths to files containing data
 set COLUMN_MAP_20K=%DIR_SCRIPT_DATA%/col-map-20K
@@ -65,21 +67,29 @@ REM Populate the static reference tables
 psql -h "%HOST_NAME%" -d "%DB_NAME%" -U "%USER_NAME%" -f "%SCRIPT_REFTABLE%"
 echo   Initial reference tables generated.
 
-REM Read and insert BCGS 2500K and 20K tile geometry into reference tables
+REM Read and insert BCGS 2500K and 20K tile geometry into reference tables (-D: COPY instead of one INSERT per tile)
 echo Creating BCGS reference tables ...
 
 REM -- BCGS20K Grid insertion
 attrib -r "%BCGS_SHP_DIR_20K%\*.*" /S
-shp2pgsql -c -m "%COLUMN_MAP_20K%" -W "latin1" "%BCGS_SHP_20K%" "%TABLE_BCGS20K%" | psql -h "%HOST_NAME%" -d "%DB_NAME%" -U "%USER_NAME%"
+shp2pgsql -c -D -s %EPSG_ALBERS_CSRS% -g geometry -m "%COLUMN_MAP_20K%" -W "latin1" "%BCGS_SHP_20K%" "%TABLE_BCGS20K%" | psql -h "%HOST_NAME%" -d "%DB_NAME%" -U "%USER_NAME%"
 echo   BCGS20K reference table done.
 
 REM -- BCGS2500K Grid insertion
 attrib -r "%BCGS_SHP_DIR_2500K%\*.*" /S
-shp2pgsql -c -m "%COLUMN_MAP_2500K%" -W "latin1" "%BCGS_SHP_2500K%" "%TABLE_BCGS2500K%" | psql -h "%HOST_NAME%" -d "%DB_NAME%" -U "%USER_NAME%"
+shp2pgsql -c -D -s %EPSG_ALBERS_CSRS% -g geometry -m "%COLUMN_MAP_2500K%" -W "latin1" "%BCGS_SHP_2500K%" "%TABLE_BCGS2500K%" | psql -h "%HOST_NAME%" -d "%DB_NAME%" -U "%USER_NAME%"
 echo   BCGS2500K reference table done.
 
 REM Run post insertion
 psql -h "%HOST_NAME%" -d "%DB_NAME%" -U "%USER_NAME%" -f "%SCRIPT_INSERTION%"
+
+REM Create the BCGS tile assignment triggers
+psql -h "%HOST_NAME%" -d "%DB_NAME%" -U "%USER_NAME%" -f "%SCRIPT_TRIGGERS%"
+echo   BCGS tile assignment triggers created.
+
+REM Create the BCGS20k coverage table and triggers
+psql -h "%HOST_NAME%" -d "%DB_NAME%" -U "%USER_NAME%" -f "%SCRIPT_COVERAGE%"
+echo   BCGS20k coverage created.
 echo ================== Complete! ==================
 
 endlocal
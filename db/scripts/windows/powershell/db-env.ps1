@@ -16,6 +16,9 @@ $SCRIPT_ROLES = "${PATH_SQL_SCRIPTS}\${DB}_roles.sql"
 $SCRIPT_SCHEMA = "${PATH_SQL_SCRIPTS}\${DB}_schema.sql"
 $SCRIPT_REFTABLE = "${PATH_SQL_SCRIPTS}\${DB}_reftables.sql"
 $SCRIPT_INSERTION = "${PATH_SQL_SCRIPTS}\${DB}_insertion.sql"
+$SCRIPT_TRIGGERS = "${PATH_SQL_SCRIPTS}\${DB}_triggers.sql"
+$SCRIPT_COVERAGE = "${PATH_SQL_SCRIPTS}\${DB}_coverage.sql"
+$SCRIPT_MIGRATE_GEOMETRY = "${PATH_SQL_SCRIPTS}\${DB}_migrate_geometry.sql"
 
 # Relative paths to files containing data
 $COLUMN_MAP_20K = "${DIR_SCRIPT_DATA}\col-map-20K"
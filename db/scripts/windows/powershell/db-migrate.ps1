@@ -0,0 +1,16 @@
+# PowerShell Script
+
+# Load your config and environment variables
+. .\db-config.ps1
+. .\db-env.ps1
+
+# Migrate the geometry columns of an existing database to indexed PostGIS geometry
+psql -h $HOST_NAME -U $USER_NAME -d $DB_NAME -v ON_ERROR_STOP=1 -f $SCRIPT_MIGRATE_GEOMETRY
+
+# Create the BCGS tile assignment triggers, and assign tiles to the existing footprints
+psql -h $HOST_NAME -U $USER_NAME -d $DB_NAME -v ON_ERROR_STOP=1 -f $SCRIPT_TRIGGERS
+psql -h $HOST_NAME -U $USER_NAME -d $DB_NAME -c "SELECT * FROM eclipse_assign_tiles();"
+
+# Create the BCGS20k coverage table and triggers, and compute the coverage of every tile
+psql -h $HOST_NAME -U $USER_NAME -d $DB_NAME -v ON_ERROR_STOP=1 -f $SCRIPT_COVERAGE
+psql -h $HOST_NAME -U $USER_NAME -d $DB_NAME -c "SELECT eclipse_refresh_coverage();"
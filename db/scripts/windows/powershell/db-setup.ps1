@@ -19,17 +19,25 @@ Write-Host "  Database creation and table generation complete."
 psql -h $HOST_NAME -d $DB_NAME -U $USER_NAME -f $SCRIPT_REFTABLE
 Write-Host "  Initial reference tables generated."
 
-# Read and insert BCGS 2500K and 20K tile geometry into reference tables
+# Read and insert BCGS 2500K and 20K tile geometry into reference tables (-D: COPY instead of one INSERT per tile)
 Write-Host "  Creating BCGS reference tables ..."
 # -- BCGS20K Grid insertion
 Set-ACL -Path $BCGS_SHP_DIR_20K -AclObject (Get-Acl -Path $BCGS_SHP_DIR_20K).SetAccessRule((New-Object System.Security.AccessControl.FileSystemAccessRule("Everyone","FullControl","Allow")))
-shp2pgsql -c -m $COLUMN_MAP_20K -W $ENCODING $BCGS_SHP_20K $TABLE_BCGS20K | psql -h $HOST_NAME -d $DB_NAME -U $USER_NAME
+shp2pgsql -c -D -s $EPSG_ALBERS_CSRS -g geometry -m $COLUMN_MAP_20K -W $ENCODING $BCGS_SHP_20K $TABLE_BCGS20K | psql -h $HOST_NAME -d $DB_NAME -U $USER_NAME
 Write-Host "  BCGS20K reference table done."
 # -- BCGS2500K Grid insertion
 Set-ACL -Path $BCGS_SHP_DIR_2500K -AclObject (Get-Acl -Path $BCGS_SHP_DIR_2500K).SetAccessRule((New-Object System.Security.AccessControl.FileSystemAccessRule("Everyone","FullControl","Allow")))
-shp2pgsql -c -m $COLUMN_MAP_2500K -W $ENCODING $BCGS_SHP_2500K $TABLE_BCGS2500K | psql -h $HOST_NAME -d $DB_NAME -U $USER_NAME
+shp2pgsql -c -D -s $EPSG_ALBERS_CSRS -g geometry -m $COLUMN_MAP_2500K -W $ENCODING $BCGS_SHP_2500K $TABLE_BCGS2500K | psql -h $HOST_NAME -d $DB_NAME -U $USER_NAME
 Write-Host "  BCGS2500K reference table done."
 
 # Run post insertion
 psql -h $HOST_NAME -d $DB_NAME -U $USER_NAME -f $SCRIPT_INSERTION
+
+# Create the BCGS tile assignment triggers
+psql -h $HOST_NAME -d $DB_NAME -U $USER_NAME -f $SCRIPT_TRIGGERS
+Write-Host "  BCGS tile assignment triggers created."
+
+# Create the BCGS20k coverage table and triggers
+psql -h $HOST_NAME -d $DB_NAME -U $USER_NAME -f $SCRIPT_COVERAGE
+Write-Host "  BCGS20k coverage created."
 Write-Host "================ Complete! ================"
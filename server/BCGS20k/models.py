@@ -6,10 +6,25 @@ from django.contrib.gis.db import models as gismodels
 class BCGS20k(models.Model):
 
     tile_20k = models.CharField(max_length=32, blank=True, primary_key=True)
-    geometry = gismodels.MultiPolygonField(geography=True, blank=True, null=True)
+    geometry = gismodels.MultiPolygonField(srid=3005, blank=True, null=True)
     priority = models.BooleanField(blank=True, null=True)
     is_covered = models.BooleanField(blank=True, null=True)
 
     class Meta:
         managed = False
         db_table = 'bcgs20k'
+
+
+class BCGS20kCoverage(models.Model):
+
+    """LiDAR coverage of a 20k tile, maintained by the database (see 'db/eclipse_coverage.sql')."""
+
+    tile_20k = models.OneToOneField('BCGS20k', models.DO_NOTHING, primary_key=True, db_column='tile_20k')
+    covered_area = models.FloatField()
+    coverage = models.FloatField()
+    tile_count = models.IntegerField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = 'bcgs20kcoverage'
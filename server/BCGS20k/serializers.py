@@ -1,8 +1,16 @@
 from rest_framework import serializers
-from .models import BCGS20k
+from eclipse.fields import DynamicFieldsMixin
+from .models import BCGS20k, BCGS20kCoverage
 
 
-class BCGS20kSerializer(serializers.ModelSerializer):
+class BCGS20kSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = BCGS20k
         fields = '__all__'
+
+
+class BCGS20kCoverageSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = BCGS20kCoverage
+        fields = '__all__'
+        read_only_fields = ['covered_area', 'coverage', 'tile_count', 'updated_at']
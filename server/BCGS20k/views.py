@@ -1,9 +1,49 @@
 # Create your views here.
+from django_filters import rest_framework as filters
 from rest_framework import viewsets
-from .models import BCGS20k
-from .serializers import BCGS20kSerializer
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from eclipse.cache import CachedResponseMixin
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS, RANGE_LOOKUPS
+from .models import BCGS20k, BCGS20kCoverage
+from .serializers import BCGS20kSerializer, BCGS20kCoverageSerializer
 
 
-class BCGS20kViewSet(viewsets.ModelViewSet):
+class BCGS20kCoverageFilter(filters.FilterSet):
+    class Meta:
+        model = BCGS20kCoverage
+        fields = {
+            'tile_20k': EXACT_LOOKUPS,
+            'coverage': RANGE_LOOKUPS,
+            'tile_count': RANGE_LOOKUPS,
+        }
+
+
+class BCGS20kViewSet(CachedResponseMixin, FieldsMixin, viewsets.ModelViewSet):
     queryset = BCGS20k.objects.all()
     serializer_class = BCGS20kSerializer
+    # is_covered is maintained by the coverage triggers on LidarTile
+    cache_depends_on = ('lidartile',)
+    filterset_fields = {
+        'tile_20k': EXACT_LOOKUPS,
+        'priority': ['exact'],
+        'is_covered': ['exact'],
+    }
+
+    @action(detail=False, methods=['get'])
+    def coverage(self, request):
+
+        """
+        List the LiDAR coverage of the 20k tiles (e.g. '?coverage__lte=0.5', '?tile_20k__in=...').
+
+        Coverage is maintained incrementally by the database as LidarTiles are ingested.
+        """
+
+        filterset = BCGS20kCoverageFilter(request.query_params, BCGS20kCoverage.objects.all(), request=request)
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        page = self.paginate_queryset(filterset.qs)
+        serializer = BCGS20kCoverageSerializer(page, many=True, context=self.get_serializer_context())
+        return self.get_paginated_response(serializer.data)
@@ -5,10 +5,10 @@ from django.contrib.gis.db import models as gisModels
 class BCGS2500k(models.Model):
 
     tile_2500k = models.CharField(max_length=32, blank=True, primary_key=True)
-    geometry = gisModels.MultiPolygonField(geography=True, blank=True, null=True)
-    tile_20k = models.ForeignKey('BCGS20k.BCGS20k', models.DO_NOTHING, blank=True, null=True)
-    lidar_id = models.ForeignKey('LidarTile.LidarTile', models.DO_NOTHING, blank=True, null=True)
-    epsg_code = models.ForeignKey('SpatialReference.SpatialReference', models.DO_NOTHING, blank=True, null=True)
+    geometry = gisModels.MultiPolygonField(srid=3005, blank=True, null=True)
+    tile_20k = models.ForeignKey('BCGS20k.BCGS20k', models.DO_NOTHING, blank=True, null=True, db_column='tile_20k')
+    lidar_id = models.ForeignKey('LidarTile.LidarTile', models.DO_NOTHING, blank=True, null=True, db_column='lidar_id')
+    epsg_code = models.ForeignKey('SpatialReference.SpatialReference', models.DO_NOTHING, blank=True, null=True, db_column='epsg_code')
 
     class Meta:
         managed = False
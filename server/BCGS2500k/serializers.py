@@ -1,7 +1,8 @@
 from rest_framework import serializers
+from eclipse.fields import DynamicFieldsMixin
 from .models import BCGS2500k
 
-class BCGS2500kSerializer(serializers.ModelSerializer):
+class BCGS2500kSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = BCGS2500k
         fields = '__all__'
\ No newline at end of file
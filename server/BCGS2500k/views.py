@@ -1,9 +1,18 @@
 # Create your views here.
 from rest_framework import viewsets
+from eclipse.cache import CachedResponseMixin
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS
 from .models import BCGS2500k
 from .serializers import BCGS2500kSerializer
 
 
-class BCGS2500kViewSet(viewsets.ModelViewSet):
+class BCGS2500kViewSet(CachedResponseMixin, FieldsMixin, viewsets.ModelViewSet):
     queryset = BCGS2500k.objects.all()
     serializer_class = BCGS2500kSerializer
+    filterset_fields = {
+        'tile_2500k': EXACT_LOOKUPS,
+        'tile_20k': EXACT_LOOKUPS,
+        'lidar_id': EXACT_LOOKUPS,
+        'epsg_code': EXACT_LOOKUPS,
+    }
@@ -1,9 +1,10 @@
 # Delivery/serializers.py
 from rest_framework import serializers
+from eclipse.fields import DynamicFieldsMixin
 from .models import Delivery
 
 
-class DeliverySerializer(serializers.ModelSerializer):
+class DeliverySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
 
     class Meta:
         model = Delivery
@@ -1,8 +1,16 @@
 from rest_framework import viewsets
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS, RANGE_LOOKUPS
 from .models import Delivery
 from .serializers import DeliverySerializer
 
 
-class DeliveryViewSet(viewsets.ModelViewSet):
+class DeliveryViewSet(FieldsMixin, viewsets.ModelViewSet):
     queryset = Delivery.objects.all()
     serializer_class = DeliverySerializer
+    filterset_fields = {
+        'id': EXACT_LOOKUPS,
+        'receiver_name': EXACT_LOOKUPS,
+        'comments': EXACT_LOOKUPS,
+        'date': RANGE_LOOKUPS,
+    }
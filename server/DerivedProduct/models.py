@@ -18,9 +18,10 @@ class DerivedProduct(models.Model):
     x_max = models.DecimalField(max_digits=10, decimal_places=3, blank=True, null=True)
     y_min = models.DecimalField(max_digits=10, decimal_places=3, blank=True, null=True)
     y_max = models.DecimalField(max_digits=10, decimal_places=3, blank=True, null=True)
-    bounding_box = gisModels.PolygonField(blank=True, null=True)
-    epsg_code = models.ForeignKey('SpatialReference.SpatialReference', models.DO_NOTHING, blank=True, null=True)
+    bounding_box = gisModels.PolygonField(srid=3005, blank=True, null=True)
+    epsg_code = models.ForeignKey('SpatialReference.SpatialReference', models.DO_NOTHING, blank=True, null=True, db_column='epsg_code')
     nas = models.ForeignKey('NASBox.NASBox', models.DO_NOTHING, blank=True, null=True)
+    tile_20k = models.ForeignKey('BCGS20k.BCGS20k', models.DO_NOTHING, blank=True, null=True, db_column='tile_20k')
 
     class Meta:
         managed = False
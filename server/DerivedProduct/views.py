@@ -1,8 +1,33 @@
 # Create your views here.
+from django_filters import rest_framework as filters
 from rest_framework import viewsets
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS, GEO_FILTER_BACKENDS, NumberInFilter
+from eclipse.pagination import GeoJsonCursorPagination
 from .models import DerivedProduct
 from .serializers import DerivedProductSerializer
 
-class DerivedProductViewSet(viewsets.ModelViewSet):
+class DerivedProductFilter(filters.FilterSet):
+    # 'nas_id' as on the other catalog endpoints
+    nas_id = filters.NumberFilter(field_name='nas')
+    nas_id__in = NumberInFilter(field_name='nas')
+
+    class Meta:
+        model = DerivedProduct
+        fields = {
+            'id': EXACT_LOOKUPS,
+            'derived_product_type': EXACT_LOOKUPS,
+            'file_name': EXACT_LOOKUPS,
+            'epsg_code': EXACT_LOOKUPS,
+            'nas': EXACT_LOOKUPS,
+            'tile_20k': EXACT_LOOKUPS,
+        }
+
+
+class DerivedProductViewSet(FieldsMixin, viewsets.ModelViewSet):
     queryset = DerivedProduct.objects.all()
-    serializer_class = DerivedProductSerializer
\ No newline at end of file
+    serializer_class = DerivedProductSerializer
+    pagination_class = GeoJsonCursorPagination
+    filter_backends = GEO_FILTER_BACKENDS
+    geo_filter_field = 'bounding_box'
+    filterset_class = DerivedProductFilter
@@ -1,8 +1,9 @@
 from rest_framework import serializers
+from eclipse.fields import DynamicFieldsMixin
 from .models import Drive
 
 
-class DriveSerializer(serializers.ModelSerializer):
+class DriveSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Drive
         fields = ['id', 'nas_id', 'delivery_id', 'storage_total_gb', 'storage_used_gb', 'serial_number', 'file_count']
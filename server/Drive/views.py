@@ -1,9 +1,33 @@
 # Create your views here.
+from django_filters import rest_framework as filters
 from rest_framework import viewsets
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS, RANGE_LOOKUPS, NumberInFilter
 from .models import Drive
 from .serializers import DriveSerializer
 
 
-class DriveViewSet(viewsets.ModelViewSet):
+class DriveFilter(filters.FilterSet):
+    # the client filters the foreign keys by their column names
+    nas_id = filters.NumberFilter(field_name='nas')
+    nas_id__in = NumberInFilter(field_name='nas')
+    delivery_id = filters.NumberFilter(field_name='delivery')
+    delivery_id__in = NumberInFilter(field_name='delivery')
+
+    class Meta:
+        model = Drive
+        fields = {
+            'id': EXACT_LOOKUPS,
+            'serial_number': EXACT_LOOKUPS,
+            'file_count': RANGE_LOOKUPS,
+            'storage_total_gb': RANGE_LOOKUPS,
+            'storage_used_gb': RANGE_LOOKUPS,
+            'nas': EXACT_LOOKUPS,
+            'delivery': EXACT_LOOKUPS,
+        }
+
+
+class DriveViewSet(FieldsMixin, viewsets.ModelViewSet):
     queryset = Drive.objects.all()
     serializer_class = DriveSerializer
+    filterset_class = DriveFilter
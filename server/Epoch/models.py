@@ -6,7 +6,7 @@ class Epoch(models.Model):
     id = models.AutoField(primary_key=True)
     epoch_year = models.IntegerField(blank=True, null=True)
     description = models.TextField(blank=True, null=True)
-    epsg_code = models.ForeignKey('SpatialReference.SpatialReference', models.DO_NOTHING, blank=True, null=True)
+    epsg_code = models.ForeignKey('SpatialReference.SpatialReference', models.DO_NOTHING, blank=True, null=True, db_column='epsg_code')
 
     class Meta:
         managed = False
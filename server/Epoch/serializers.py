@@ -1,7 +1,8 @@
 from rest_framework import serializers
+from eclipse.fields import DynamicFieldsMixin
 from .models import Epoch
 
-class EpochSerializer(serializers.ModelSerializer):
+class EpochSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Epoch
         fields = '__all__'
\ No newline at end of file
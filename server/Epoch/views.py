@@ -1,9 +1,17 @@
 # Create your views here.
 from rest_framework import viewsets
+from eclipse.cache import CachedResponseMixin
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS, RANGE_LOOKUPS
 from .models import Epoch
 from .serializers import EpochSerializer
 
 
-class EpochViewSet(viewsets.ModelViewSet):
+class EpochViewSet(CachedResponseMixin, FieldsMixin, viewsets.ModelViewSet):
     queryset = Epoch.objects.all()
     serializer_class = EpochSerializer
+    filterset_fields = {
+        'id': EXACT_LOOKUPS,
+        'epoch_year': RANGE_LOOKUPS,
+        'epsg_code': EXACT_LOOKUPS,
+    }
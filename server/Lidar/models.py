@@ -14,9 +14,10 @@ class Lidar(models.Model):
     y_max = models.DecimalField(max_digits=10, decimal_places=3, blank=True, null=True)
     lidar_type = models.CharField(max_length=1, blank=True, null=True)
     version = models.FloatField(blank=True, null=True)
-    epsg_code = models.ForeignKey('SpatialReference.SpatialReference', models.DO_NOTHING, blank=True, null=True)
-    nas_id = models.ForeignKey('NASBox.NASBox', models.DO_NOTHING, blank=True, null=True)
-    trajectory_id = models.ForeignKey('Trajectory.Trajectory', models.DO_NOTHING, blank=True, null=True)
+    point_record_format = models.SmallIntegerField(blank=True, null=True)
+    epsg_code = models.ForeignKey('SpatialReference.SpatialReference', models.DO_NOTHING, blank=True, null=True, db_column='epsg_code')
+    nas_id = models.ForeignKey('NASBox.NASBox', models.DO_NOTHING, blank=True, null=True, db_column='nas_id')
+    trajectory_id = models.ForeignKey('Trajectory.Trajectory', models.DO_NOTHING, blank=True, null=True, db_column='trajectory_id')
 
     class Meta:
         managed = False
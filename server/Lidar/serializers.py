@@ -1,7 +1,8 @@
 from rest_framework import serializers
+from eclipse.fields import DynamicFieldsMixin
 from .models import Lidar
 
-class LidarSerializer(serializers.ModelSerializer):
+class LidarSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Lidar
         fields = '__all__'
@@ -1,9 +1,22 @@
 # Create your views here.
 from rest_framework import viewsets
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS, RANGE_LOOKUPS
+from eclipse.bulk import BulkCreateMixin
 from .models import Lidar
 from .serializers import LidarSerializer
 
 
-class LidarViewSet(viewsets.ModelViewSet):
+class LidarViewSet(BulkCreateMixin, FieldsMixin, viewsets.ModelViewSet):
     queryset = Lidar.objects.all()
     serializer_class = LidarSerializer
+    filterset_fields = {
+        'id': EXACT_LOOKUPS,
+        'file_name': EXACT_LOOKUPS,
+        'lidar_type': EXACT_LOOKUPS,
+        'version': RANGE_LOOKUPS,
+        'point_record_format': EXACT_LOOKUPS,
+        'epsg_code': EXACT_LOOKUPS,
+        'nas_id': EXACT_LOOKUPS,
+        'trajectory_id': EXACT_LOOKUPS,
+    }
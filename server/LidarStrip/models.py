@@ -4,8 +4,8 @@ from django.contrib.gis.db import models as gisModels
 # Create your models here.
 class LidarStrip(models.Model):
 
-    id = models.OneToOneField('Lidar.Lidar', on_delete=models.CASCADE, primary_key=True)
-    convex_hull = gisModels.PolygonField(blank=True, null=True)
+    id = models.OneToOneField('Lidar.Lidar', on_delete=models.CASCADE, primary_key=True, db_column='id')
+    convex_hull = gisModels.PolygonField(srid=3005, blank=True, null=True)
     file_source_id = models.IntegerField(blank=True, null=True)
 
     class Meta:
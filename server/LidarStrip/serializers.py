@@ -1,7 +1,10 @@
-from rest_framework import serializers
+from rest_framework_gis import serializers
+from eclipse.fields import DynamicFieldsMixin
 from .models import LidarStrip
 
-class LidarStripSerializer(serializers.ModelSerializer):
+
+class LidarStripSerializer(DynamicFieldsMixin, serializers.GeoFeatureModelSerializer):
     class Meta:
         model = LidarStrip
-        fields = '__all__'
\ No newline at end of file
+        geo_field = 'convex_hull'
+        fields = '__all__'
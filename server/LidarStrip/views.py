@@ -1,9 +1,20 @@
 # Create your views here.
 from rest_framework import viewsets
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS, GEO_FILTER_BACKENDS
+from eclipse.pagination import GeoJsonCursorPagination
+from eclipse.bulk import BulkCreateMixin
 from .models import LidarStrip
 from .serializers import LidarStripSerializer
 
 
-class LidarStripViewSet(viewsets.ModelViewSet):
+class LidarStripViewSet(BulkCreateMixin, FieldsMixin, viewsets.ModelViewSet):
     queryset = LidarStrip.objects.all()
     serializer_class = LidarStripSerializer
+    pagination_class = GeoJsonCursorPagination
+    filter_backends = GEO_FILTER_BACKENDS
+    geo_filter_field = 'convex_hull'
+    filterset_fields = {
+        'id': EXACT_LOOKUPS,
+        'file_source_id': EXACT_LOOKUPS,
+    }
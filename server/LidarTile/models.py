@@ -4,9 +4,11 @@ from django.contrib.gis.db import models as gisModels
 # Create your models here.
 class LidarTile(models.Model):
 
-    id = models.OneToOneField('Lidar.Lidar', on_delete=models.CASCADE, primary_key=True)
-    bounding_box = gisModels.PolygonField(blank=True, null=True)
-    tile_2500k = models.ForeignKey('BCGS2500k.BCGS2500k', models.DO_NOTHING, blank=True, null=True)
+    id = models.OneToOneField('Lidar.Lidar', on_delete=models.CASCADE, primary_key=True, db_column='id')
+    bounding_box = gisModels.PolygonField(srid=3005, blank=True, null=True)
+    footprint = gisModels.MultiPolygonField(srid=3005, blank=True, null=True)
+    density = models.JSONField(blank=True, null=True)
+    tile_2500k = models.ForeignKey('BCGS2500k.BCGS2500k', models.DO_NOTHING, blank=True, null=True, db_column='tile_2500k')
 
     class Meta:
         managed = False
@@ -1,7 +1,10 @@
-from rest_framework import serializers
+from rest_framework_gis import serializers
+from eclipse.fields import DynamicFieldsMixin
 from .models import LidarTile
 
-class LidarTileSerializer(serializers.ModelSerializer):
+
+class LidarTileSerializer(DynamicFieldsMixin, serializers.GeoFeatureModelSerializer):
     class Meta:
         model = LidarTile
-        fields = '__all__'
\ No newline at end of file
+        geo_field = 'bounding_box'
+        fields = '__all__'
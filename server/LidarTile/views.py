@@ -1,9 +1,21 @@
 # Create your views here.
 from rest_framework import viewsets
+from eclipse.cache import CacheInvalidationMixin
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS, GEO_FILTER_BACKENDS
+from eclipse.pagination import GeoJsonCursorPagination
+from eclipse.bulk import BulkCreateMixin
 from .models import LidarTile
 from .serializers import LidarTileSerializer
 
 
-class LidarTileViewSet(viewsets.ModelViewSet):
+class LidarTileViewSet(CacheInvalidationMixin, BulkCreateMixin, FieldsMixin, viewsets.ModelViewSet):
     queryset = LidarTile.objects.all()
     serializer_class = LidarTileSerializer
+    pagination_class = GeoJsonCursorPagination
+    filter_backends = GEO_FILTER_BACKENDS
+    geo_filter_field = 'bounding_box'
+    filterset_fields = {
+        'id': EXACT_LOOKUPS,
+        'tile_2500k': EXACT_LOOKUPS,
+    }
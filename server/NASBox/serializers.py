@@ -1,7 +1,8 @@
 from rest_framework import serializers
+from eclipse.fields import DynamicFieldsMixin
 from .models import NASBox
 
-class NASboxSerializer(serializers.ModelSerializer):
+class NASboxSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = NASBox
         fields = '__all__'
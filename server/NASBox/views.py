@@ -2,9 +2,16 @@ from django.shortcuts import render
 
 # Create your views here.
 from rest_framework import viewsets
+from eclipse.cache import CachedResponseMixin
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS
 from .models import NASBox
 from .serializers import NASboxSerializer
 
-class NASboxViewSet(viewsets.ModelViewSet):
+class NASboxViewSet(CachedResponseMixin, FieldsMixin, viewsets.ModelViewSet):
     queryset = NASBox.objects.all()
     serializer_class = NASboxSerializer
+    filterset_fields = {
+        'id': EXACT_LOOKUPS,
+        'name': EXACT_LOOKUPS,
+    }
@@ -16,7 +16,7 @@ class ProcessingStatus(models.Model):
     timestamp = models.DateTimeField(default=datetime.now, blank=True, null=True)
     processed_by = models.CharField(max_length=255, blank=True, null=True)
     comments = models.CharField(max_length=255, blank=True, null=True)
-    lidar_id = models.ForeignKey('Lidar.Lidar', models.DO_NOTHING, blank=True, null=True)
+    lidar_id = models.ForeignKey('Lidar.Lidar', models.DO_NOTHING, blank=True, null=True, db_column='lidar_id')
 
     class Meta:
         managed = False
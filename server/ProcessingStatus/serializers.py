@@ -1,7 +1,8 @@
 from rest_framework import serializers
+from eclipse.fields import DynamicFieldsMixin
 from .models import ProcessingStatus
 
-class ProcessingStatusSerializer(serializers.ModelSerializer):
+class ProcessingStatusSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ProcessingStatus
         fields = '__all__'
\ No newline at end of file
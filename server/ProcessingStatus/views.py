@@ -1,9 +1,17 @@
 # Create your views here.
 from rest_framework import viewsets
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS, RANGE_LOOKUPS
 from .models import ProcessingStatus
 from .serializers import ProcessingStatusSerializer
 
 
-class ProcessingStatusViewSet(viewsets.ModelViewSet):
+class ProcessingStatusViewSet(FieldsMixin, viewsets.ModelViewSet):
     queryset = ProcessingStatus.objects.all()
     serializer_class = ProcessingStatusSerializer
+    filterset_fields = {
+        'id': EXACT_LOOKUPS,
+        'status': EXACT_LOOKUPS,
+        'timestamp': RANGE_LOOKUPS,
+        'lidar_id': EXACT_LOOKUPS,
+    }
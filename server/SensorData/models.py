@@ -8,9 +8,10 @@ class SensorData(models.Model):
     file_name = models.CharField(max_length=255, blank=True, null=True)
     file_path = models.CharField(max_length=255, blank=True, null=True)
     file_size = models.CharField(max_length=255, blank=True, null=True)
-    nas_id = models.ForeignKey('NASBox.NASBox', models.DO_NOTHING, blank=True, null=True)
-    delivery_id = models.ForeignKey('Delivery.Delivery', models.DO_NOTHING, blank=True, null=True)
-    trajectory_id = models.ForeignKey('Trajectory.Trajectory', models.DO_NOTHING, blank=True, null=True)
+    checksum = models.CharField(max_length=128, blank=True, null=True)
+    nas_id = models.ForeignKey('NASBox.NASBox', models.DO_NOTHING, blank=True, null=True, db_column='nas_id')
+    delivery_id = models.ForeignKey('Delivery.Delivery', models.DO_NOTHING, blank=True, null=True, db_column='delivery_id')
+    trajectory_id = models.ForeignKey('Trajectory.Trajectory', models.DO_NOTHING, blank=True, null=True, db_column='trajectory_id')
 
     class Meta:
         managed = False
@@ -1,8 +1,9 @@
 from rest_framework import serializers
+from eclipse.fields import DynamicFieldsMixin
 from .models import SensorData
 
 
-class SensorDataSerializer(serializers.ModelSerializer):
+class SensorDataSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = SensorData
         fields = '__all__'
@@ -1,9 +1,22 @@
 # Create your views here.
 from rest_framework import viewsets
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS
+from eclipse.bulk import BulkCreateMixin
 from .models import SensorData
 from .serializers import SensorDataSerializer
 
 
-class SensorDataViewSet(viewsets.ModelViewSet):
+class SensorDataViewSet(BulkCreateMixin, FieldsMixin, viewsets.ModelViewSet):
     queryset = SensorData.objects.all()
     serializer_class = SensorDataSerializer
+    filterset_fields = {
+        'id': EXACT_LOOKUPS,
+        'file_name': EXACT_LOOKUPS,
+        'file_path': EXACT_LOOKUPS,
+        'file_size': EXACT_LOOKUPS,
+        'checksum': EXACT_LOOKUPS,
+        'nas_id': EXACT_LOOKUPS,
+        'delivery_id': EXACT_LOOKUPS,
+        'trajectory_id': EXACT_LOOKUPS,
+    }
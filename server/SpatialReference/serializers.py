@@ -1,7 +1,8 @@
 from rest_framework import serializers
+from eclipse.fields import DynamicFieldsMixin
 from .models import SpatialReference
 
-class SpatialReferenceSerializer(serializers.ModelSerializer):
+class SpatialReferenceSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = SpatialReference
         fields = '__all__'
\ No newline at end of file
@@ -1,9 +1,15 @@
 # Create your views here.
 from rest_framework import viewsets
+from eclipse.cache import CachedResponseMixin
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS
 from .models import SpatialReference
 from .serializers import SpatialReferenceSerializer
 
 
-class SpatialReferenceViewSet(viewsets.ModelViewSet):
+class SpatialReferenceViewSet(CachedResponseMixin, FieldsMixin, viewsets.ModelViewSet):
     queryset = SpatialReference.objects.all()
     serializer_class = SpatialReferenceSerializer
+    filterset_fields = {
+        'epsg_code': EXACT_LOOKUPS,
+    }
@@ -8,7 +8,7 @@ class Trajectory(models.Model):
     file_name = models.CharField(max_length=255, blank=True, null=True)
     file_path = models.CharField(max_length=255, blank=True, null=True)
     file_size = models.CharField(max_length=255, blank=True, null=True)
-    nas_id = models.ForeignKey('NASBox.NASBox', models.DO_NOTHING, blank=True, null=True)
+    nas_id = models.ForeignKey('NASBox.NASBox', models.DO_NOTHING, blank=True, null=True, db_column='nas_id')
 
     class Meta:
         managed = False
@@ -1,8 +1,9 @@
 from rest_framework import serializers
+from eclipse.fields import DynamicFieldsMixin
 from .models import Trajectory
 
 
-class TrajectorySerializer(serializers.ModelSerializer):
+class TrajectorySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Trajectory
         fields = '__all__'
@@ -1,9 +1,16 @@
 # Create your views here.
 from rest_framework import viewsets
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS
 from .models import Trajectory
 from .serializers import TrajectorySerializer
 
 
-class TrajectoryViewSet(viewsets.ModelViewSet):
+class TrajectoryViewSet(FieldsMixin, viewsets.ModelViewSet):
     queryset = Trajectory.objects.all()
     serializer_class = TrajectorySerializer
+    filterset_fields = {
+        'id': EXACT_LOOKUPS,
+        'file_name': EXACT_LOOKUPS,
+        'nas_id': EXACT_LOOKUPS,
+    }
@@ -4,7 +4,7 @@ from django.db import models
 class UTMZone(models.Model):
 
     zone_number = models.IntegerField(primary_key=True)
-    delivery = models.ForeignKey('SpatialReference.SpatialReference', models.DO_NOTHING, blank=True, null=True)
+    delivery = models.ForeignKey('SpatialReference.SpatialReference', models.DO_NOTHING, blank=True, null=True, db_column='epsg_code')
 
     class Meta:
         managed = False
@@ -1,7 +1,8 @@
 from rest_framework import serializers
+from eclipse.fields import DynamicFieldsMixin
 from .models import UTMZone
 
-class UTMZoneSerializer(serializers.ModelSerializer):
+class UTMZoneSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = UTMZone
         fields = '__all__'
\ No newline at end of file
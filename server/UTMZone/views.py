@@ -1,8 +1,27 @@
 # Create your views here.
+from django_filters import rest_framework as filters
 from rest_framework import viewsets
+from eclipse.cache import CachedResponseMixin
+from eclipse.fields import FieldsMixin
+from eclipse.filters import EXACT_LOOKUPS, NumberInFilter
 from .models import UTMZone
-from .serializers import UTMZone
+from .serializers import UTMZoneSerializer
 
-class UTMZoneViewSet(viewsets.ModelViewSet):
+
+class UTMZoneFilter(filters.FilterSet):
+    # 'delivery' is the epsg_code column (a SpatialReference)
+    epsg_code = filters.NumberFilter(field_name='delivery')
+    epsg_code__in = NumberInFilter(field_name='delivery')
+
+    class Meta:
+        model = UTMZone
+        fields = {
+            'zone_number': EXACT_LOOKUPS,
+            'delivery': EXACT_LOOKUPS,
+        }
+
+
+class UTMZoneViewSet(CachedResponseMixin, FieldsMixin, viewsets.ModelViewSet):
     queryset = UTMZone.objects.all()
-    serializer_class = UTMZone
\ No newline at end of file
+    serializer_class = UTMZoneSerializer
+    filterset_class = UTMZoneFilter
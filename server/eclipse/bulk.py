@@ -0,0 +1,79 @@
+# system imports
+import json
+
+# django imports
+from django.conf import settings
+from django.db import transaction
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.response import Response
+
+
+class JSONLinesParser(BaseParser):
+
+    """Parses a JSON lines (one JSON object per line) request body into a list of records."""
+
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        if stream is None:
+            return []
+
+        try:
+            lines = stream.read().decode(encoding).splitlines()
+            return [json.loads(line) for line in lines if line.strip()]
+        except ValueError as exc:
+            raise ParseError(f'JSON lines parse error - {exc}')
+
+
+class BulkCreateListSerializer(serializers.ListSerializer):
+
+    """List serializer that inserts all validated records with a single bulk_create."""
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        return model.objects.bulk_create(
+            [model(**attrs) for attrs in validated_data]
+        )
+
+
+class BulkCreateMixin:
+
+    """
+    ViewSet mixin adding a 'bulk/' endpoint that creates many records in one request.
+
+    POST a JSON list of records (or JSON lines, with the 'application/x-ndjson'
+    content type) to '<endpoint>/bulk/'. All records are validated, then inserted
+    in one transaction; if any record is invalid nothing is inserted and the
+    per-record errors are returned.
+    """
+
+    bulk_max_records = 10000
+
+    @action(detail=False, methods=['post'], url_path='bulk', parser_classes=[JSONParser, JSONLinesParser])
+    def bulk(self, request):
+        if not isinstance(request.data, list):
+            return Response({'detail': 'Expected a list of records.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if len(request.data) > self.bulk_max_records:
+            return Response(
+                {'detail': f'At most {self.bulk_max_records} records may be created per request.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = BulkCreateListSerializer(
+            child=self.get_serializer(), data=request.data, context=self.get_serializer_context()
+        )
+        if not serializer.is_valid():
+            # wrap the per-record errors so they can't be mistaken for created records
+            return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            serializer.save()
+
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -0,0 +1,303 @@
+"""
+Bulk loader of the reference and catalog tables.
+
+Records are streamed into a temporary staging table with COPY FROM STDIN (CSV),
+then merged into the target table with a single INSERT ... ON CONFLICT. Compared
+to row by row INSERTs (or the REST API), each batch costs one COPY and one merge
+statement, and the statement-level triggers of the target (BCGS tile assignment,
+coverage) fire once per batch.
+
+Archive backfills can be split into partitions (e.g. one CSV file per year) and
+loaded in parallel, one connection and transaction per partition; partitions
+should hold disjoint keys, otherwise the concurrent merges wait on each other.
+
+Geometry columns take EWKT ('SRID=3005;POLYGON(...)') or hex EWKB values.
+
+Each load invalidates the cached responses of the table (see eclipse.cache) when
+the Django settings are configured; scripts running the loader must set them up
+(DJANGO_SETTINGS_MODULE, with the server's ECLIPSE_CACHE_DIR) or clear the cache.
+
+>>> loader = CopyLoader('lidar')
+>>> loader.load_rows(rows)                                # rows of LOAD_SPECS['lidar'].columns
+>>> loader.load_files(['lidar_2019.csv', 'lidar_2020.csv'], workers=4)
+"""
+
+# system imports
+import io
+import csv
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, Iterator, NamedTuple, Optional, Sequence
+
+# django imports
+from django.conf import settings
+
+import psycopg2
+from psycopg2 import sql
+
+# user imports
+from eclipse.cache import invalidate
+
+
+class LoadSpec(NamedTuple):
+
+    """Target table of a bulk load, with its conflict key and default columns."""
+
+    table: str
+    key: tuple
+    columns: tuple
+
+
+LOAD_SPECS = {
+    'bcgs20k': LoadSpec('bcgs20k', ('tile_20k',), ('tile_20k', 'geometry')),
+    'bcgs2500k': LoadSpec('bcgs2500k', ('tile_2500k',), ('tile_2500k', 'tile_20k', 'geometry')),
+    'lidar': LoadSpec('lidar', ('id',), (
+        'id', 'file_name', 'file_path', 'file_size', 'x_min', 'x_max', 'y_min', 'y_max', 'lidar_type',
+        'version', 'point_record_format', 'epsg_code', 'nas_id', 'trajectory_id',
+    )),
+    'sensordata': LoadSpec('sensordata', ('id',), (
+        'id', 'file_name', 'file_path', 'file_size', 'checksum', 'nas_id', 'delivery_id', 'trajectory_id',
+    )),
+    'trajectory': LoadSpec('trajectory', ('id',), ('id', 'file_name', 'file_path', 'file_size', 'nas_id')),
+}
+
+
+def connection_params(alias: str = 'default') -> dict:
+
+    """Get the psycopg2 connection parameters of a database in the Django settings."""
+
+    db = settings.DATABASES[alias]
+    params = {
+        'dbname': db.get('NAME'),
+        'user': db.get('USER'),
+        'password': db.get('PASSWORD'),
+        'host': db.get('HOST'),
+        'port': db.get('PORT'),
+    }
+
+    return {k: v for k, v in params.items() if v}
+
+
+class CopyLoader:
+
+    """COPY based loader of one table (see the module docstring)."""
+
+    # Rows encoded per read of the CSV stream
+    STREAM_ROWS = 10000
+
+    def __init__(
+            self, table: str, columns: Optional[Sequence[str]] = None, update: bool = True,
+            params: Optional[dict] = None
+    ):
+
+        """
+        Initialize a CopyLoader object.
+
+        :param table: Name of the target table (a key of LOAD_SPECS).
+        :param columns: Columns of the loaded rows (defaults to the LOAD_SPECS columns).
+        :param update: Update the existing rows on a key conflict (else they are kept).
+        :param params: psycopg2 connection parameters (defaults to the Django 'default' database).
+        :raises ValueError: If the table has no load spec.
+        """
+
+        if table.lower() not in LOAD_SPECS:
+            raise ValueError(f"No load spec for table '{table}' (valid: {', '.join(LOAD_SPECS)})")
+
+        self._spec = LOAD_SPECS[table.lower()]
+        self._columns = tuple(columns) if columns else self._spec.columns
+        self._update = update
+        self._params = params if params is not None else connection_params()
+
+    @property
+    def table(self) -> str:
+        return self._spec.table
+
+    @property
+    def columns(self) -> tuple:
+        return self._columns
+
+    def load_rows(self, rows: Iterable[Sequence]) -> int:
+
+        """
+        Load rows, streamed to the server as CSV (rows are not held in memory).
+
+        None values are loaded as NULL.
+
+        :param rows: Rows of values, in the order of 'columns'.
+        :return: The number of rows inserted or updated.
+        """
+
+        return self._load(_CsvStream(rows, self.STREAM_ROWS), header=False)
+
+    def load_csv(self, path: str, header: bool = True) -> int:
+
+        """
+        Load a CSV file (columns in the order of 'columns', empty unquoted values as NULL).
+
+        :param path: Path of the CSV file.
+        :param header: Whether the first line of the file is a header.
+        :return: The number of rows inserted or updated.
+        """
+
+        with open(path, 'rb') as fp:
+            return self._load(fp, header=header)
+
+    def load_files(self, paths: Iterable[str], workers: int = 4, header: bool = True) -> int:
+
+        """
+        Load CSV files in parallel, one process, connection and transaction per file.
+
+        :param paths: Paths of the CSV files (partitions of disjoint keys).
+        :param workers: Number of concurrent loads.
+        :param header: Whether the first line of each file is a header.
+        :return: The number of rows inserted or updated.
+        """
+
+        paths = list(paths)
+        if workers <= 1 or len(paths) <= 1:
+            return sum(self.load_csv(path, header) for path in paths)
+
+        load = partial(_load_csv, self._spec.table, self._columns, self._update, self._params, header)
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths)), mp_context=context) as pool:
+            count = sum(pool.map(load, paths))
+
+        # the spawned workers don't load the Django settings, so they leave the cache as is
+        self._invalidate()
+
+        return count
+
+    def _load(self, stream, header: bool) -> int:
+
+        """COPY a CSV stream into a staging table and merge it into the target, in one transaction."""
+
+        stage = sql.Identifier(f'stage_{self._spec.table}')
+        columns = sql.SQL(', ').join(map(sql.Identifier, self._columns))
+        copy = sql.SQL('COPY {} ({}) FROM STDIN WITH (FORMAT csv, HEADER {})').format(
+            stage, columns, sql.SQL('true' if header else 'false')
+        )
+
+        conn = psycopg2.connect(**self._params)
+        try:
+            with conn, conn.cursor() as cur:
+                cur.execute(sql.SQL('CREATE TEMP TABLE {} (LIKE {} INCLUDING DEFAULTS) ON COMMIT DROP').format(
+                    stage, sql.Identifier(self._spec.table)
+                ))
+                cur.copy_expert(copy.as_string(conn), stream)
+                cur.execute(self._merge_sql(stage))
+                count = cur.rowcount
+                if self._has_serial_key():
+                    cur.execute(self._sequence_sql())
+        finally:
+            conn.close()
+
+        self._invalidate()
+
+        return count
+
+    def _invalidate(self):
+
+        """
+        Invalidate the cached responses of the table (see eclipse.cache).
+
+        Without Django settings (e.g. in a load_files() worker, or a script that
+        did not set them up) the cache is unknown, and the caller must invalidate it.
+        """
+
+        if settings.configured:
+            invalidate(self._spec.table)
+
+    def _merge_sql(self, stage: sql.Identifier) -> sql.Composed:
+
+        """Get the INSERT ... ON CONFLICT statement merging the staging table into the target."""
+
+        columns = sql.SQL(', ').join(map(sql.Identifier, self._columns))
+        merge = sql.SQL('INSERT INTO {} ({}) SELECT {} FROM {}').format(
+            sql.Identifier(self._spec.table), columns, columns, stage
+        )
+
+        # rows loaded without their key (e.g. new serial ids) can't conflict
+        if not set(self._spec.key) <= set(self._columns):
+            return merge
+
+        key = sql.SQL(', ').join(map(sql.Identifier, self._spec.key))
+        values = [c for c in self._columns if c not in self._spec.key]
+        if not self._update or not values:
+            return merge + sql.SQL(' ON CONFLICT ({}) DO NOTHING').format(key)
+
+        # a row can only be updated once per statement: keep the last staged row of a key
+        merge = sql.SQL('INSERT INTO {} ({}) SELECT DISTINCT ON ({}) {} FROM {} ORDER BY {}, ctid DESC').format(
+            sql.Identifier(self._spec.table), columns, key, columns, stage, key
+        )
+        assignments = sql.SQL(', ').join(
+            sql.SQL('{} = EXCLUDED.{}').format(sql.Identifier(c), sql.Identifier(c)) for c in values
+        )
+        return merge + sql.SQL(' ON CONFLICT ({}) DO UPDATE SET {}').format(key, assignments)
+
+    def _has_serial_key(self) -> bool:
+
+        """Check whether serial ids were loaded explicitly (the id sequence must then be moved past them)."""
+
+        return self._spec.key == ('id',) and 'id' in self._columns
+
+    def _sequence_sql(self) -> sql.Composed:
+
+        """Get the statement moving the id sequence of the target past the largest id."""
+
+        table = sql.Identifier(self._spec.table)
+        return sql.SQL(
+            "SELECT setval(pg_get_serial_sequence({}, 'id'), GREATEST((SELECT MAX(id) FROM {}), 1))"
+        ).format(sql.Literal(self._spec.table), table)
+
+
+def _load_csv(table: str, columns: tuple, update: bool, params: dict, header: bool, path: str) -> int:
+
+    """Load one CSV file in a worker process."""
+
+    return CopyLoader(table, columns, update, params).load_csv(path, header)
+
+
+class _CsvStream(io.RawIOBase):
+
+    """Read-only binary stream of rows encoded as CSV, encoded lazily as it is read (for COPY FROM STDIN)."""
+
+    def __init__(self, rows: Iterable[Sequence], batch_rows: int):
+        self._rows = iter(rows)
+        self._batch_rows = batch_rows
+        self._buffer = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while len(self._buffer) < len(b):
+            chunk = self._encode(self._batch_rows)
+            if not chunk:
+                break
+            self._buffer += chunk
+
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+
+        return n
+
+    def _encode(self, n_rows: int) -> bytes:
+
+        """Encode the next 'n_rows' rows (None as an empty unquoted value, i.e. NULL)."""
+
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator='\n')
+        for row in _take(self._rows, n_rows):
+            writer.writerow(['' if v is None else v for v in row])
+
+        return out.getvalue().encode('utf-8')
+
+
+def _take(it: Iterator, n: int) -> Iterator:
+    for _ in range(n):
+        try:
+            yield next(it)
+        except StopIteration:
+            return
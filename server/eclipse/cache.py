@@ -0,0 +1,135 @@
+"""
+Response cache of the (close to static) reference endpoints.
+
+Each table has a version in the Django cache, changed whenever the table is
+written through the API (or the bulk loader). GET responses of a cached viewset
+are stored rendered, keyed by the versions of the tables they depend on and the
+request URL (pagination links are absolute), and carry an ETag and Last-Modified
+built from those versions:
+
+- a repeated request with 'If-None-Match' (or 'If-Modified-Since') gets a 304,
+- any other repeated request is served from the cache, without querying the
+  database or serializing the geometries again.
+
+Writes never invalidate the stored responses directly; they change the version,
+so the next read misses, and the stale entries expire after the cache timeout.
+Last-Modified has a one second resolution: clients should revalidate with the ETag.
+"""
+
+# system imports
+import time
+import hashlib
+from math import ceil
+
+# django imports
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
+
+_VERSION_KEY = 'eclipse:version:{}'
+_RESPONSE_KEY = 'eclipse:response:{}'
+
+# Renderer formats whose responses are cached (the browsable API is rendered per request)
+CACHED_FORMATS = ('json', 'geojson')
+
+
+def table_version(table: str) -> int:
+
+    """Get the version of a table (ns timestamp of its last invalidation, or of its first read)."""
+
+    key = _VERSION_KEY.format(table)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+
+    return version
+
+
+def invalidate(*tables: str):
+
+    """Change the version of tables, so their cached responses are no longer served."""
+
+    version = time.time_ns()
+    cache.set_many({_VERSION_KEY.format(table): version for table in tables}, timeout=None)
+
+
+class CacheInvalidationMixin:
+
+    """
+    ViewSet mixin changing the cache version of the viewset's table after every
+    successful write (including custom actions such as 'bulk/').
+    """
+
+    def get_cache_table(self) -> str:
+        return self.get_queryset().model._meta.db_table
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if request.method not in SAFE_METHODS and status.is_success(response.status_code):
+            invalidate(self.get_cache_table())
+
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class CachedResponseMixin(CacheInvalidationMixin):
+
+    """
+    ViewSet mixin caching the list and detail responses (see the module docstring).
+
+    'cache_depends_on' lists other tables whose writes change the responses
+    (e.g. BCGS20k.is_covered is maintained by triggers on LidarTile).
+    """
+
+    cache_depends_on = ()
+    cache_timeout = None  # seconds (None: the cache backend's timeout)
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(super().retrieve, request, *args, **kwargs)
+
+    def _cached_response(self, view, request, *args, **kwargs):
+        if request.accepted_renderer.format not in CACHED_FORMATS:
+            return view(request, *args, **kwargs)
+
+        versions = [table_version(table) for table in (self.get_cache_table(), *self.cache_depends_on)]
+        key = hashlib.sha1(
+            repr((versions, request.build_absolute_uri(), request.accepted_media_type)).encode()
+        ).hexdigest()
+        etag = quote_etag(key)
+        last_modified = ceil(max(versions) / 1e9)
+
+        response = get_conditional_response(request._request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = cache.get(_RESPONSE_KEY.format(key))
+
+        if response is None:
+            response = view(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+
+            response = self._render(request, response)
+            cache.set(_RESPONSE_KEY.format(key), response, self.cache_timeout or cache.default_timeout)
+
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, no_cache=True)
+
+        return response
+
+    def _render(self, request, response) -> HttpResponse:
+
+        """Render a DRF response to a plain (picklable) HttpResponse."""
+
+        renderer = request.accepted_renderer
+        content = renderer.render(response.data, request.accepted_media_type, self.get_renderer_context())
+
+        content_type = request.accepted_media_type
+        if renderer.charset:
+            content_type = f'{content_type}; charset={renderer.charset}'
+
+        return HttpResponse(content, content_type=content_type)
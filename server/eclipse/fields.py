@@ -0,0 +1,63 @@
+# system imports
+from typing import Optional
+
+
+FIELDS_PARAM = 'fields'
+
+
+def requested_fields(request) -> Optional[set]:
+
+    """Get the field names requested with the 'fields' query parameter of a GET request, if any."""
+
+    if request is None or request.method != 'GET':
+        return None
+
+    value = request.query_params.get(FIELDS_PARAM)
+    if not value:
+        return None
+
+    return {field.strip() for field in value.split(',') if field.strip()}
+
+
+class DynamicFieldsMixin:
+
+    """
+    Serializer mixin limiting the serialized fields to those listed in the 'fields'
+    query parameter (e.g. '?fields=id,file_name'). Unknown field names are ignored.
+
+    The id and geometry fields of GeoJSON serializers (Meta.id_field and Meta.geo_field)
+    are always kept, since every feature needs them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        fields = requested_fields(self.context.get('request'))
+        if fields is None:
+            return
+
+        fields |= {getattr(self.Meta, 'id_field', None), getattr(self.Meta, 'geo_field', None)}
+        for name in set(self.fields) - fields:
+            self.fields.pop(name)
+
+
+class FieldsMixin:
+
+    """
+    ViewSet mixin deferring the model columns not listed in the 'fields' query
+    parameter, so they are not read from the database. Use with a serializer
+    extending DynamicFieldsMixin.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        fields = requested_fields(self.request)
+        if fields is None:
+            return queryset
+
+        # keep the geometry of GeoJSON serializers (the primary key is always loaded)
+        fields.add(getattr(self.get_serializer_class().Meta, 'geo_field', None))
+
+        columns = fields & {field.name for field in queryset.model._meta.concrete_fields}
+        return queryset.only(*columns) if columns else queryset
@@ -0,0 +1,135 @@
+"""
+Filters of the eclipse viewsets.
+
+Attribute filters use the django-filter 'filterset_fields' lookups below
+(e.g. '?nas_id=1', '?delivery_id__in=1,2,3', '?file_count__range=100,200').
+Foreign keys whose field name differs from the client parameter (e.g. Drive.nas
+for 'nas_id') are declared in a FilterSet with NumberFilter / NumberInFilter.
+Geometry filters (e.g. '?bbox=...', '?intersects=...') are filter backends.
+
+Unknown query parameters are rejected with a 400 (see StrictFilterBackend): a
+misnamed filter must not silently return the whole table.
+"""
+
+# system imports
+from typing import Optional
+
+# django imports
+from django.contrib.gis.gdal import GDALException
+from django.contrib.gis.geos import GEOSGeometry, GEOSException
+from django_filters.rest_framework import BaseInFilter, DjangoFilterBackend, NumberFilter
+from rest_framework.exceptions import ParseError, ValidationError
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+from rest_framework_gis.filters import InBBoxFilter
+
+# user imports
+from eclipse.fields import FIELDS_PARAM
+
+
+# Exact match and comma separated list (FK, id and text columns)
+EXACT_LOOKUPS = ['exact', 'in']
+
+# Exact match, list, and ranges (numeric and date columns)
+RANGE_LOOKUPS = ['exact', 'in', 'range', 'gte', 'lte']
+
+
+class NumberInFilter(BaseInFilter, NumberFilter):
+
+    """Comma separated list of numbers (e.g. declared '<name>__in' filters of foreign keys)."""
+
+
+class StrictFilterBackend(DjangoFilterBackend):
+
+    """
+    DjangoFilterBackend rejecting the query parameters that are neither a filter of the
+    view's filterset nor a parameter of its other backends, paginator or renderers.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        filterset = self.get_filterset(request, queryset, view)
+        if filterset is not None:
+            unknown = set(request.query_params) - set(filterset.filters) - self.get_reserved_params(view)
+            if unknown:
+                raise ValidationError({param: ['Unknown filter.'] for param in sorted(unknown)})
+
+        return super().filter_queryset(request, queryset, view)
+
+    def get_reserved_params(self, view) -> set:
+
+        """Get the query parameters handled outside the filterset."""
+
+        params = {FIELDS_PARAM, api_settings.URL_FORMAT_OVERRIDE}
+
+        paginator = getattr(view, 'paginator', None)
+        for attr in ('cursor_query_param', 'page_query_param', 'page_size_query_param', 'limit_query_param',
+                     'offset_query_param'):
+            params.add(getattr(paginator, attr, None))
+
+        for backend in getattr(view, 'filter_backends', ()):
+            for attr in ('bbox_param', 'intersects_param'):
+                params.add(getattr(backend, attr, None))
+
+        return params - {None}
+
+
+class BBoxFilter(InBBoxFilter):
+
+    """
+    Filter on the features intersecting a bounding box: '?bbox=<xmin>,<ymin>,<xmax>,<ymax>'.
+
+    Filters the geometry field named by the view's 'geo_filter_field'. The bbox coordinates
+    are in the SRID of that field. The lookup is an ST_Intersects, which is served by
+    the field's GiST index.
+    """
+
+    bbox_param = 'bbox'
+
+    def filter_queryset(self, request, queryset, view):
+        filter_field = getattr(view, 'geo_filter_field', None)
+        if not filter_field:
+            return queryset
+
+        bbox = self.get_filter_bbox(request)
+        if not bbox:
+            return queryset
+
+        return queryset.filter(**{f'{filter_field}__intersects': bbox})
+
+
+class IntersectsFilter(BaseFilterBackend):
+
+    """
+    Filter on the features intersecting a geometry: '?intersects=<WKT | EWKT | GeoJSON>'.
+
+    Filters the geometry field named by the view's 'geo_filter_field'. Geometries without
+    an SRID (e.g. plain WKT) are taken to be in the SRID of that field. Others (e.g.
+    'SRID=4326;POLYGON(...)') are transformed to it.
+    """
+
+    intersects_param = 'intersects'
+
+    def get_filter_geometry(self, request) -> Optional[GEOSGeometry]:
+        value = request.query_params.get(self.intersects_param, None)
+        if not value:
+            return None
+
+        try:
+            return GEOSGeometry(value)
+        except (GEOSException, GDALException, ValueError):
+            raise ParseError(f'Invalid geometry supplied for parameter {self.intersects_param}')
+
+    def filter_queryset(self, request, queryset, view):
+        filter_field = getattr(view, 'geo_filter_field', None)
+        if not filter_field:
+            return queryset
+
+        geometry = self.get_filter_geometry(request)
+        if geometry is None:
+            return queryset
+
+        return queryset.filter(**{f'{filter_field}__intersects': geometry})
+
+
+# Filter backends of the viewsets with a geometry field (see 'geo_filter_field')
+GEO_FILTER_BACKENDS = [StrictFilterBackend, BBoxFilter, IntersectsFilter]
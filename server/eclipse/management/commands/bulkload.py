@@ -0,0 +1,32 @@
+"""
+Bulk load CSV files into a reference or catalog table (see eclipse.bulk_load).
+
+python manage.py bulkload lidar lidar_2019.csv lidar_2020.csv --workers 4
+python manage.py bulkload bcgs20k bcgs20k.csv --columns tile_20k geometry --keep
+"""
+
+# django imports
+from django.core.management.base import BaseCommand, CommandError
+
+# user imports
+from eclipse.bulk_load import LOAD_SPECS, CopyLoader
+
+
+class Command(BaseCommand):
+    help = "Bulk load CSV files into a table with COPY, merging on the table key."
+
+    def add_arguments(self, parser):
+        parser.add_argument('table', choices=sorted(LOAD_SPECS))
+        parser.add_argument('paths', nargs='+', help="CSV files (one partition each, with a header line)")
+        parser.add_argument('--columns', nargs='+', help="Columns of the files (default: the table load spec)")
+        parser.add_argument('--workers', type=int, default=1, help="Number of partitions loaded concurrently")
+        parser.add_argument('--keep', action='store_true', help="Keep the existing rows on a key conflict")
+
+    def handle(self, *args, **options):
+        loader = CopyLoader(options['table'], options['columns'], update=not options['keep'])
+        try:
+            count = loader.load_files(options['paths'], workers=options['workers'])
+        except OSError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(f"Loaded {count} rows into {loader.table}"))
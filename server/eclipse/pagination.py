@@ -0,0 +1,38 @@
+# system imports
+from collections import OrderedDict
+
+# django imports
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class EclipseCursorPagination(CursorPagination):
+
+    """
+    Keyset (cursor) pagination ordered by primary key.
+
+    Each page is fetched with an indexed 'WHERE pk > <cursor> ORDER BY pk LIMIT n'
+    query, so the cost of a page does not grow with the size of the table or the
+    depth of the page (unlike LIMIT/OFFSET pagination). Follow the 'next' link of
+    a page to get the next one.
+    """
+
+    ordering = 'pk'
+    page_size_query_param = 'page_size'
+    max_page_size = 10000
+
+
+class GeoJsonCursorPagination(EclipseCursorPagination):
+
+    """
+    Cursor pagination of GeoJSON serializers: each page is a FeatureCollection
+    with 'next' and 'previous' links.
+    """
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('type', 'FeatureCollection'),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('features', data['features']),
+        ]))
@@ -45,6 +45,7 @@ INSTALLED_APPS = [
     'django.contrib.gis',
     'rest_framework',
     'rest_framework_gis',
+    'django_filters',
     'Delivery',
     'NASBox',
     'Drive',
@@ -59,7 +60,8 @@ INSTALLED_APPS = [
     'Epoch',
     'DerivedProduct',
     'SensorData',
-    'Trajectory'
+    'Trajectory',
+    'eclipse'
     
 ]
 
@@ -149,3 +151,27 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Cache (responses of the reference endpoints, see eclipse.cache)
+# A file based cache is shared by the server processes, so writes handled by one
+# process invalidate the responses cached by the others.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('ECLIPSE_CACHE_DIR', str(BASE_DIR / '.cache')),
+        'TIMEOUT': 24 * 60 * 60,
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+}
+
+
+# Django REST framework
+# https://www.django-rest-framework.org/api-guide/settings/
+
+REST_FRAMEWORK = {
+    'DEFAULT_PAGINATION_CLASS': 'eclipse.pagination.EclipseCursorPagination',
+    'PAGE_SIZE': 1000,
+    'DEFAULT_FILTER_BACKENDS': ['eclipse.filters.StrictFilterBackend'],
+}